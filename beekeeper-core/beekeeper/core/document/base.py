@@ -1,10 +1,10 @@
 import uuid
 from abc import ABC, abstractmethod
-from hashlib import sha256
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 import numpy as np
-from pydantic.v1 import BaseModel, Field, validator
+from beekeeper.core.utils.hashing import HashAlgorithm, text_hash
+from pydantic.v1 import BaseModel, Field, PrivateAttr, validator
 
 
 class BaseDocument(ABC, BaseModel):
@@ -51,10 +51,20 @@ class BaseDocument(ABC, BaseModel):
 
 
 class Document(BaseDocument):
-    """Generic interface for data document."""
+    """
+    Generic interface for data document.
+
+    The document hash is cached and only recomputed when `text` changes. The hash
+    algorithm is shared by all documents through `Document.hash_algorithm` and must stay
+    the same between ingestions for de-duplication to match stored hashes.
+    """
+
+    hash_algorithm: ClassVar[HashAlgorithm] = "sha256"
 
     text: str = Field(default="", description="Text content of the document.")
 
+    _hash_cache: Optional[Tuple[str, str, str]] = PrivateAttr(default=None)
+
     @classmethod
     def class_name(cls) -> str:
         return "Document"
@@ -66,7 +76,16 @@ class Document(BaseDocument):
     @property
     def hash(self) -> str:
         """Get document hash."""
-        return str(sha256(str(self.text).encode("utf-8", "surrogatepass")).hexdigest())
+        text = self.text
+        algorithm = self.hash_algorithm
+        cache = self._hash_cache
+
+        # Cache is keyed by the `text` object itself, so any reassignment invalidates it
+        if cache is None or cache[0] is not text or cache[1] != algorithm:
+            cache = (text, algorithm, text_hash(str(text), algorithm))
+            self._hash_cache = cache
+
+        return cache[2]
 
 
 class DocumentWithScore(BaseModel):
@@ -1,7 +1,9 @@
 from beekeeper.core.embeddings.base import BaseEmbedding, Embedding, SimilarityMode
+from beekeeper.core.embeddings.cached import CachedEmbedding
 
 __all__ = [
     "BaseEmbedding",
+    "CachedEmbedding",
     "Embedding",
     "SimilarityMode",
 ]
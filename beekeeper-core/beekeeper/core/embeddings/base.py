@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import List
@@ -49,10 +50,36 @@ class BaseEmbedding(TransformerComponent, ABC):
     def get_texts_embedding(self, texts: List[str]) -> List[Embedding]:
         """Get text embeddings."""
 
+    def get_texts_embedding_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Get text embeddings as a contiguous float32 matrix, one row per text.
+
+        Holding rows of a single matrix avoids materializing each vector as a list of
+        Python floats. Models that compute embeddings as arrays should override this.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        return np.asarray(self.get_texts_embedding(texts), dtype=np.float32)
+
     @abstractmethod
     def get_documents_embedding(self, documents: List[Document]) -> List[Document]:
         """Get documents embeddings."""
 
+    async def aget_text_embedding(self, query: str) -> Embedding:
+        """Asynchronously get query embedding. Defaults to running `get_text_embedding` in a thread."""
+        return await asyncio.to_thread(self.get_text_embedding, query)
+
+    async def aget_texts_embedding(self, texts: List[str]) -> List[Embedding]:
+        """Asynchronously get text embeddings. Defaults to running `get_texts_embedding` in a thread."""
+        return await asyncio.to_thread(self.get_texts_embedding, texts)
+
+    async def aget_documents_embedding(
+        self, documents: List[Document]
+    ) -> List[Document]:
+        """Asynchronously get documents embeddings. Defaults to running `get_documents_embedding` in a thread."""
+        return await asyncio.to_thread(self.get_documents_embedding, documents)
+
     @staticmethod
     def similarity(
         embedding1: Embedding,
@@ -0,0 +1,190 @@
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+from beekeeper.core.document import Document
+from beekeeper.core.embeddings.base import BaseEmbedding, Embedding
+from beekeeper.core.utils.hashing import text_hash
+
+# Maximum number of host parameters per SQLite statement on older SQLite builds.
+_SQLITE_MAX_VARIABLES = 900
+
+
+class CachedEmbedding(BaseEmbedding):
+    """
+    Wraps an embedding model with a persistent, content-addressed cache of vectors.
+
+    Vectors are keyed by (model name, text hash) and stored as float32 in a local SQLite
+    file. Vectors are returned as stored, so a text gets the same float32-rounded vector
+    whether it was a cache hit or a miss. Only cache misses are sent to the underlying model, in a single batched call.
+    When `max_entries` is set, the least recently used vectors are evicted.
+
+    Args:
+        embed_model (BaseEmbedding): Embedding model used to compute cache misses.
+        path (str, optional): Path to the SQLite cache file. Defaults to `:memory:` (non-persistent).
+        max_entries (int, optional): Maximum number of cached vectors. Defaults to `None` (unbounded).
+        model_name (str, optional): Model name used in cache keys. Defaults to `embed_model.model_name`.
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.embeddings import CachedEmbedding
+            from beekeeper.embeddings.huggingface import HuggingFaceEmbedding
+
+            embedding = CachedEmbedding(
+                embed_model=HuggingFaceEmbedding(),
+                path="beekeeper-embeddings.db",
+            )
+    """
+
+    def __init__(
+        self,
+        embed_model: BaseEmbedding,
+        path: str = ":memory:",
+        max_entries: Optional[int] = None,
+        model_name: Optional[str] = None,
+    ) -> None:
+        self.embed_model = embed_model
+        self.path = path
+        self.max_entries = max_entries
+        self.model_name = model_name or getattr(
+            embed_model, "model_name", embed_model.class_name()
+        )
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT, hash TEXT, vector BLOB, last_used INTEGER, "
+                "PRIMARY KEY (model, hash))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+            )
+            self._clock = self._conn.execute(
+                "SELECT COALESCE(MAX(last_used), 0) FROM embeddings"
+            ).fetchone()[0]
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def _get_cached(self, hashes: List[str]) -> Dict[str, Embedding]:
+        cached = {}
+        self._clock += 1
+
+        for i in range(0, len(hashes), _SQLITE_MAX_VARIABLES):
+            batch = hashes[i : i + _SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(batch))
+
+            rows = self._conn.execute(
+                f"SELECT hash, vector FROM embeddings WHERE model = ? AND hash IN ({placeholders})",
+                [self.model_name, *batch],
+            ).fetchall()
+            self._conn.execute(
+                f"UPDATE embeddings SET last_used = ? WHERE model = ? AND hash IN ({placeholders})",
+                [self._clock, self.model_name, *batch],
+            )
+
+            for hash_, vector in rows:
+                cached[hash_] = np.frombuffer(vector, dtype=np.float32).tolist()
+
+        return cached
+
+    def _set_cached(self, embeddings: Dict[str, np.ndarray]) -> None:
+        self._clock += 1
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (model, hash, vector, last_used) VALUES (?, ?, ?, ?)",
+            [
+                (
+                    self.model_name,
+                    hash_,
+                    embedding.tobytes(),
+                    self._clock,
+                )
+                for hash_, embedding in embeddings.items()
+            ],
+        )
+
+        if self.max_entries is not None:
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE rowid IN ("
+                "SELECT rowid FROM embeddings ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def get_text_embedding(self, query: str) -> Embedding:
+        """
+        Compute embedding for a text, using the cache when possible.
+
+        Args:
+            query (str): Input query to compute the embedding.
+        """
+        return self.get_texts_embedding([query])[0]
+
+    def get_texts_embedding(self, texts: List[str]) -> List[Embedding]:
+        """
+        Compute embeddings for a list of texts, sending only cache misses to the model.
+
+        Args:
+            texts (List[str]): A list of input strings for which to compute embeddings.
+        """
+        hashes = [text_hash(text) for text in texts]
+        unique_texts = dict(zip(hashes, texts))
+
+        with self._lock, self._conn:
+            embeddings = self._get_cached(list(unique_texts))
+
+        missing = {
+            hash_: text
+            for hash_, text in unique_texts.items()
+            if hash_ not in embeddings
+        }
+        self.misses += len(missing)
+        self.hits += len(unique_texts) - len(missing)
+
+        if missing:
+            missing_embeddings = {
+                hash_: np.asarray(embedding, dtype=np.float32)
+                for hash_, embedding in zip(
+                    missing,
+                    self.embed_model.get_texts_embedding(list(missing.values())),
+                )
+            }
+            embeddings.update(
+                (hash_, embedding.tolist())
+                for hash_, embedding in missing_embeddings.items()
+            )
+
+            with self._lock, self._conn:
+                self._set_cached(missing_embeddings)
+
+        return [embeddings[hash_] for hash_ in hashes]
+
+    def get_documents_embedding(self, documents: List[Document]) -> List[Document]:
+        """
+        Compute embeddings for a list of documents, using the cache when possible.
+
+        Args:
+            documents (List[Document]): List of documents to compute embeddings.
+        """
+        texts = [document.get_content() for document in documents]
+        embeddings = self.get_texts_embedding(texts)
+
+        for document, embedding in zip(documents, embeddings):
+            document.embedding = embedding
+
+        return documents
+
+    def close(self) -> None:
+        """Close the cache file."""
+        self._conn.close()
@@ -1,3 +1,12 @@
+from beekeeper.core.flows.hash_index import HashIndex
+from beekeeper.core.flows.hash_manifest import HashManifest
 from beekeeper.core.flows.ingestion_flow import IngestionFlow
+from beekeeper.core.flows.types import IngestionBatchStats, StageStats
 
-__all__ = ["IngestionFlow"]
+__all__ = [
+    "HashIndex",
+    "HashManifest",
+    "IngestionBatchStats",
+    "IngestionFlow",
+    "StageStats",
+]
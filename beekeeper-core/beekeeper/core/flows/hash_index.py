@@ -0,0 +1,84 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+from beekeeper.core.vector_stores import BaseVectorStore
+
+
+class HashIndex:
+    """
+    In-memory index of stored document hashes used for de-duplication.
+
+    Each stored document is keyed by its de-duplication hash: the parent `ref_doc_hash`
+    when `use_ref_hash` is enabled and available, otherwise the document own hash.
+    Lookups and stale detection are constant time per hash.
+
+    Args:
+        ids (List[str], optional): IDs of the stored documents.
+        hashes (List[str], optional): Hashes of the stored documents.
+        ref_hashes (List[str], optional): Parent `ref_doc_hash` of the stored documents.
+        use_ref_hash (bool): Whether to key documents by their parent hash. Defaults to `True`.
+    """
+
+    def __init__(
+        self,
+        ids: Optional[List[str]] = None,
+        hashes: Optional[List[str]] = None,
+        ref_hashes: Optional[List[str]] = None,
+        use_ref_hash: bool = True,
+    ) -> None:
+        self.use_ref_hash = use_ref_hash
+        self._hash_by_id: Dict[str, Optional[str]] = {}
+        self._hash_counts: Dict[Optional[str], int] = {}
+
+        ids = ids or []
+        hashes = hashes or [None] * len(ids)
+        ref_hashes = ref_hashes or [None] * len(ids)
+
+        for id_, hash_, ref_hash in zip(ids, hashes, ref_hashes):
+            self.add(id_, hash_, ref_hash)
+
+    @classmethod
+    def from_vector_store(
+        cls, vector_store: BaseVectorStore, use_ref_hash: bool = True
+    ) -> "HashIndex":
+        """Build a hash index from all documents hashes in a vector store."""
+        ids, hashes, ref_hashes = vector_store.get_all_document_hashes()
+
+        return cls(ids, hashes, ref_hashes, use_ref_hash=use_ref_hash)
+
+    def __len__(self) -> int:
+        return len(self._hash_by_id)
+
+    def __contains__(self, hash_: str) -> bool:
+        return hash_ in self._hash_counts
+
+    def add(
+        self, id_: str, hash_: Optional[str], ref_hash: Optional[str] = None
+    ) -> None:
+        """Add or replace a stored document in the index."""
+        if self.use_ref_hash and ref_hash is not None:
+            hash_ = ref_hash
+
+        if id_ in self._hash_by_id:
+            self.remove([id_])
+
+        self._hash_by_id[id_] = hash_
+        self._hash_counts[hash_] = self._hash_counts.get(hash_, 0) + 1
+
+    def remove(self, ids: Iterable[str]) -> None:
+        """Remove stored documents from the index."""
+        for id_ in ids:
+            if id_ not in self._hash_by_id:
+                continue
+
+            hash_ = self._hash_by_id.pop(id_)
+            self._hash_counts[hash_] -= 1
+            if self._hash_counts[hash_] == 0:
+                del self._hash_counts[hash_]
+
+    def stale_ids(self, current_hashes: Set[str]) -> List[str]:
+        """Get IDs of the stored documents whose hash is not in `current_hashes`."""
+        return [
+            id_
+            for id_, hash_ in self._hash_by_id.items()
+            if hash_ not in current_hashes
+        ]
@@ -0,0 +1,93 @@
+import sqlite3
+import threading
+from typing import List, Tuple
+
+from beekeeper.core.document import Document
+from beekeeper.core.vector_stores import BaseVectorStore
+
+
+class HashManifest:
+    """
+    Persistent manifest of the documents hashes stored in a vector store.
+
+    Keeps the `id`, `hash` and `ref_doc_hash` of every stored document in a local SQLite
+    file, so incremental ingestion flows can read existing hashes without scanning the
+    whole vector store. The vector store is only consulted to reconcile the manifest.
+
+    Args:
+        path (str): Path to the SQLite manifest file. Use `":memory:"` for a non-persistent manifest.
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.flows import HashManifest, IngestionFlow
+
+            ingestion_flow = IngestionFlow(
+                transformers=[...],
+                vector_store=vector_store,
+                hash_manifest=HashManifest("beekeeper-manifest.db"),
+            )
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "id TEXT PRIMARY KEY, hash TEXT, ref_doc_hash TEXT)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def add_documents(self, documents: List[Document]) -> None:
+        """Record documents added to the vector store."""
+        rows = [
+            (doc.id_, doc.hash, doc.get_metadata().get("ref_doc_hash"))
+            for doc in documents
+        ]
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO documents (id, hash, ref_doc_hash) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def delete_documents(self, ids: List[str]) -> None:
+        """Remove documents deleted from the vector store."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM documents WHERE id = ?", [(id_,) for id_ in ids]
+            )
+
+    def get_all_document_hashes(self) -> Tuple[List[str], List[str], List[str]]:
+        """Get all ids, hashes and ref hashes recorded in the manifest."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, hash, ref_doc_hash FROM documents ORDER BY rowid"
+            ).fetchall()
+
+        if not rows:
+            return [], [], []
+
+        ids, hashes, ref_hashes = zip(*rows)
+        return list(ids), list(hashes), list(ref_hashes)
+
+    def reconcile(self, vector_store: BaseVectorStore) -> None:
+        """Replace the manifest content with the hashes currently in the vector store."""
+        ids, hashes, ref_hashes = vector_store.get_all_document_hashes()
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM documents")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO documents (id, hash, ref_doc_hash) VALUES (?, ?, ?)",
+                zip(ids, hashes, ref_hashes),
+            )
+
+    def close(self) -> None:
+        """Close the manifest file."""
+        self._conn.close()
@@ -1,7 +1,13 @@
+import time
 from enum import Enum
-from typing import List, Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Set
 
 from beekeeper.core.document import Document
+from beekeeper.core.flows.hash_index import HashIndex
+from beekeeper.core.flows.hash_manifest import HashManifest
+from beekeeper.core.flows.pipeline import run_pipeline
+from beekeeper.core.flows.types import IngestionBatchStats, StageStats
 from beekeeper.core.readers import BaseReader
 from beekeeper.core.schema import TransformerComponent
 from beekeeper.core.vector_stores import BaseVectorStore
@@ -30,6 +36,8 @@ class IngestionFlow:
             Defaults to `False`.
         readers (BaseReader, optional): List of readers for loading or fetching documents.
         vector_store (BaseVectorStore, optional): Vector store for saving processed documents
+        hash_manifest (HashManifest, optional): Local manifest of the stored documents hashes. When set,
+            de-duplication reads existing hashes from the manifest instead of scanning the vector store.
 
     Example:
         .. code-block:: python
@@ -53,12 +61,14 @@ class IngestionFlow:
         post_transformer: bool = False,
         readers: Optional[List[BaseReader]] = None,
         vector_store: Optional[BaseVectorStore] = None,
+        hash_manifest: Optional[HashManifest] = None,
     ) -> None:
         self.doc_strategy = doc_strategy
         self.post_transformer = post_transformer
         self.transformers = transformers
         self.readers = readers
         self.vector_store = vector_store
+        self.hash_manifest = hash_manifest
 
     def _read_documents(self, documents: Optional[List[Document]]):
         input_documents = []
@@ -72,50 +82,104 @@ class IngestionFlow:
 
         return input_documents
 
-    def _handle_duplicates(self, documents) -> List[Document]:
-        ids, existing_hashes, existing_ref_hashes = (
-            self.vector_store.get_all_document_hashes()
+    def _iter_documents(
+        self, documents: Optional[Iterable[Document]]
+    ) -> Iterator[Document]:
+        if documents is not None:
+            yield from documents
+
+        if self.readers is not None:
+            for reader in self.readers:
+                yield from reader.lazy_load()
+
+    def _iter_batches(
+        self, documents: Optional[Iterable[Document]], batch_size: int
+    ) -> Iterator[List[Document]]:
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be greater than 0.")
+
+        input_documents = self._iter_documents(documents)
+
+        while batch := list(islice(input_documents, batch_size)):
+            yield batch
+
+    def _get_hash_index(self) -> HashIndex:
+        # Use own document hash (chunks level) for de-duplication when `post_transformer`,
+        # otherwise use parent document hash `ref_doc_hash`, falling back to own hash.
+        if self.hash_manifest is None:
+            return HashIndex.from_vector_store(
+                self.vector_store, use_ref_hash=not self.post_transformer
+            )
+
+        if len(self.hash_manifest) == 0:
+            # New manifest, initialize it from the vector store
+            self.hash_manifest.reconcile(self.vector_store)
+
+        ids, hashes, ref_hashes = self.hash_manifest.get_all_document_hashes()
+        return HashIndex(
+            ids, hashes, ref_hashes, use_ref_hash=not self.post_transformer
         )
 
-        if self.post_transformer:
-            # Use own document hash (chunks level) for de-duplication
-            hashes_fallback = existing_hashes
-        else:
-            # Use parent document hash `ref_doc_hash`
-            # Fallback to document own hash if `ref_doc_hash` (parent level) is missing for de-duplication
-            hashes_fallback = [
-                existing_ref_hashes[i]
-                if existing_ref_hashes[i] is not None
-                else existing_hashes[i]
-                for i in range(len(existing_ref_hashes))
-            ]
-
-        current_hashes = []
-        current_unique_hashes = []
+    def _add_documents(self, documents: List[Document]) -> List[str]:
+        ids = self.vector_store.add_documents(documents)
+
+        if self.hash_manifest is not None:
+            self.hash_manifest.add_documents(documents)
+
+        return ids
+
+    def _delete_documents(self, ids: List[str]) -> None:
+        self.vector_store.delete_documents(ids)
+
+        if self.hash_manifest is not None:
+            self.hash_manifest.delete_documents(ids)
+
+    def _filter_duplicates(
+        self,
+        documents: List[Document],
+        hash_index: HashIndex,
+        current_hashes: Set[str],
+        current_unique_hashes: Set[str],
+    ) -> List[Document]:
         dedup_documents_to_run = []
 
         for doc in documents:
-            current_hashes.append(doc.hash)
+            doc_hash = doc.hash
+            current_hashes.add(doc_hash)
 
             if (
-                doc.hash not in hashes_fallback
-                and doc.hash not in current_unique_hashes
+                doc_hash not in hash_index
+                and doc_hash not in current_unique_hashes
                 and doc.get_content() != ""
             ):
                 dedup_documents_to_run.append(doc)
-                current_unique_hashes.append(
-                    doc.hash,
+                current_unique_hashes.add(
+                    doc_hash,
                 )  # Prevent duplicating same document hash in same batch flow execution.
 
-        if self.doc_strategy == DocStrategy.DUPLICATE_AND_DELETE:
-            ids_to_remove = [
-                ids[i]
-                for i in range(len(hashes_fallback))
-                if hashes_fallback[i] not in current_hashes
-            ]
+        return dedup_documents_to_run
+
+    def _delete_stale_documents(
+        self,
+        hash_index: HashIndex,
+        current_hashes: Set[str],
+    ) -> None:
+        ids_to_remove = hash_index.stale_ids(current_hashes)
 
-            if self.vector_store is not None:
-                self.vector_store.delete_documents(ids_to_remove)
+        if self.vector_store is not None:
+            self._delete_documents(ids_to_remove)
+            hash_index.remove(ids_to_remove)
+
+    def _handle_duplicates(self, documents) -> List[Document]:
+        hash_index = self._get_hash_index()
+        current_hashes = set()
+
+        dedup_documents_to_run = self._filter_duplicates(
+            documents, hash_index, current_hashes, set()
+        )
+
+        if self.doc_strategy == DocStrategy.DUPLICATE_AND_DELETE:
+            self._delete_stale_documents(hash_index, current_hashes)
 
         return dedup_documents_to_run
 
@@ -173,6 +237,156 @@ class IngestionFlow:
                 documents_processed = self._handle_duplicates(documents_processed)
 
             if self.vector_store is not None and documents_processed:
-                self.vector_store.add_documents(documents_processed)
+                self._add_documents(documents_processed)
 
         return documents_processed
+
+    def run_stream(
+        self,
+        documents: Optional[Iterable[Document]] = None,
+        batch_size: int = 100,
+    ) -> Iterator[IngestionBatchStats]:
+        """
+        Run an ingestion flow in micro-batches.
+
+        Documents are pulled lazily from `documents` and readers, transformed and added to
+        the vector store one batch at a time, so memory is bounded by `batch_size` instead
+        of the whole corpus. With `DocStrategy.DUPLICATE_AND_DELETE`, stale documents are
+        deleted once the stream is exhausted.
+
+        Args:
+            documents: Iterable of documents to be transformed.
+            batch_size (int, optional): Number of input documents per batch. Defaults to `100`.
+
+        Yields:
+            IngestionBatchStats: Statistics of each processed batch.
+
+        Example:
+            .. code-block:: python
+
+                for stats in ingestion_flow.run_stream(documents, batch_size=50):
+                    print(stats.processed_documents)
+        """
+        dedup = (
+            self.vector_store is not None
+            and self.doc_strategy != DocStrategy.DEDUPLICATE_OFF
+        )
+
+        if dedup:
+            hash_index = self._get_hash_index()
+            current_hashes = set()
+            current_unique_hashes = set()
+
+        for batch_index, batch in enumerate(self._iter_batches(documents, batch_size)):
+            start_time = time.time()
+            documents_processed = []
+            added_ids = []
+
+            if dedup and not self.post_transformer:
+                documents_to_run = self._filter_duplicates(
+                    batch, hash_index, current_hashes, current_unique_hashes
+                )
+            else:
+                documents_to_run = batch
+
+            if documents_to_run:
+                documents_processed = self._run_transformers(
+                    documents_to_run,
+                    self.transformers,
+                )
+
+                if dedup and self.post_transformer:
+                    documents_processed = self._filter_duplicates(
+                        documents_processed,
+                        hash_index,
+                        current_hashes,
+                        current_unique_hashes,
+                    )
+
+                if self.vector_store is not None and documents_processed:
+                    added_ids = self._add_documents(documents_processed)
+
+            yield IngestionBatchStats(
+                batch=batch_index,
+                input_documents=len(batch),
+                processed_documents=len(documents_processed),
+                ids=added_ids or [],
+                processing_time=int((time.time() - start_time) * 1000),
+            )
+
+        if dedup and self.doc_strategy == DocStrategy.DUPLICATE_AND_DELETE:
+            self._delete_stale_documents(hash_index, current_hashes)
+
+    def run_pipelined(
+        self,
+        documents: Optional[Iterable[Document]] = None,
+        batch_size: int = 100,
+        queue_size: int = 4,
+    ) -> List[StageStats]:
+        """
+        Run an ingestion flow as concurrent pipeline stages.
+
+        Reading, each transformer and the vector store writer run in their own thread,
+        connected by bounded queues of document batches. While a batch is being embedded,
+        the next one is chunked and the previous one is written, so the total time
+        approaches the slowest stage instead of the sum of all stages. A full queue blocks
+        the upstream stage (backpressure), keeping memory bounded by `queue_size` batches.
+
+        Stages run in threads, which suits I/O-bound transformers and the vector store.
+        Wrap CPU-bound text chunkers in `ParallelChunker` to run them in worker processes.
+
+        Args:
+            documents: Iterable of documents to be transformed.
+            batch_size (int, optional): Number of input documents per batch. Defaults to `100`.
+            queue_size (int, optional): Maximum number of batches waiting between two stages.
+                Defaults to `4`.
+
+        Returns:
+            List[StageStats]: Throughput counters of each stage, in pipeline order.
+
+        Example:
+            .. code-block:: python
+
+                stages_stats = ingestion_flow.run_pipelined(documents, batch_size=50)
+        """
+        dedup = (
+            self.vector_store is not None
+            and self.doc_strategy != DocStrategy.DEDUPLICATE_OFF
+        )
+
+        if dedup:
+            hash_index = self._get_hash_index()
+            current_hashes = set()
+            current_unique_hashes = set()
+
+        def read_batches() -> Iterator[List[Document]]:
+            for batch in self._iter_batches(documents, batch_size):
+                if dedup and not self.post_transformer:
+                    batch = self._filter_duplicates(
+                        batch, hash_index, current_hashes, current_unique_hashes
+                    )
+                yield batch
+
+        def write_batch(batch: List[Document]) -> List[Document]:
+            if dedup and self.post_transformer:
+                batch = self._filter_duplicates(
+                    batch, hash_index, current_hashes, current_unique_hashes
+                )
+
+            if self.vector_store is not None and batch:
+                self._add_documents(batch)
+
+            return batch
+
+        stages = [
+            (type(transformer).__name__, transformer)
+            for transformer in self.transformers
+        ]
+        stages.append(("vector_store", write_batch))
+
+        stages_stats = run_pipeline(read_batches(), stages, queue_size=queue_size)
+
+        if dedup and self.doc_strategy == DocStrategy.DUPLICATE_AND_DELETE:
+            self._delete_stale_documents(hash_index, current_hashes)
+
+        return stages_stats
@@ -0,0 +1,163 @@
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from beekeeper.core.document import Document
+from beekeeper.core.flows.types import StageStats
+
+_END = object()
+
+
+class _Stage(threading.Thread, ABC):
+    """Pipeline stage running in its own thread, connected by bounded queues."""
+
+    def __init__(
+        self,
+        stats: StageStats,
+        stop_event: threading.Event,
+        input_queue: Optional[queue.Queue] = None,
+        output_queue: Optional[queue.Queue] = None,
+    ) -> None:
+        super().__init__(name=f"beekeeper-{stats.name}", daemon=True)
+        self.stats = stats
+        self.error: Optional[BaseException] = None
+        self._stop_event = stop_event
+        self._input_queue = input_queue
+        self._output_queue = output_queue
+
+    def _get(self):
+        start_time = time.time()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    return self._input_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return _END
+        finally:
+            self.stats.wait_time += int((time.time() - start_time) * 1000)
+
+    def _put(self, item) -> None:
+        start_time = time.time()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    self._output_queue.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+        finally:
+            self.stats.wait_time += int((time.time() - start_time) * 1000)
+
+    @abstractmethod
+    def _process(self) -> None:
+        """Consume the input queue (if any) and feed the output queue (if any)."""
+
+    def run(self) -> None:
+        try:
+            self._process()
+        except BaseException as e:
+            self.error = e
+            self._stop_event.set()
+        finally:
+            if self._output_queue is not None:
+                self._put(_END)
+
+
+class _SourceStage(_Stage):
+    def __init__(self, batches: Iterator[List[Document]], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._batches = batches
+
+    def _process(self) -> None:
+        while not self._stop_event.is_set():
+            start_time = time.time()
+            batch = next(self._batches, None)
+            self.stats.busy_time += int((time.time() - start_time) * 1000)
+
+            if batch is None:
+                return
+
+            self.stats.batches += 1
+            self.stats.output_documents += len(batch)
+            if batch:
+                self._put(batch)
+
+
+class _TransformStage(_Stage):
+    def __init__(
+        self, fn: Callable[[List[Document]], Optional[List[Document]]], **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+        self._fn = fn
+
+    def _process(self) -> None:
+        while (batch := self._get()) is not _END:
+            start_time = time.time()
+            output = self._fn(batch)
+            self.stats.busy_time += int((time.time() - start_time) * 1000)
+
+            self.stats.batches += 1
+            self.stats.input_documents += len(batch)
+
+            if self._output_queue is not None and output:
+                self.stats.output_documents += len(output)
+                self._put(output)
+
+
+def run_pipeline(
+    batches: Iterator[List[Document]],
+    stages: List[Tuple[str, Callable[[List[Document]], Optional[List[Document]]]]],
+    queue_size: int = 4,
+) -> List[StageStats]:
+    """
+    Run batches through a chain of stages, each one in its own thread.
+
+    Stages are connected by bounded queues of `queue_size` batches, so a slow stage
+    applies backpressure upstream instead of letting batches pile up in memory.
+    The last stage is a sink and its output is discarded.
+
+    Args:
+        batches (Iterator[List[Document]]): Source of document batches.
+        stages (List[Tuple[str, Callable]]): Named stage functions, applied in order.
+        queue_size (int, optional): Maximum number of batches waiting between two stages.
+
+    Returns:
+        List[StageStats]: Counters of the source and of each stage.
+    """
+    stop_event = threading.Event()
+    queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+
+    threads: List[_Stage] = [
+        _SourceStage(
+            batches,
+            stats=StageStats(name="source"),
+            stop_event=stop_event,
+            output_queue=queues[0],
+        )
+    ]
+
+    for i, (name, fn) in enumerate(stages):
+        threads.append(
+            _TransformStage(
+                fn,
+                stats=StageStats(name=name),
+                stop_event=stop_event,
+                input_queue=queues[i],
+                output_queue=queues[i + 1] if i + 1 < len(stages) else None,
+            )
+        )
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    for thread in threads:
+        if thread.error is not None:
+            raise thread.error
+
+    return [thread.stats for thread in threads]
@@ -0,0 +1,37 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class IngestionBatchStats(BaseModel):
+    """Statistics of a batch processed by a streaming ingestion flow."""
+
+    batch: int = Field(..., description="Index of the batch, starting at 0")
+    input_documents: int = Field(..., description="Number of documents read")
+    processed_documents: int = Field(
+        ..., description="Number of documents after transformers and de-duplication"
+    )
+    ids: List[str] = Field(
+        default_factory=list, description="IDs of the documents added to vector store"
+    )
+    processing_time: int = Field(..., description="Batch processing time (ms)")
+
+
+class StageStats(BaseModel):
+    """Throughput counters of a pipelined ingestion flow stage."""
+
+    name: str = Field(..., description="Name of the stage")
+    batches: int = Field(default=0, description="Number of batches processed")
+    input_documents: int = Field(default=0, description="Number of documents received")
+    output_documents: int = Field(default=0, description="Number of documents emitted")
+    busy_time: int = Field(default=0, description="Time spent processing batches (ms)")
+    wait_time: int = Field(
+        default=0, description="Time spent blocked on full or empty queues (ms)"
+    )
+
+    @property
+    def throughput(self) -> float:
+        """Documents processed per second of busy time."""
+        if self.busy_time == 0:
+            return 0.0
+        return self.input_documents / (self.busy_time / 1000)
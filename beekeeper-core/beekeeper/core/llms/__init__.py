@@ -1,4 +1,5 @@
 from beekeeper.core.llms.base import BaseLLM
+from beekeeper.core.llms.cache import BaseLLMCache, InMemoryLLMCache, SQLiteLLMCache
 from beekeeper.core.llms.types import (
     ChatMessage,
     ChatResponse,
@@ -7,5 +8,14 @@ from beekeeper.core.llms.types import (
 )
 
 __all__ = (
-    ["BaseLLM", "ChatMessage", "ChatResponse", "GenerateResponse", "MessageRole"],
+    [
+        "BaseLLM",
+        "BaseLLMCache",
+        "ChatMessage",
+        "ChatResponse",
+        "GenerateResponse",
+        "InMemoryLLMCache",
+        "MessageRole",
+        "SQLiteLLMCache",
+    ],
 )
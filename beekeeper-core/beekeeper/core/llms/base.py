@@ -1,6 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Type, Union
 
+from beekeeper.core.llms.cache import BaseLLMCache
 from beekeeper.core.llms.types import ChatMessage, ChatResponse, GenerateResponse
 from beekeeper.core.observers import BaseObserver
 from pydantic import BaseModel
@@ -11,6 +14,7 @@ class BaseLLM(ABC, BaseModel):
 
     model_config = {"arbitrary_types_allowed": True}
     callback_manager: Optional[BaseObserver] = None
+    cache: Optional[BaseLLMCache] = None
 
     @classmethod
     def class_name(cls) -> str:
@@ -20,6 +24,36 @@ class BaseLLM(ABC, BaseModel):
         """Convert chat messages to LLM message format."""
         return [message.model_dump() for message in messages]
 
+    def _get_cache_key(
+        self, all_kwargs: Dict[str, Any], **inputs: Any
+    ) -> Optional[str]:
+        """Return the response cache key for a request, or `None` if it must not be cached."""
+        if self.cache is None or not self.cache.is_cacheable(all_kwargs):
+            return None
+
+        return self.cache.make_key(all_kwargs, **inputs)
+
+    def _get_cached_response(
+        self,
+        cache_key: Optional[str],
+        response_cls: Type[Union[ChatResponse, GenerateResponse]],
+    ) -> Optional[Union[ChatResponse, GenerateResponse]]:
+        """
+        Return the cached response for a request, or `None` on a miss.
+        Hits are marked with `raw["cached"]`, so observers don't report them as model calls.
+        """
+        if not cache_key:
+            return None
+
+        cached = self.cache.lookup(cache_key)
+        if cached is None:
+            return None
+
+        response = response_cls.model_validate(cached)
+        response.raw = {**(response.raw or {}), "cached": True}
+
+        return response
+
     @abstractmethod
     def completion(self, prompt: str, **kwargs: Any) -> GenerateResponse:
         """Generates a completion for LLM."""
@@ -33,3 +67,102 @@ class BaseLLM(ABC, BaseModel):
         self, messages: List[ChatMessage], **kwargs: Any
     ) -> ChatResponse:
         """Generates a chat completion for LLM."""
+
+    async def acompletion(self, prompt: str, **kwargs: Any) -> GenerateResponse:
+        """Asynchronously generates a completion for LLM. Defaults to running `completion` in a thread."""
+        return await asyncio.to_thread(self.completion, prompt, **kwargs)
+
+    async def atext_completion(self, prompt: str, **kwargs: Any) -> str:
+        """Asynchronously generates a text completion for LLM. Defaults to running `text_completion` in a thread."""
+        return await asyncio.to_thread(self.text_completion, prompt, **kwargs)
+
+    async def achat_completion(
+        self, messages: List[ChatMessage], **kwargs: Any
+    ) -> ChatResponse:
+        """Asynchronously generates a chat completion for LLM. Defaults to running `chat_completion` in a thread."""
+        return await asyncio.to_thread(self.chat_completion, messages, **kwargs)
+
+    def batch_chat_completion(
+        self,
+        messages_list: List[List[ChatMessage]],
+        max_concurrency: int = 8,
+        **kwargs: Any,
+    ) -> List[Union[ChatResponse, Exception]]:
+        """
+        Generates chat completions for a batch of message lists, running up to `max_concurrency` requests concurrently.
+
+        Results are returned in the same order as `messages_list`. A failed request does not
+        interrupt the batch, its exception is returned in place of the response.
+
+        Args:
+            messages_list (List[List[ChatMessage]]): A list of chat message lists, one per completion.
+            max_concurrency (int, optional): Maximum number of concurrent requests. Defaults to ``8``.
+            **kwargs (Any): Additional keyword arguments to customize the LLM completion request.
+
+        Example:
+            .. code-block:: python
+
+                responses = llm.batch_chat_completion(
+                    [[ChatMessage(role="user", content=text)] for text in texts],
+                    max_concurrency=16,
+                )
+        """
+        if not messages_list:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_concurrency, len(messages_list)))
+        ) as executor:
+            futures = [
+                executor.submit(self.chat_completion, messages, **kwargs)
+                for messages in messages_list
+            ]
+
+        return [future.exception() or future.result() for future in futures]
+
+    async def abatch_chat_completion(
+        self,
+        messages_list: List[List[ChatMessage]],
+        max_concurrency: int = 8,
+        **kwargs: Any,
+    ) -> List[Union[ChatResponse, Exception]]:
+        """
+        Asynchronously generates chat completions for a batch of message lists, awaiting up to
+        `max_concurrency` `achat_completion` calls concurrently. Results are ordered as `messages_list`,
+        with exceptions returned in place.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _chat_completion(messages: List[ChatMessage]) -> ChatResponse:
+            async with semaphore:
+                return await self.achat_completion(messages, **kwargs)
+
+        return await asyncio.gather(
+            *(_chat_completion(messages) for messages in messages_list),
+            return_exceptions=True,
+        )
+
+    def stream_chat_completion(
+        self, messages: List[ChatMessage], **kwargs: Any
+    ) -> Iterator[ChatResponse]:
+        """
+        Generates a streamed chat completion for LLM.
+
+        Yields a `ChatResponse` per received delta, with the content generated so far in
+        `message` and the new content in `delta`. The last response carries `raw` with usage.
+        Defaults to a single response from `chat_completion`.
+        """
+        response = self.chat_completion(messages, **kwargs)
+        response.delta = response.message.content
+        yield response
+
+    async def astream_chat_completion(
+        self, messages: List[ChatMessage], **kwargs: Any
+    ) -> AsyncIterator[ChatResponse]:
+        """
+        Asynchronously generates a streamed chat completion for LLM.
+        Defaults to a single response from `achat_completion`.
+        """
+        response = await self.achat_completion(messages, **kwargs)
+        response.delta = response.message.content
+        yield response
@@ -0,0 +1,259 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Request arguments that never affect the generated response.
+_EXCLUDED_KEYS = {"api_key"}
+
+
+class BaseLLMCache(ABC):
+    """
+    An interface for LLM response caches.
+
+    Responses are keyed by the normalized request arguments (see `_get_all_kwargs` in LLMs)
+    plus the input messages or prompt. Sampled requests (`temperature > 0`) are not cached
+    unless `cache_sampled` is set, since they are not expected to be reproducible.
+
+    Responses served from the cache have `raw["cached"]` set, and are not reported to observers.
+
+    Args:
+        ttl (float, optional): Time-to-live of cached responses, in seconds. Defaults to `None` (no expiry).
+        cache_sampled (bool, optional): Whether to cache requests with `temperature > 0`. Defaults to `False`.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, cache_sampled: bool = False):
+        self.ttl = ttl
+        self.cache_sampled = cache_sampled
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "BaseLLMCache"
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for `key`, or `None` if missing or expired."""
+
+    @abstractmethod
+    def _set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store the response for `key`."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached responses."""
+
+    def is_cacheable(self, all_kwargs: Dict[str, Any]) -> bool:
+        """Whether a request with these arguments may be served from the cache."""
+        temperature = all_kwargs.get("temperature")
+
+        return self.cache_sampled or not temperature or temperature <= 0
+
+    def make_key(self, all_kwargs: Dict[str, Any], **inputs: Any) -> str:
+        """
+        Build a cache key from the request arguments and inputs.
+
+        Args:
+            all_kwargs (Dict[str, Any]): Request arguments, as returned by the LLM `_get_all_kwargs`.
+            **inputs (Any): Request inputs, such as `messages` or `prompt`.
+        """
+        request = {
+            key: value
+            for key, value in all_kwargs.items()
+            if key not in _EXCLUDED_KEYS and value is not None
+        }
+        payload = json.dumps(
+            {"request": request, **inputs},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached response for `key`, updating hit/miss counters.
+
+        Args:
+            key (str): Cache key, as returned by `make_key`.
+        """
+        value = self._get(key)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    def update(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key (str): Cache key, as returned by `make_key`.
+            value (Dict[str, Any]): The serialized response.
+        """
+        self._set(key, value)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class InMemoryLLMCache(BaseLLMCache):
+    """
+    An in-memory LLM response cache, evicting the least recently used responses.
+
+    Args:
+        max_size (int, optional): Maximum number of cached responses. Defaults to ``1024``.
+        ttl (float, optional): Time-to-live of cached responses, in seconds. Defaults to `None` (no expiry).
+        cache_sampled (bool, optional): Whether to cache requests with `temperature > 0`. Defaults to `False`.
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.llms import InMemoryLLMCache
+            from beekeeper.llms.litellm import LiteLLM
+
+            llm = LiteLLM(
+                model="watsonx/ibm/granite-13b-instruct-v2",
+                temperature=0,
+                cache=InMemoryLLMCache(max_size=512),
+            )
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+        cache_sampled: bool = False,
+    ):
+        super().__init__(ttl=ttl, cache_sampled=cache_sampled)
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "InMemoryLLMCache"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            created_at, value = entry
+            if self.ttl is not None and time.time() - created_at > self.ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteLLMCache(BaseLLMCache):
+    """
+    A persistent LLM response cache, stored in a local SQLite file.
+
+    Args:
+        path (str, optional): Path to the SQLite cache file. Defaults to `:memory:` (non-persistent).
+        ttl (float, optional): Time-to-live of cached responses, in seconds. Defaults to `None` (no expiry).
+        cache_sampled (bool, optional): Whether to cache requests with `temperature > 0`. Defaults to `False`.
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.llms import SQLiteLLMCache
+            from beekeeper.llms.litellm import LiteLLM
+
+            llm = LiteLLM(
+                model="watsonx/ibm/granite-13b-instruct-v2",
+                temperature=0,
+                cache=SQLiteLLMCache(path="beekeeper-llm.db", ttl=7 * 24 * 3600),
+            )
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl: Optional[float] = None,
+        cache_sampled: bool = False,
+    ):
+        super().__init__(ttl=ttl, cache_sampled=cache_sampled)
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT, created_at REAL)"
+            )
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "SQLiteLLMCache"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if self.ttl is not None and time.time() - created_at > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            return json.loads(value)
+
+    def _set(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=str), time.time()),
+            )
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the cache file."""
+        self._conn.close()
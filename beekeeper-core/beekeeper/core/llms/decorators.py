@@ -1,22 +1,135 @@
 import asyncio
-import threading
+import functools
+import inspect
 import time
-from logging import getLogger
-from typing import Callable
+from typing import Any, Callable
 
-from beekeeper.core.llms.types import ChatMessage
+from beekeeper.core.observers.dispatcher import get_observer_dispatcher
 from beekeeper.core.observers.types import PayloadRecord
 
-logger = getLogger(__name__)
+
+def _observe_chat(
+    callback_manager_fns: Callable,
+    args: tuple,
+    kwargs: dict,
+    llm_return_val: Any,
+    response_time: int,
+) -> None:
+    """Queue a chat completion payload for the observer on the shared dispatcher."""
+    # Cache hits did not call the model, they are not reported
+    if isinstance(llm_return_val.raw, dict) and llm_return_val.raw.get("cached"):
+        return
+
+    def observer_callback():
+        # Extract input messages
+        if len(args) > 0 and isinstance(args[0], list):
+            input_chat_messages = args[0]
+        elif "messages" in kwargs:
+            input_chat_messages = kwargs["messages"]
+        else:
+            raise ValueError("No messages provided in positional or keyword arguments")
+
+        # Get the user's latest message after each interaction to chat observability.
+        user_messages = [msg for msg in input_chat_messages if msg.role == "user"]
+        last_user_message = user_messages[-1].content if user_messages else None
+
+        # Get the system/instruct (first) message to chat observability.
+        system_messages = [msg for msg in input_chat_messages if msg.role == "system"]
+        system_message = system_messages[0].content if system_messages else None
+
+        return callback_manager_fns(
+            payload=PayloadRecord(
+                input_text=(system_message or "") + last_user_message,
+                generated_text=llm_return_val.message.content,
+                generated_token_count=llm_return_val.raw["usage"]["completion_tokens"],
+                input_token_count=llm_return_val.raw["usage"]["prompt_tokens"],
+                response_time=response_time,
+            )
+        )
+
+    get_observer_dispatcher().submit(observer_callback)
 
 
 def llm_chat_observer() -> Callable:
     """
     Decorator to wrap a method with llm handler logic.
     Looks for observability instances in `self.callback_manager`.
+    Supports sync and async methods, including streamed (generator) responses.
     """
 
     def decorator(f: Callable) -> Callable:
+        if inspect.isasyncgenfunction(f):
+
+            @functools.wraps(f)
+            async def async_generator_wrapper(self, *args, **kwargs):
+                callback_manager_fns = getattr(self, "callback_manager", None)
+                llm_return_val = None
+
+                start_time = time.time()
+                async for llm_return_val in f(self, *args, **kwargs):
+                    yield llm_return_val
+                response_time = int((time.time() - start_time) * 1000)
+
+                # Observe the final streamed response, once the stream completes
+                if callback_manager_fns and llm_return_val is not None:
+                    _observe_chat(
+                        callback_manager_fns,
+                        args,
+                        kwargs,
+                        llm_return_val,
+                        response_time,
+                    )
+
+            return async_generator_wrapper
+
+        if inspect.isgeneratorfunction(f):
+
+            @functools.wraps(f)
+            def generator_wrapper(self, *args, **kwargs):
+                callback_manager_fns = getattr(self, "callback_manager", None)
+                llm_return_val = None
+
+                start_time = time.time()
+                for llm_return_val in f(self, *args, **kwargs):
+                    yield llm_return_val
+                response_time = int((time.time() - start_time) * 1000)
+
+                # Observe the final streamed response, once the stream completes
+                if callback_manager_fns and llm_return_val is not None:
+                    _observe_chat(
+                        callback_manager_fns,
+                        args,
+                        kwargs,
+                        llm_return_val,
+                        response_time,
+                    )
+
+            return generator_wrapper
+
+        if asyncio.iscoroutinefunction(f):
+
+            @functools.wraps(f)
+            async def coroutine_wrapper(self, *args, **kwargs):
+                callback_manager_fns = getattr(self, "callback_manager", None)
+
+                start_time = time.time()
+                llm_return_val = await f(self, *args, **kwargs)
+                response_time = int((time.time() - start_time) * 1000)
+
+                if callback_manager_fns:
+                    _observe_chat(
+                        callback_manager_fns,
+                        args,
+                        kwargs,
+                        llm_return_val,
+                        response_time,
+                    )
+
+                return llm_return_val
+
+            return coroutine_wrapper
+
+        @functools.wraps(f)
         def async_wrapper(self, *args, **kwargs):
             callback_manager_fns = getattr(self, "callback_manager", None)
 
@@ -25,56 +138,9 @@ def llm_chat_observer() -> Callable:
             response_time = int((time.time() - start_time) * 1000)
 
             if callback_manager_fns:
-
-                def async_callback_thread():
-                    try:
-                        # Extract input messages
-                        if len(args) > 0 and isinstance(args[0], ChatMessage):
-                            input_chat_messages = args[0]
-                        elif "messages" in kwargs:
-                            input_chat_messages = kwargs["messages"]
-                        else:
-                            raise ValueError(
-                                "No messages provided in positional or keyword arguments"
-                            )
-
-                        # Get the user's latest message after each interaction to chat observability.
-                        user_messages = [
-                            msg for msg in input_chat_messages if msg.role == "user"
-                        ]
-                        last_user_message = (
-                            user_messages[-1].content if user_messages else None
-                        )
-
-                        # Get the system/instruct (first) message to chat observability.
-                        system_messages = [
-                            msg for msg in input_chat_messages if msg.role == "system"
-                        ]
-                        system_message = (
-                            system_messages[0].content if system_messages else None
-                        )
-
-                        callback = callback_manager_fns(
-                            payload=PayloadRecord(
-                                input_text=(system_message or "") + last_user_message,
-                                generated_text=llm_return_val.message.content,
-                                generated_token_count=llm_return_val.raw["usage"][
-                                    "completion_tokens"
-                                ],
-                                input_token_count=llm_return_val.raw["usage"][
-                                    "prompt_tokens"
-                                ],
-                                response_time=response_time,
-                            )
-                        )
-
-                        if asyncio.iscoroutine(callback):
-                            asyncio.run(callback)
-
-                    except Exception as e:
-                        logger.error(f"Observability callback error: {e}")
-
-                threading.Thread(target=async_callback_thread).start()
+                _observe_chat(
+                    callback_manager_fns, args, kwargs, llm_return_val, response_time
+                )
 
             return llm_return_val
 
@@ -31,3 +31,6 @@ class ChatResponse(BaseModel):
 
     message: ChatMessage
     raw: Optional[Any] = None
+    delta: Optional[str] = Field(
+        default=None, description="New content of a streamed response"
+    )
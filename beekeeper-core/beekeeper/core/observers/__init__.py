@@ -1,3 +1,16 @@
 from beekeeper.core.observers.base import BaseObserver, ModelObserver
+from beekeeper.core.observers.dispatcher import (
+    ObserverDispatcher,
+    get_observer_dispatcher,
+    set_observer_dispatcher,
+)
 
-__all__ = (["BaseObserver", "ModelObserver"],)
+__all__ = (
+    [
+        "BaseObserver",
+        "ModelObserver",
+        "ObserverDispatcher",
+        "get_observer_dispatcher",
+        "set_observer_dispatcher",
+    ],
+)
@@ -0,0 +1,240 @@
+import asyncio
+import atexit
+import queue
+import threading
+import time
+from logging import getLogger
+from typing import Any, Callable, List, Literal, Optional
+
+logger = getLogger(__name__)
+
+# Worker shutdown signal.
+_STOP = object()
+
+
+class ObserverDispatcher:
+    """
+    Runs observer callbacks on a bounded queue served by a fixed pool of background workers.
+
+    Each worker owns a persistent event loop, used to run callbacks returning a coroutine.
+    When the queue is full, new callbacks are either dropped (`policy="drop"`) or the caller
+    waits for a free slot (`policy="block"`). Pending callbacks are flushed at interpreter exit.
+
+    Args:
+        max_queue_size (int, optional): Maximum number of pending callbacks. Defaults to ``1000``.
+        workers (int, optional): Number of worker threads. Defaults to ``2``.
+        policy (str, optional): Either ``"drop"`` or ``"block"``, what to do when the queue is full.
+            Defaults to ``"drop"``.
+        block_timeout (float, optional): With the ``"block"`` policy, maximum time to wait for a free slot
+            before dropping the callback. Defaults to `None` (wait indefinitely).
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.observers import (
+                ObserverDispatcher,
+                set_observer_dispatcher,
+            )
+
+            set_observer_dispatcher(
+                ObserverDispatcher(max_queue_size=10000, policy="block")
+            )
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        workers: int = 2,
+        policy: Literal["drop", "block"] = "drop",
+        block_timeout: Optional[float] = None,
+    ) -> None:
+        if policy not in ("drop", "block"):
+            raise ValueError("policy must be either 'drop' or 'block'.")
+
+        self.max_queue_size = max_queue_size
+        self.workers = max(1, workers)
+        self.policy = policy
+        self.block_timeout = block_timeout
+
+        self.dropped = 0
+        self.processed = 0
+        self.errors = 0
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "ObserverDispatcher"
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callbacks waiting to be run."""
+        return self._queue.qsize()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker, name=f"beekeeper-observer-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _worker(self) -> None:
+        loop = asyncio.new_event_loop()
+
+        try:
+            while True:
+                callback = self._queue.get()
+
+                try:
+                    if callback is _STOP:
+                        return
+
+                    result = callback()
+                    if asyncio.iscoroutine(result):
+                        loop.run_until_complete(result)
+
+                    with self._lock:
+                        self.processed += 1
+
+                except Exception as e:
+                    with self._lock:
+                        self.errors += 1
+                    logger.error(f"Observability callback error: {e}")
+
+                finally:
+                    self._queue.task_done()
+        finally:
+            loop.close()
+
+    def submit(self, callback: Callable[[], Any]) -> bool:
+        """
+        Schedule a callback to run in the background.
+
+        Args:
+            callback (Callable[[], Any]): A callable taking no arguments. If it returns a coroutine,
+                the coroutine is run on the worker event loop.
+
+        Returns:
+            bool: `True` if the callback was queued, `False` if it was dropped.
+        """
+        if self._closed:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+        self._start()
+
+        try:
+            if self.policy == "block":
+                self._queue.put(callback, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(callback)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                first_drop = self.dropped == 1
+
+            if first_drop:
+                logger.warning(
+                    "Observability queue is full, dropping payloads. "
+                    "Further drops are counted in `dropped`."
+                )
+            return False
+
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for all queued callbacks to complete.
+
+        Args:
+            timeout (float, optional): Maximum time to wait, in seconds. Defaults to `None` (wait indefinitely).
+
+        Returns:
+            bool: `True` if the queue was drained, `False` on timeout.
+        """
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(
+                lambda: not self._queue.unfinished_tasks, timeout
+            )
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop accepting callbacks, flush the queue and stop the workers. Calling it again once
+        the workers are stopped returns immediately.
+
+        Args:
+            timeout (float, optional): Maximum time to wait for pending callbacks and for the
+                workers to stop, in seconds. Defaults to `None` (wait indefinitely).
+
+        Returns:
+            bool: `True` if all pending callbacks completed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+        self._closed = True
+        flushed = self.flush(timeout)
+
+        if flushed:
+            with self._lock:
+                threads, self._threads = self._threads, []
+
+            try:
+                for _ in threads:
+                    self._queue.put(_STOP, timeout=remaining())
+            except queue.Full:
+                # Workers still running are daemon threads, they don't block exit
+                pass
+
+            for thread in threads:
+                thread.join(remaining())
+
+        return flushed
+
+
+_dispatcher: Optional[ObserverDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_observer_dispatcher() -> ObserverDispatcher:
+    """Return the shared observer dispatcher, creating a default one on first use."""
+    global _dispatcher
+
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = ObserverDispatcher()
+
+        return _dispatcher
+
+
+def set_observer_dispatcher(dispatcher: ObserverDispatcher) -> None:
+    """
+    Replace the shared observer dispatcher. The previous dispatcher is flushed and shut down.
+
+    Args:
+        dispatcher (ObserverDispatcher): The dispatcher used for observer callbacks.
+    """
+    global _dispatcher
+
+    with _dispatcher_lock:
+        previous, _dispatcher = _dispatcher, dispatcher
+
+    if previous is not None and previous is not dispatcher:
+        previous.shutdown()
+
+
+@atexit.register
+def _shutdown_observer_dispatcher() -> None:
+    if _dispatcher is not None:
+        _dispatcher.shutdown(timeout=5.0)
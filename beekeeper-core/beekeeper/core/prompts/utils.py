@@ -1,4 +1,6 @@
 import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Pattern
 
 
 class SafeFormatter(dict):
@@ -8,37 +10,72 @@ class SafeFormatter(dict):
         return "{" + key + "}"
 
 
-def extract_template_vars(template_str: str, input_text: str):
-    """
-    Extracts variables values from template string into a dictionary.
-    Support fuzzy changes between `template_str` and `input_text`.
-    """
+class _TemplateMatcher(NamedTuple):
+    template_vars: List[str]
+    literals: List[Pattern]
+
+
+def _literal_pattern(part: str) -> str:
+    # Escape and normalize whitespace
+    escaped = re.escape(part)
+    # Replace escaped whitespace characters (tabs, newlines) with \s+
+    return re.sub(r"\\[ \t\r\n]+", r"\\s*", escaped)
+
+
+@lru_cache(maxsize=128)
+def _compile_template(template_str: str) -> _TemplateMatcher:
+    """Compile the matchers of a template string, once per template."""
     parts = re.split(r"({.*?})", template_str)
 
-    regex_pattern = ""
     template_vars = []
+    # Literal segments around the variables, `literals[i]` precedes `template_vars[i]`
+    literals = [""]
 
     for part in parts:
         if part.startswith("{") and part.endswith("}"):
             template_var = part[1:-1].strip()
             template_vars.append(template_var)
-            regex_pattern += r"(.*?)"  # non-greedy capture group
+            literals.append("")
         else:
-            # Escape and normalize whitespace
-            escaped = re.escape(part)
-            # Replace escaped whitespace characters (tabs, newlines) with \s+
-            escaped = re.sub(r"\\[ \t\r\n]+", r"\\s*", escaped)
-            regex_pattern += escaped
+            literals[-1] += _literal_pattern(part)
+
+    # Add trailing optional whitespace, the last literal must end the text
+    literals[-1] += r"\s*\Z"
+
+    # Captured values are stripped, so leading whitespace of the literals following a
+    # variable can be left to the variable. This lets `re` search for a literal prefix.
+    literals[1:] = [re.sub(r"^(\\s\*)+", "", literal) for literal in literals[1:]]
 
-    # Add trailing optional whitespace
-    regex_pattern += r"\s*"
+    return _TemplateMatcher(
+        template_vars=template_vars,
+        literals=[re.compile(literal) for literal in literals],
+    )
 
-    # Compile regex with DOTALL to match newlines in captured groups
-    pattern = re.compile(regex_pattern, re.DOTALL)
-    match = pattern.fullmatch(input_text)
 
+def extract_template_vars(template_str: str, input_text: str) -> Dict[str, str]:
+    """
+    Extracts variables values from template string into a dictionary.
+    Support fuzzy changes between `template_str` and `input_text`.
+    """
+    matcher = _compile_template(template_str)
+
+    if not matcher.template_vars:
+        return {}
+
+    # Locate each literal segment left to right: each variable captures the text up to the
+    # first occurrence of the next literal. This is the match a non-greedy `(.*?)` regex
+    # finds first, without backtracking over long inputs such as RAG contexts.
+    match = matcher.literals[0].match(input_text)
     if not match:
         return {}
 
-    groups = match.groups()
-    return dict(zip(template_vars, [g.strip() for g in groups]))
+    groups = []
+    for literal in matcher.literals[1:]:
+        start = match.end()
+        match = literal.search(input_text, start)
+        if not match:
+            return {}
+
+        groups.append(input_text[start : match.start()])
+
+    return dict(zip(matcher.template_vars, [g.strip() for g in groups]))
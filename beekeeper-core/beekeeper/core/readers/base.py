@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 
 from beekeeper.core.document import Document
 from pydantic.v1 import BaseModel
@@ -19,5 +19,6 @@ class BaseReader(ABC, BaseModel):
     def load(self) -> List[Document]:
         return self.load_data()
 
-    def lazy_load(self) -> List[Document]:
-        return self.load_data()
+    def lazy_load(self, *args, **kwargs) -> Iterator[Document]:
+        """Loads data one document at a time. Readers that can stream their source override it."""
+        yield from self.load_data(*args, **kwargs)
@@ -1,7 +1,7 @@
 import glob
 import os
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import Iterator, List, Optional, Type
 
 from beekeeper.core.document import Document
 from beekeeper.core.readers import BaseReader
@@ -30,6 +30,8 @@ class DirectoryReader(BaseReader):
     allowing recursive directory traversal.
 
     Args:
+        input_dir (str, optional): Directory path from which to load the documents, used when
+            `load_data` and `lazy_load` are called without one (e.g. as an `IngestionFlow` reader).
         required_exts (List[str], optional): List of file extensions to filter by.
             Only files with these extensions will be loaded. Defaults to `None` (no filtering).
         recursive (bool, optional): Whether to recursively search subdirectories for files.
@@ -43,30 +45,47 @@ class DirectoryReader(BaseReader):
             directory_reader = DirectoryReader()
     """
 
+    input_dir: Optional[str] = None
     required_exts: List[str] = [".pdf", ".docx", ".html"]
     recursive: Optional[bool] = False
     file_loader: Optional[dict[str, Type[BaseReader]]] = None
 
-    def load_data(self, input_dir: str) -> List[Document]:
+    def load_data(self, input_dir: Optional[str] = None) -> List[Document]:
         """
         Loads data from the specified directory.
 
         Args:
-            input_dir (str): Directory path from which to load the documents.
+            input_dir (str, optional): Directory path from which to load the documents.
+                Defaults to `input_dir` set on the reader.
 
         Returns:
             List[Document]: A list of documents loaded from the directory.
         """
-        if not os.path.isdir(input_dir):
+        return list(self.lazy_load(input_dir))
+
+    def lazy_load(self, input_dir: Optional[str] = None) -> Iterator[Document]:
+        """
+        Loads data from the specified directory one file at a time, so only the documents of
+        the current file are held in memory.
+
+        Args:
+            input_dir (str, optional): Directory path from which to load the documents.
+                Defaults to `input_dir` set on the reader.
+
+        Yields:
+            Document: Documents loaded from the directory.
+        """
+        input_dir = input_dir if input_dir is not None else self.input_dir
+
+        if input_dir is None or not os.path.isdir(input_dir):
             raise ValueError(f"`{input_dir}` is not a valid directory.")
 
         if self.file_loader is None:
             self.file_loader = _loading_default_supported_readers()
 
         input_dir = Path(input_dir)
-        documents = []
 
-        pattern_prefix = "**/*" if self.recursive else ""
+        pattern_prefix = "**/*" if self.recursive else "*"
 
         for extension in self.required_exts:
             files = glob.glob(
@@ -80,11 +99,10 @@ class DirectoryReader(BaseReader):
                     try:
                         # TODO add `file_reader_kwargs`
                         doc = loader_cls().load_data(file_dir)
-                        documents.extend(doc)
                     except Exception as e:
                         raise f"Error reading {file_dir}: {e}"
+
+                    yield from doc
                 else:
                     # TODO add `unstructured file` support
                     raise f"Unsupported file type: {extension}"
-
-        return documents
@@ -1,10 +1,12 @@
 from beekeeper.core.text_chunkers.base import BaseTextChunker
+from beekeeper.core.text_chunkers.parallel import ParallelChunker
 from beekeeper.core.text_chunkers.semantic import SemanticChunker
 from beekeeper.core.text_chunkers.sentence import SentenceChunker
 from beekeeper.core.text_chunkers.token import TokenTextChunker
 
 __all__ = [
     "BaseTextChunker",
+    "ParallelChunker",
     "SemanticChunker",
     "SentenceChunker",
     "TokenTextChunker",
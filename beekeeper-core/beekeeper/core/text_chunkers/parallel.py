@@ -0,0 +1,94 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import List, Optional
+
+from beekeeper.core.document import Document
+from beekeeper.core.text_chunkers.base import BaseTextChunker
+from beekeeper.core.utils.hashing import HashAlgorithm
+
+
+def _chunk_shard(
+    chunker: BaseTextChunker, hash_algorithm: HashAlgorithm, documents: List[Document]
+) -> List[Document]:
+    # Workers started with spawn don't inherit the parent's `Document.hash_algorithm`
+    Document.hash_algorithm = hash_algorithm
+    return chunker.from_documents(documents)
+
+
+class ParallelChunker(BaseTextChunker):
+    """
+    Wraps a text chunker to split documents across a pool of worker processes.
+    Documents are sharded in order, so the output order and the `ref_doc_id`/`ref_doc_hash`
+    metadata are the same as running the wrapped chunker serially. Workers hash documents
+    with the parent's `Document.hash_algorithm`.
+
+    Args:
+        chunker (BaseTextChunker): Text chunker used to split the documents. Must be picklable.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        min_documents (int, optional): Minimum number of documents to run in parallel, smaller
+            batches are chunked serially to avoid pickling overhead. Default is `32`.
+        executor (Executor, optional): Executor used to run shards instead of creating a
+            process pool on each call. It is not shut down by the chunker.
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.text_chunkers import ParallelChunker, TokenTextChunker
+
+            text_chunker = ParallelChunker(TokenTextChunker(), workers=8)
+    """
+
+    def __init__(
+        self,
+        chunker: BaseTextChunker,
+        workers: Optional[int] = None,
+        min_documents: int = 32,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self.chunker = chunker
+        self.workers = workers or os.cpu_count() or 1
+        self.min_documents = min_documents
+        self.executor = executor
+
+    def from_text(self, text: str) -> List[str]:
+        """
+        Split text into chunks using the wrapped chunker.
+
+        Args:
+            text (str): Input text to split.
+
+        Returns:
+            List[str]: List of text chunks.
+        """
+        return self.chunker.from_text(text)
+
+    def from_documents(self, documents: List[Document]) -> List[Document]:
+        """
+        Split documents into chunks across worker processes.
+
+        Args:
+            documents (List[Document]): List of `Document` objects to split.
+
+        Returns:
+            List[Document]: List of chunked documents objects.
+        """
+        if self.workers <= 1 or len(documents) < self.min_documents:
+            return self.chunker.from_documents(documents)
+
+        # Several shards per worker keep workers busy when document sizes vary.
+        num_shards = min(len(documents), self.workers * 4)
+        shard_size = -(-len(documents) // num_shards)
+        shards = [
+            documents[i : i + shard_size] for i in range(0, len(documents), shard_size)
+        ]
+
+        chunk_shard = partial(_chunk_shard, self.chunker, Document.hash_algorithm)
+
+        if self.executor is not None:
+            results = list(self.executor.map(chunk_shard, shards))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(chunk_shard, shards))
+
+        return [chunk for shard_chunks in results for chunk in shard_chunks]
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from beekeeper.core.document import Document
 from beekeeper.core.text_chunkers.base import BaseTextChunker
@@ -9,7 +9,7 @@ from beekeeper.core.text_chunkers.utils import (
     split_by_regex,
     split_by_sentence_tokenizer,
     split_by_sep,
-    tokenizer,
+    token_count,
 )
 
 
@@ -22,6 +22,7 @@ class SentenceChunker(BaseTextChunker):
         chunk_size (int, optional): Size of each chunk. Default is `512`.
         chunk_overlap (int, optional): Amount of overlap between chunks. Default is `256`.
         separator (str, optional): Separator used for splitting text. Default is `" "`.
+        encoding_name (str, optional): `tiktoken` encoding used to count tokens. Default is `cl100k_base`.
 
     Example:
         .. code-block:: python
@@ -36,6 +37,7 @@ class SentenceChunker(BaseTextChunker):
         chunk_size: int = 512,
         chunk_overlap: int = 256,
         separator=" ",
+        encoding_name: str = "cl100k_base",
     ) -> None:
         if chunk_overlap > chunk_size:
             raise ValueError(
@@ -45,6 +47,7 @@ class SentenceChunker(BaseTextChunker):
 
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.encoding_name = encoding_name
 
         self._split_fns = [split_by_sep("\n\n\n"), split_by_sentence_tokenizer()]
         self._sub_split_fns = [
@@ -104,8 +107,9 @@ class SentenceChunker(BaseTextChunker):
 
         return chunks
 
-    def _split(self, text: str) -> List[dict]:
-        text_len = len(tokenizer(text))
+    def _split(self, text: str, text_len: Optional[int] = None) -> List[dict]:
+        if text_len is None:
+            text_len = token_count(text, self.encoding_name)
         if text_len <= self.chunk_size:
             return [{"text": text, "is_sentence": True, "token_size": text_len}]
 
@@ -117,7 +121,7 @@ class SentenceChunker(BaseTextChunker):
         )
 
         for text_split_by_fns in text_splits_by_fns:
-            split_len = len(tokenizer(text_split_by_fns))
+            split_len = token_count(text_split_by_fns, self.encoding_name)
             if split_len <= self.chunk_size:
                 text_splits.append(
                     {
@@ -127,7 +131,7 @@ class SentenceChunker(BaseTextChunker):
                     },
                 )
             else:
-                recursive_text_splits = self._split(text_split_by_fns)
+                recursive_text_splits = self._split(text_split_by_fns, split_len)
                 text_splits.extend(recursive_text_splits)
 
         return text_splits
@@ -1,13 +1,14 @@
-from typing import List
+from typing import List, Literal, Optional
 
 from beekeeper.core.document import Document
 from beekeeper.core.text_chunkers.base import BaseTextChunker
 from beekeeper.core.text_chunkers.utils import (
+    chunk_by_token_offsets,
     merge_splits,
     split_by_char,
     split_by_fns,
     split_by_sep,
-    tokenizer,
+    token_count,
 )
 
 
@@ -20,6 +21,13 @@ class TokenTextChunker(BaseTextChunker):
         chunk_size (int, optional): Size of each chunk. Default is `512`.
         chunk_overlap (int, optional): Amount of overlap between chunks. Default is `256`.
         separator (str, optional): Separators used for splitting into words. Default is `\\n\\n`.
+        encoding_name (str, optional): `tiktoken` encoding used to count tokens. Default is `cl100k_base`.
+        engine (str, optional): Chunking engine. Currently supports `"recursive"` and `"offsets"`. Default is `recursive`.
+
+            - `recursive`: splits by separator, recursing into oversized splits, then merges splits into chunks.
+            - `offsets`: encodes the text once and cuts chunks directly over token offsets, preferring
+              to cut at the last separator inside each chunk. Runs in linear time and keeps the source
+              text verbatim, suited for long texts without separators (e.g. logs, minified HTML).
 
     Example:
         .. code-block:: python
@@ -34,6 +42,8 @@ class TokenTextChunker(BaseTextChunker):
         chunk_size: int = 512,
         chunk_overlap: int = 256,
         separator="\n\n",
+        encoding_name: str = "cl100k_base",
+        engine: Literal["recursive", "offsets"] = "recursive",
     ) -> None:
         if chunk_overlap > chunk_size:
             raise ValueError(
@@ -41,8 +51,16 @@ class TokenTextChunker(BaseTextChunker):
                 f"({chunk_size}). `chunk_overlap` should be smaller.",
             )
 
+        if engine not in ("recursive", "offsets"):
+            raise ValueError(
+                f"Unsupported engine: `{engine}`. Supported engines are `recursive` and `offsets`.",
+            )
+
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.encoding_name = encoding_name
+        self.separator = separator
+        self.engine = engine
 
         self._split_fns = [split_by_sep(separator)]
 
@@ -65,6 +83,15 @@ class TokenTextChunker(BaseTextChunker):
                     "Beekeeper is a data framework to load any data in one line of code and connect with AI applications."
                 )
         """
+        if self.engine == "offsets":
+            return chunk_by_token_offsets(
+                text,
+                self.chunk_size,
+                self.chunk_overlap,
+                self.separator,
+                self.encoding_name,
+            )
+
         splits = self._split(text)
 
         return merge_splits(splits, self.chunk_size, self.chunk_overlap)
@@ -99,8 +126,9 @@ class TokenTextChunker(BaseTextChunker):
 
         return chunks
 
-    def _split(self, text: str) -> List[dict]:
-        text_len = len(tokenizer(text))
+    def _split(self, text: str, text_len: Optional[int] = None) -> List[dict]:
+        if text_len is None:
+            text_len = token_count(text, self.encoding_name)
         if text_len <= self.chunk_size:
             return [{"text": text, "is_sentence": True, "token_size": text_len}]
 
@@ -112,7 +140,7 @@ class TokenTextChunker(BaseTextChunker):
         )
 
         for text_split_by_fns in text_splits_by_fns:
-            split_len = len(tokenizer(text_split_by_fns))
+            split_len = token_count(text_split_by_fns, self.encoding_name)
             if split_len <= self.chunk_size:
                 text_splits.append(
                     {
@@ -122,7 +150,7 @@ class TokenTextChunker(BaseTextChunker):
                     },
                 )
             else:
-                recursive_text_splits = self._split(text_split_by_fns)
+                recursive_text_splits = self._split(text_split_by_fns, split_len)
                 text_splits.extend(recursive_text_splits)
 
         return text_splits
@@ -1,33 +1,68 @@
-from typing import Callable, List, Tuple
+from bisect import bisect_left
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Deque, Dict, List, Tuple
 
+DEFAULT_ENCODING = "cl100k_base"
 
-def tokenizer(text: str) -> List:
-    try:
-        import tiktoken
-    except ImportError:
-        raise ImportError(
-            "tiktoken package not found, please install it with `pip install tiktoken`",
+# Module-level registry of `tiktoken` encoders, loaded once per encoding name.
+_encoders: Dict[str, Any] = {}
+
+
+def get_encoder(encoding_name: str = DEFAULT_ENCODING) -> Any:
+    """Get a cached `tiktoken` encoder by encoding name."""
+    encoder = _encoders.get(encoding_name)
+
+    if encoder is None:
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError(
+                "tiktoken package not found, please install it with `pip install tiktoken`",
+            )
+
+        encoder = _encoders.setdefault(
+            encoding_name, tiktoken.get_encoding(encoding_name)
         )
 
-    enc = tiktoken.get_encoding("cl100k_base")
-    return enc.encode(text)
+    return encoder
+
+
+def tokenizer(text: str, encoding_name: str = DEFAULT_ENCODING) -> List:
+    """Encode text into a list of token ids."""
+    return get_encoder(encoding_name).encode(text)
+
+
+def token_count(text: str, encoding_name: str = DEFAULT_ENCODING) -> int:
+    """Count tokens in text without building a Python list of token ids."""
+    encoder = get_encoder(encoding_name)
+
+    try:
+        return len(encoder.encode_to_numpy(text))
+    except UnicodeEncodeError:
+        # `encode` sanitizes lone surrogates, `encode_to_numpy` does not.
+        return len(encoder.encode(text))
 
 
 def split_by_sep(sep) -> Callable[[str], List[str]]:
     """Split text by separator."""
-    return lambda text: text.split(sep)
+    return partial(_split_by_sep, sep=sep)
+
+
+def _split_by_sep(text: str, sep: str) -> List[str]:
+    return text.split(sep)
 
 
 def split_by_regex(regex: str) -> Callable[[str], List[str]]:
     """Split text by regex."""
     import re
 
-    return lambda text: re.findall(regex, text)
+    return partial(re.findall, regex)
 
 
 def split_by_char() -> Callable[[str], List[str]]:
     """Split text by character."""
-    return lambda text: list(text)
+    return list
 
 
 def split_by_sentence_tokenizer() -> Callable[[str], List[str]]:
@@ -39,7 +74,7 @@ def split_by_sentence_tokenizer() -> Callable[[str], List[str]]:
         )
 
     sentence_tokenizer = nltk.tokenize.PunktSentenceTokenizer()
-    return lambda text: _split_by_sentence_tokenizer(text, sentence_tokenizer)
+    return partial(_split_by_sentence_tokenizer, sentence_tokenizer=sentence_tokenizer)
 
 
 def _split_by_sentence_tokenizer(text: str, sentence_tokenizer) -> List[str]:
@@ -85,65 +120,83 @@ def split_by_fns(  # noqa: RET503
 def merge_splits(splits: List[dict], chunk_size: int, chunk_overlap: int) -> List[str]:
     """Merge splits into chunks."""
     chunks: List[str] = []
-    cur_chunk: List[Tuple[str, int]] = []
+    cur_chunk: Deque[Tuple[str, int]] = deque()
     cur_chunk_len = 0
-    last_chunk: List[Tuple[str, int]] = []
     new_chunk = True
 
-    def close_chunk() -> None:
-        nonlocal chunks, cur_chunk, last_chunk, cur_chunk_len, new_chunk
-
-        chunks.append("".join([text for text, length in cur_chunk]))
-        last_chunk = cur_chunk
-        cur_chunk = []
-        cur_chunk_len = 0
-        new_chunk = True
-
-        # add overlap to the next chunk using previous chunk
-        if len(last_chunk) > 0:
-            last_index = len(last_chunk) - 1
-            while (
-                last_index >= 0
-                and cur_chunk_len + last_chunk[last_index][1] <= chunk_overlap
-            ):
-                text, length = last_chunk[last_index]
-                cur_chunk_len += length
-                cur_chunk.insert(0, (text, length))
-                last_index -= 1
-
-    def postprocess_chunks(_chunks: List[str]) -> List[str]:
-        """Post-process chunks."""
-        post_chunks = []
-        for _chunk in _chunks:
-            stripped_chunk = _chunk.strip()
-            if stripped_chunk == "":
-                continue
-            post_chunks.append(stripped_chunk)
-        return post_chunks
-
-    while len(splits) > 0:
-        cur_split = splits[0]
-
-        if cur_split["token_size"] > chunk_size:
+    for split in splits:
+        split_len = split["token_size"]
+
+        if split_len > chunk_size:
             raise ValueError("Got a split size that exceeded chunk size")
 
-        if cur_chunk_len + cur_split["token_size"] > chunk_size and not new_chunk:
-            close_chunk()
-        else:
-            if (
-                cur_split["is_sentence"]
-                or cur_chunk_len + cur_split["token_size"] <= chunk_size
-                or new_chunk
-            ):  # If `new_chunk`, always add at least one split
-                cur_chunk_len += cur_split["token_size"]
-                cur_chunk.append((cur_split["text"], cur_split["token_size"]))
-                splits.pop(0)
-                new_chunk = False
-            else:
-                close_chunk()
+        if cur_chunk_len + split_len > chunk_size and not new_chunk:
+            chunks.append("".join([text for text, _ in cur_chunk]))
+
+            # add overlap to the next chunk using the tail of previous chunk
+            overlap: Deque[Tuple[str, int]] = deque()
+            overlap_len = 0
+            for text, length in reversed(cur_chunk):
+                if overlap_len + length > chunk_overlap:
+                    break
+                overlap.appendleft((text, length))
+                overlap_len += length
+
+            cur_chunk = overlap
+            cur_chunk_len = overlap_len
+
+        # a new chunk always takes at least one split
+        cur_chunk.append((split["text"], split_len))
+        cur_chunk_len += split_len
+        new_chunk = False
 
     if not new_chunk:
-        chunk = "".join([text for text, length in cur_chunk])
-        chunks.append(chunk)
+        chunks.append("".join([text for text, _ in cur_chunk]))
+
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+
+def chunk_by_token_offsets(
+    text: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    separator: str = "",
+    encoding_name: str = DEFAULT_ENCODING,
+) -> List[str]:
+    """
+    Chunk text in a single pass over its token-to-character offsets.
+
+    The text is encoded once and each chunk is sliced from the source text between
+    token offsets. When a `separator` is provided, a chunk is cut before the last
+    separator inside its token window, as long as the cut still moves past the overlap.
+    """
+    encoder = get_encoder(encoding_name)
+    tokens = encoder.encode(text)
+    num_tokens = len(tokens)
+
+    if num_tokens == 0:
+        return []
+
+    _, offsets = encoder.decode_with_offsets(tokens)
+
+    chunks = []
+    start = 0
+
+    while start < num_tokens:
+        end = start + chunk_size
+
+        if end >= num_tokens:
+            chunks.append(text[offsets[start] :])
+            break
+
+        if separator:
+            cut = text.rfind(separator, offsets[start], offsets[end])
+            if cut != -1:
+                cut_token = bisect_left(offsets, cut, start, end)
+                if cut_token - chunk_overlap > start:
+                    end = cut_token
+
+        chunks.append(text[offsets[start] : offsets[end]])
+        start = max(end - chunk_overlap, start + 1)
 
-    return postprocess_chunks(chunks)
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
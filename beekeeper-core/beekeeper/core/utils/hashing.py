@@ -0,0 +1,35 @@
+from hashlib import blake2b, sha256
+from typing import Literal
+
+HashAlgorithm = Literal["sha256", "blake2b", "xxhash"]
+
+
+def text_hash(text: str, algorithm: HashAlgorithm = "sha256") -> str:
+    """
+    Hash text into a hex digest.
+
+    Args:
+        text (str): Text to hash.
+        algorithm (str, optional): Hash algorithm. Currently supports `"sha256"`, `"blake2b"`
+            and `"xxhash"` (non-cryptographic, requires `xxhash` package). Defaults to `sha256`.
+    """
+    data = text.encode("utf-8", "surrogatepass")
+
+    if algorithm == "sha256":
+        return sha256(data).hexdigest()
+
+    elif algorithm == "blake2b":
+        return blake2b(data, digest_size=32).hexdigest()
+
+    elif algorithm == "xxhash":
+        try:
+            import xxhash
+        except ImportError:
+            raise ImportError(
+                "xxhash package not found, please install it with `pip install xxhash`",
+            )
+
+        return xxhash.xxh3_128_hexdigest(data)
+
+    else:
+        raise ValueError(f"Unsupported hash algorithm: `{algorithm}`.")
@@ -1,3 +1,19 @@
 from beekeeper.core.vector_stores.base import BaseVectorStore
+from beekeeper.core.vector_stores.memmap_store import MemmapVectorStore
+from beekeeper.core.vector_stores.numpy_store import NumpyVectorStore
+from beekeeper.core.vector_stores.types import (
+    FilterCondition,
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+)
 
-__all__ = ["BaseVectorStore"]
+__all__ = [
+    "BaseVectorStore",
+    "FilterCondition",
+    "FilterOperator",
+    "MemmapVectorStore",
+    "MetadataFilter",
+    "MetadataFilters",
+    "NumpyVectorStore",
+]
@@ -0,0 +1,453 @@
+import json
+from abc import ABC, abstractmethod
+from typing import List, Literal, Optional
+
+import numpy as np
+
+IndexMetric = Literal["ip", "l2"]
+
+
+class BaseVectorIndex(ABC):
+    """
+    An interface for approximate nearest neighbour (ANN) indexes used by local vector stores.
+
+    Indexes map store rows (integer labels) to their embeddings. A search returns candidate
+    rows, which the vector store re-scores exactly against its stored embeddings, so an index
+    only affects recall and latency, never the returned scores. The store sets `metric`:
+    ``"ip"`` for the `cosine` (normalized rows) and `ip` distance strategies, ``"l2"`` otherwise.
+    """
+
+    metric: IndexMetric = "ip"
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "BaseVectorIndex"
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the index is ready to index rows. Indexes requiring training index all rows once trained."""
+        return True
+
+    @property
+    def train_size(self) -> int:
+        """Number of rows required to train the index."""
+        return 0
+
+    def train(self, embeddings: np.ndarray) -> None:
+        """Train the index on a representative set of embeddings."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of indexed rows."""
+
+    @abstractmethod
+    def add(self, rows: np.ndarray, embeddings: np.ndarray) -> None:
+        """Index the embeddings of `rows`."""
+
+    @abstractmethod
+    def remove(self, rows: np.ndarray) -> None:
+        """Remove `rows` from the index."""
+
+    @abstractmethod
+    def search(self, query_embedding: np.ndarray, top_k: int) -> np.ndarray:
+        """Return candidate rows for the `top_k` nearest neighbours of the query."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Remove all rows from the index, keeping its training."""
+
+    @abstractmethod
+    def save(self, path: str) -> None:
+        """Save the index to `path`."""
+
+    @abstractmethod
+    def load(self, path: str) -> None:
+        """Load the index from `path`."""
+
+
+class HNSWIndex(BaseVectorIndex):
+    """
+    Hierarchical Navigable Small World (HNSW) graph index, backed by `hnswlib`.
+
+    Args:
+        m (int, optional): Number of graph links per element. Higher values improve recall at
+            the cost of memory and build time. Defaults to ``16``.
+        ef_construction (int, optional): Candidate list size while building the graph. Defaults to ``200``.
+        ef_search (int, optional): Candidate list size while searching, the main recall/latency trade-off.
+            Defaults to ``64``.
+        initial_capacity (int, optional): Number of elements allocated on first insert, doubled as needed.
+            Defaults to ``1024``.
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.vector_stores import NumpyVectorStore
+            from beekeeper.core.vector_stores.ann import HNSWIndex
+
+            vector_db = NumpyVectorStore(
+                embed_model=embedding, index=HNSWIndex(ef_search=128)
+            )
+    """
+
+    def __init__(
+        self,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        initial_capacity: int = 1024,
+    ) -> None:
+        try:
+            import hnswlib  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "hnswlib package not found, please install it with `pip install hnswlib`",
+            )
+
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.initial_capacity = max(1, initial_capacity)
+
+        self._index = None
+        self._count = 0
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "HNSWIndex"
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _init_index(self, dim: int, max_elements: int) -> None:
+        import hnswlib
+
+        self._index = hnswlib.Index(space=self.metric, dim=dim)
+        self._index.init_index(
+            max_elements=max_elements,
+            ef_construction=self.ef_construction,
+            M=self.m,
+        )
+
+    def add(self, rows: np.ndarray, embeddings: np.ndarray) -> None:
+        if not len(rows):
+            return
+
+        if self._index is None:
+            self._init_index(embeddings.shape[1], max(self.initial_capacity, len(rows)))
+
+        required = self._index.get_current_count() + len(rows)
+        capacity = self._index.get_max_elements()
+        if required > capacity:
+            while capacity < required:
+                capacity *= 2
+            self._index.resize_index(capacity)
+
+        self._index.add_items(embeddings, np.asarray(rows, dtype=np.int64))
+        self._count += len(rows)
+
+    def remove(self, rows: np.ndarray) -> None:
+        if self._index is None:
+            return
+
+        for row in np.asarray(rows).tolist():
+            try:
+                self._index.mark_deleted(row)
+                self._count -= 1
+            except RuntimeError:
+                # Not indexed, or already deleted
+                pass
+
+    def search(self, query_embedding: np.ndarray, top_k: int) -> np.ndarray:
+        k = min(top_k, self._count)
+        if self._index is None or k <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        self._index.set_ef(max(self.ef_search, k))
+        labels, _ = self._index.knn_query(query_embedding, k=k)
+
+        return labels[0].astype(np.int64)
+
+    def reset(self) -> None:
+        self._index = None
+        self._count = 0
+
+    def save(self, path: str) -> None:
+        if self._index is None:
+            raise ValueError("Cannot save an empty index.")
+
+        self._index.save_index(path)
+        with open(path + ".json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "metric": self.metric,
+                    "dim": self._index.dim,
+                    "count": self._count,
+                },
+                f,
+            )
+
+    def load(self, path: str) -> None:
+        import hnswlib
+
+        with open(path + ".json", encoding="utf-8") as f:
+            header = json.load(f)
+
+        if header["metric"] != self.metric:
+            raise ValueError(
+                f"Index metric mismatch: expected {self.metric}, got {header['metric']}."
+            )
+
+        self._index = hnswlib.Index(space=self.metric, dim=header["dim"])
+        self._index.load_index(path)
+        self._count = header["count"]
+
+
+class IVFIndex(BaseVectorIndex):
+    """
+    Inverted file (IVF) index in pure NumPy.
+
+    Rows are partitioned into `n_lists` clusters with k-means, and a search scans the rows of
+    the `n_probe` clusters closest to the query. The index trains itself once `train_size`
+    rows are stored; until then, searches scan every row.
+
+    Args:
+        n_lists (int, optional): Number of clusters. A common choice is about ``sqrt(N)``
+            for `N` rows. Defaults to ``1024``.
+        n_probe (int, optional): Number of clusters scanned per search, the main recall/latency
+            trade-off. Defaults to ``16``.
+        train_size (int, optional): Number of rows required to train the index.
+            Defaults to ``39 * n_lists``.
+        n_iter (int, optional): Number of k-means iterations. Defaults to ``20``.
+        seed (int, optional): Random seed used for k-means. Defaults to ``0``.
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.vector_stores import NumpyVectorStore
+            from beekeeper.core.vector_stores.ann import IVFIndex
+
+            vector_db = NumpyVectorStore(
+                embed_model=embedding, index=IVFIndex(n_lists=4096, n_probe=32)
+            )
+    """
+
+    # Maximum number of embeddings sampled for k-means, per cluster
+    _max_samples_per_list = 256
+    # Number of rows assigned to clusters per batch, bounding temporary memory
+    _assign_batch_size = 65536
+
+    def __init__(
+        self,
+        n_lists: int = 1024,
+        n_probe: int = 16,
+        train_size: Optional[int] = None,
+        n_iter: int = 20,
+        seed: int = 0,
+    ) -> None:
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.n_iter = n_iter
+        self.seed = seed
+        self._train_size = train_size if train_size is not None else 39 * n_lists
+
+        self._centroids: Optional[np.ndarray] = None
+        self.reset()
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "IVFIndex"
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    @property
+    def train_size(self) -> int:
+        return max(self._train_size, self.n_lists)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _assign(self, embeddings: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Return the nearest centroid of each embedding."""
+        assignments = np.empty(len(embeddings), dtype=np.int64)
+
+        for start in range(0, len(embeddings), self._assign_batch_size):
+            batch = np.asarray(
+                embeddings[start : start + self._assign_batch_size], dtype=np.float32
+            )
+            scores = batch @ centroids.T
+            if self.metric == "l2":
+                scores = 2 * scores - (centroids**2).sum(axis=1)
+            assignments[start : start + len(batch)] = scores.argmax(axis=1)
+
+        return assignments
+
+    def train(self, embeddings: np.ndarray) -> None:
+        if len(embeddings) < self.n_lists:
+            return
+
+        rng = np.random.default_rng(self.seed)
+        num_samples = min(len(embeddings), self.n_lists * self._max_samples_per_list)
+        samples = np.asarray(
+            embeddings[
+                np.sort(rng.choice(len(embeddings), num_samples, replace=False))
+            ],
+            dtype=np.float32,
+        )
+
+        centroids = samples[rng.choice(num_samples, self.n_lists, replace=False)]
+        for _ in range(self.n_iter):
+            assignments = self._assign(samples, centroids)
+
+            counts = np.bincount(assignments, minlength=self.n_lists)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, samples)
+
+            # Empty clusters keep their previous centroid
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+            if self.metric == "ip":
+                centroids /= np.maximum(
+                    np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12
+                )
+
+        self._centroids = centroids
+
+    def add(self, rows: np.ndarray, embeddings: np.ndarray) -> None:
+        if not len(rows):
+            return
+
+        rows = np.asarray(rows, dtype=np.int64)
+        self._count += len(rows)
+
+        if not self.is_trained:
+            self._unassigned.append(rows)
+            self._set_row_lists(rows, np.full(len(rows), self.n_lists))
+            return
+
+        assignments = self._assign(embeddings, self._centroids)
+        self._set_row_lists(rows, assignments)
+        order = np.argsort(assignments, kind="stable")
+        boundaries = np.searchsorted(assignments[order], np.arange(self.n_lists + 1))
+
+        for list_id in np.flatnonzero(np.diff(boundaries)).tolist():
+            self._lists[list_id].append(
+                rows[order[boundaries[list_id] : boundaries[list_id + 1]]]
+            )
+
+    def _set_row_lists(self, rows: np.ndarray, list_ids: np.ndarray) -> None:
+        """Record the list of each row, doubling the row map as needed."""
+        required = int(rows.max()) + 1
+        if len(self._row_lists) < required:
+            grown = np.full(max(required, 2 * len(self._row_lists)), -1, dtype=np.int64)
+            grown[: len(self._row_lists)] = self._row_lists
+            self._row_lists = grown
+
+        self._row_lists[rows] = list_ids
+
+    def _get_chunks(self, list_id: int) -> List[np.ndarray]:
+        return self._unassigned if list_id == self.n_lists else self._lists[list_id]
+
+    def _compact_list(self, chunks: List[np.ndarray]) -> np.ndarray:
+        if len(chunks) > 1:
+            chunks[:] = [np.concatenate(chunks)]
+
+        return chunks[0] if chunks else np.empty(0, dtype=np.int64)
+
+    def remove(self, rows: np.ndarray) -> None:
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows):
+            return
+
+        # Only scan the lists holding the removed rows
+        rows = rows[rows < len(self._row_lists)]
+        list_ids = self._row_lists[rows]
+        rows, list_ids = rows[list_ids >= 0], list_ids[list_ids >= 0]
+        self._row_lists[rows] = -1
+
+        order = np.argsort(list_ids, kind="stable")
+        list_ids, starts = np.unique(list_ids[order], return_index=True)
+        for list_id, removed in zip(
+            list_ids.tolist(), np.split(rows[order], starts[1:])
+        ):
+            chunks = self._get_chunks(list_id)
+            current = self._compact_list(chunks)
+            kept = current[~np.isin(current, removed)]
+            self._count -= len(current) - len(kept)
+            chunks[:] = [kept]
+
+    def search(self, query_embedding: np.ndarray, top_k: int) -> np.ndarray:
+        candidates = [self._compact_list(self._unassigned)]
+
+        if self.is_trained:
+            scores = self._centroids @ query_embedding
+            if self.metric == "l2":
+                scores = 2 * scores - (self._centroids**2).sum(axis=1)
+
+            n_probe = min(self.n_probe, self.n_lists)
+            for list_id in np.argpartition(-scores, n_probe - 1)[:n_probe].tolist():
+                candidates.append(self._compact_list(self._lists[list_id]))
+
+        return np.concatenate(candidates)
+
+    def reset(self) -> None:
+        self._lists: List[List[np.ndarray]] = [[] for _ in range(self.n_lists)]
+        self._unassigned: List[np.ndarray] = []
+        # List of each indexed row, ``n_lists`` for unassigned rows and -1 for others
+        self._row_lists = np.empty(0, dtype=np.int64)
+        self._count = 0
+
+    def save(self, path: str) -> None:
+        lists = [self._compact_list(chunks) for chunks in self._lists]
+
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                metric=np.array(self.metric),
+                centroids=(
+                    self._centroids
+                    if self.is_trained
+                    else np.empty((0, 0), dtype=np.float32)
+                ),
+                unassigned=self._compact_list(self._unassigned),
+                list_sizes=np.array([len(rows) for rows in lists], dtype=np.int64),
+                list_rows=(
+                    np.concatenate(lists) if lists else np.empty(0, dtype=np.int64)
+                ),
+            )
+
+    def load(self, path: str) -> None:
+        with np.load(path) as data:
+            if str(data["metric"]) != self.metric:
+                raise ValueError(
+                    f"Index metric mismatch: expected {self.metric}, got {data['metric']}."
+                )
+
+            list_sizes = data["list_sizes"]
+            if len(list_sizes) != self.n_lists:
+                raise ValueError(
+                    f"Index n_lists mismatch: expected {self.n_lists}, got {len(list_sizes)}."
+                )
+
+            centroids = data["centroids"]
+            self._centroids = centroids if centroids.size else None
+
+            self.reset()
+            self._unassigned = [data["unassigned"]]
+            self._lists = [
+                [rows]
+                for rows in np.split(data["list_rows"], np.cumsum(list_sizes)[:-1])
+            ]
+            self._count = len(data["unassigned"]) + int(list_sizes.sum())
+
+            if self._count:
+                self._set_row_lists(
+                    np.concatenate([data["unassigned"], data["list_rows"]]),
+                    np.concatenate(
+                        [
+                            np.full(len(data["unassigned"]), self.n_lists),
+                            np.repeat(np.arange(self.n_lists), list_sizes),
+                        ]
+                    ),
+                )
@@ -1,7 +1,9 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from beekeeper.core.document import Document
+from beekeeper.core.vector_stores.types import MetadataFilters
 
 
 class BaseVectorStore(ABC):
@@ -16,7 +18,12 @@ class BaseVectorStore(ABC):
         """Add documents to vector store."""
 
     @abstractmethod
-    def search_documents(self, query: str, top_k: int = 4) -> List[Document]:
+    def search_documents(
+        self,
+        query: str,
+        top_k: int = 4,
+        filters: Optional[MetadataFilters] = None,
+    ) -> List[Document]:
         """Search for similar documents in the vector store based on the input query provided."""
 
     @abstractmethod
@@ -27,6 +34,35 @@ class BaseVectorStore(ABC):
     def get_all_documents(self, include_fields: List[str]) -> List[Document]:
         """Get all documents from vector store."""
 
+    async def aadd_documents(self, documents: List[Document]) -> List[str]:
+        """Asynchronously add documents to vector store. Defaults to running `add_documents` in a thread."""
+        return await asyncio.to_thread(self.add_documents, documents)
+
+    async def asearch_documents(
+        self,
+        query: str,
+        top_k: int = 4,
+        filters: Optional[MetadataFilters] = None,
+    ) -> List[Document]:
+        """Asynchronously search for similar documents. Defaults to running `search_documents` in a thread."""
+        if filters is None:
+            return await asyncio.to_thread(self.search_documents, query, top_k)
+
+        return await asyncio.to_thread(self.search_documents, query, top_k, filters)
+
+    async def adelete_documents(self, ids: List[str]) -> None:
+        """Asynchronously delete documents from vector store. Defaults to running `delete_documents` in a thread."""
+        return await asyncio.to_thread(self.delete_documents, ids)
+
+    async def aget_all_documents(
+        self, include_fields: Optional[List[str]] = None
+    ) -> List[Document]:
+        """Asynchronously get all documents from vector store. Defaults to running `get_all_documents` in a thread."""
+        if include_fields is None:
+            return await asyncio.to_thread(self.get_all_documents)
+
+        return await asyncio.to_thread(self.get_all_documents, include_fields)
+
     def get_all_document_hashes(self) -> Tuple[List[str], List[str], List[str]]:
         """Get all ref hashes from vector store."""
         hits = self.get_all_documents()
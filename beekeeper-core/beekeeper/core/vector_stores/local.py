@@ -0,0 +1,480 @@
+import threading
+from abc import abstractmethod
+from array import array
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
+
+import numpy as np
+from beekeeper.core.document import Document, DocumentWithScore
+from beekeeper.core.embeddings import BaseEmbedding
+from beekeeper.core.vector_stores.ann import BaseVectorIndex
+from beekeeper.core.vector_stores.base import BaseVectorStore
+from beekeeper.core.vector_stores.quantization import BaseQuantizer
+from beekeeper.core.vector_stores.types import (
+    FilterCondition,
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+    compare_metadata_value,
+)
+
+DistanceStrategy = Literal["cosine", "ip", "l2"]
+
+
+class _MetadataIndex:
+    """Inverted index of metadata values, evaluating filters into row bitmaps (boolean masks)."""
+
+    def __init__(self) -> None:
+        # Rows per key and value, and rows where the key is set
+        self._postings: Dict[str, Dict[Any, array]] = {}
+        self._key_rows: Dict[str, array] = {}
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._postings)
+
+    def reset(self) -> None:
+        self._postings = {}
+        self._key_rows = {}
+
+    def add(
+        self, row: int, metadata: Dict[str, Any], keys: Optional[Iterable[str]] = None
+    ) -> None:
+        """Index the metadata of a row, for the given (default all indexed) keys."""
+        for key in self.keys if keys is None else keys:
+            postings = self._postings.setdefault(key, {})
+            key_rows = self._key_rows.setdefault(key, array("q"))
+            if key not in metadata:
+                continue
+
+            key_rows.append(row)
+            value = metadata[key]
+            for v in value if isinstance(value, list) else [value]:
+                try:
+                    rows = postings.setdefault(v, array("q"))
+                except TypeError:
+                    # Unhashable values, e.g. nested dicts, can't be filtered on
+                    continue
+                if not rows or rows[-1] != row:
+                    rows.append(row)
+
+    def mask(
+        self, filters: Union[MetadataFilter, MetadataFilters], size: int
+    ) -> np.ndarray:
+        """Return the mask of the rows matching the filters."""
+        if isinstance(filters, MetadataFilters):
+            masks = [self.mask(f, size) for f in filters.filters]
+            if not masks:
+                return np.full(size, filters.condition == FilterCondition.AND)
+            if filters.condition == FilterCondition.OR:
+                return np.logical_or.reduce(masks)
+            return np.logical_and.reduce(masks)
+
+        postings = self._postings.get(filters.key, {})
+        operator = filters.operator
+
+        if operator in (FilterOperator.EQ, FilterOperator.NE):
+            values = [filters.value]
+        elif operator in (FilterOperator.IN, FilterOperator.NIN):
+            values = filters.value
+        else:
+            values = [
+                v
+                for v in postings
+                if compare_metadata_value(operator, v, filters.value)
+            ]
+
+        mask = np.zeros(size, dtype=bool)
+        for v in values:
+            rows = postings.get(v)
+            if rows:
+                mask[np.frombuffer(rows, dtype=np.int64)] = True
+
+        if operator in (FilterOperator.NE, FilterOperator.NIN):
+            key_mask = np.zeros(size, dtype=bool)
+            key_rows = self._key_rows.get(filters.key, array("q"))
+            key_mask[np.frombuffer(key_rows, dtype=np.int64)] = True
+            mask = key_mask & ~mask
+
+        return mask
+
+
+class BaseLocalVectorStore(BaseVectorStore):
+    """
+    An interface for in-process vector stores, searching a float32 embedding matrix.
+
+    Implementations store one row per document and keep `_ids` (ID per row) and
+    `_id_to_row` (live documents only) up to date. Rows are normalized for the `cosine` distance
+    strategy, and the original norms are kept to restore the embeddings.
+
+    With an `index`, searches only score the candidate rows returned by the index. With a
+    `quantizer`, rows are first scored from their codes, then the best `rerank_pool` rows are
+    scored exactly. Implementations call `_index_add` and `_index_remove` as rows are written
+    and deleted, and `_rebuild_index` when rows are renumbered.
+
+    Metadata filters are evaluated on an inverted index of metadata values, built for a key
+    the first time a filter uses it, so filtered searches only score the matching rows.
+
+    Args:
+        embed_model (BaseEmbedding): Embedding model used to compute vectors.
+        distance_strategy (str, optional): Distance strategy for similarity search.
+            Currently supports `"cosine"`, `"ip"`, and `"l2"`. Defaults to `cosine`.
+        index (BaseVectorIndex, optional): Approximate nearest neighbour index. Defaults to `None` (exact search).
+        quantizer (BaseQuantizer, optional): Embedding quantizer. Defaults to `None` (exact search).
+    """
+
+    # Number of rows indexed per batch when rebuilding the index
+    _index_batch_size = 65536
+    # Maximum number of rows sampled to train the index and quantizer
+    _max_train_samples = 262144
+    # Filters matching at most this many rows are searched exactly, without the index
+    _prefilter_max_rows = 65536
+
+    def __init__(
+        self,
+        embed_model: BaseEmbedding,
+        distance_strategy: DistanceStrategy = "cosine",
+        index: Optional[BaseVectorIndex] = None,
+        quantizer: Optional[BaseQuantizer] = None,
+    ) -> None:
+        if distance_strategy not in ("cosine", "ip", "l2"):
+            raise ValueError(
+                f"Unsupported distance_strategy '{distance_strategy}'. "
+                "Supported values are 'cosine', 'ip' and 'l2'."
+            )
+
+        self._embed_model = embed_model
+        self.distance_strategy = distance_strategy
+
+        metric = "l2" if distance_strategy == "l2" else "ip"
+        self.index = index
+        if index is not None:
+            index.metric = metric
+
+        self.quantizer = quantizer
+        if quantizer is not None:
+            quantizer.metric = metric
+        # Quantization codes, one entry per row once the quantizer is trained
+        self._codes: Optional[np.ndarray] = None
+        self._metadata_index = _MetadataIndex()
+
+        self._lock = threading.RLock()
+        self._ids: List[Optional[str]] = []
+        self._id_to_row: Dict[str, int] = {}
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "BaseLocalVectorStore"
+
+    def __len__(self) -> int:
+        return len(self._id_to_row)
+
+    @abstractmethod
+    def _get_rows(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the stored embeddings, norms and alive mask, one entry per row."""
+
+    @abstractmethod
+    def _get_text(self, row: int) -> str:
+        """Return the text of a row."""
+
+    @abstractmethod
+    def _get_metadata(self, row: int) -> Dict[str, Any]:
+        """Return the metadata of a row."""
+
+    def _needs_training(self) -> bool:
+        return any(
+            component is not None
+            and not component.is_trained
+            and len(self) >= component.train_size
+            for component in (self.index, self.quantizer)
+        )
+
+    def _set_codes(self, rows: np.ndarray, codes: np.ndarray) -> None:
+        """Store the codes of the given rows, doubling the codes array as needed."""
+        required = int(rows.max()) + 1
+        if self._codes is None or len(self._codes) < required:
+            capacity = max(
+                required, 2 * len(self._codes) if self._codes is not None else 0
+            )
+            grown = np.zeros((capacity, codes.shape[1]), dtype=np.uint8)
+            if self._codes is not None:
+                grown[: len(self._codes)] = self._codes
+            self._codes = grown
+
+        self._codes[rows] = codes
+
+    def _index_add(self, rows: np.ndarray, embeddings: np.ndarray) -> None:
+        """Index newly written rows, training the index and quantizer once enough rows are stored."""
+        if not len(rows):
+            return
+
+        if self._metadata_index.keys:
+            for row in rows.tolist():
+                self._metadata_index.add(row, self._get_metadata(row))
+
+        if self._needs_training():
+            self._rebuild_index()
+            return
+
+        if self.index is not None:
+            self.index.add(rows, embeddings)
+        if self.quantizer is not None and self.quantizer.is_trained:
+            self._set_codes(rows, self.quantizer.encode(embeddings))
+
+    def _index_remove(self, rows: List[int]) -> None:
+        # Codes of deleted rows are masked by the alive mask
+        if self.index is not None and rows:
+            self.index.remove(np.asarray(rows, dtype=np.int64))
+
+    def _rebuild_index(self) -> None:
+        """Re-index all live rows, training the index and quantizer first if needed."""
+        # Rebuilt on the next filtered search
+        self._metadata_index.reset()
+
+        if self.index is None and self.quantizer is None:
+            return
+
+        embeddings, _, alive = self._get_rows()
+        rows = np.flatnonzero(alive)
+
+        samples = rows
+        if len(rows) > self._max_train_samples:
+            rng = np.random.default_rng(0)
+            samples = np.sort(rng.choice(rows, self._max_train_samples, replace=False))
+
+        for component in (self.index, self.quantizer):
+            if (
+                component is not None
+                and not component.is_trained
+                and len(rows) >= component.train_size
+            ):
+                component.train(np.asarray(embeddings[samples], dtype=np.float32))
+
+        if self.index is not None:
+            self.index.reset()
+
+        self._codes = None
+        encode = self.quantizer is not None and self.quantizer.is_trained
+
+        for start in range(0, len(rows), self._index_batch_size):
+            batch = rows[start : start + self._index_batch_size]
+            batch_embeddings = np.asarray(embeddings[batch], dtype=np.float32)
+
+            if self.index is not None:
+                self.index.add(batch, batch_embeddings)
+            if encode:
+                self._set_codes(batch, self.quantizer.encode(batch_embeddings))
+
+    def _get_embeddings(self, documents: List[Document]) -> np.ndarray:
+        """Return the documents embeddings, computing missing ones in a single batch."""
+        missing = [i for i, doc in enumerate(documents) if doc.embedding is None]
+        embeddings = [doc.embedding for doc in documents]
+
+        if missing:
+            computed = self._embed_model.get_texts_embedding(
+                [documents[i].get_content() for i in missing]
+            )
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def _prepare_embeddings(
+        self, embeddings: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the rows to store and their norms."""
+        norms = np.linalg.norm(embeddings, axis=1).astype(np.float32)
+        if self.distance_strategy == "cosine":
+            embeddings = (
+                embeddings / np.maximum(norms, np.finfo(np.float32).tiny)[:, None]
+            )
+
+        return embeddings, norms
+
+    def _get_embedding(self, row: int) -> List[float]:
+        embeddings, norms, _ = self._get_rows()
+
+        embedding = embeddings[row]
+        if self.distance_strategy == "cosine":
+            embedding = embedding * norms[row]
+
+        return embedding.tolist()
+
+    def _prepare_query(self, query_embedding: np.ndarray) -> np.ndarray:
+        if self.distance_strategy == "cosine":
+            return query_embedding / max(np.linalg.norm(query_embedding), 1e-30)
+
+        return query_embedding
+
+    def _scores(
+        self, query_embedding: np.ndarray, rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Return the similarity of the query to the given (default all) rows, higher is closer."""
+        embeddings, norms, alive = self._get_rows()
+        if rows is not None:
+            embeddings, norms, alive = embeddings[rows], norms[rows], alive[rows]
+
+        if self.distance_strategy == "l2":
+            # Negative squared L2 distance: 2 q.x - |x|^2 - |q|^2
+            scores = 2 * (embeddings @ query_embedding) - (
+                norms**2 + query_embedding @ query_embedding
+            )
+        else:
+            scores = embeddings @ query_embedding
+
+        scores[~alive] = -np.inf
+        return scores
+
+    def _get_filter_mask(self, filters: MetadataFilters) -> np.ndarray:
+        """Return the mask of the live rows matching the filters, indexing new keys first."""
+        _, _, alive = self._get_rows()
+
+        keys = [
+            key for key in filters.get_keys() if key not in self._metadata_index.keys
+        ]
+        if keys:
+            for row in np.flatnonzero(alive).tolist():
+                self._metadata_index.add(row, self._get_metadata(row), keys)
+
+        return self._metadata_index.mask(filters, len(alive)) & alive
+
+    def _get_candidates(
+        self, query_embedding: np.ndarray, top_k: int, mask: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
+        """Return the rows to score exactly, or `None` to score all rows."""
+        rows = None
+        if mask is not None:
+            rows = np.flatnonzero(mask)
+
+            if self.index is not None and len(rows) > self._prefilter_max_rows:
+                # Broad filter: over-fetch from the index, keep the matching candidates
+                candidates = self.index.search(
+                    query_embedding, int(np.ceil(top_k * len(mask) / len(rows)))
+                )
+                rows = candidates[mask[candidates]]
+
+        elif self.index is not None:
+            rows = self.index.search(query_embedding, top_k)
+
+        if self._codes is None:
+            return rows
+
+        _, _, alive = self._get_rows()
+        if rows is None:
+            codes, alive = self._codes[: len(alive)], alive[: len(self._codes)]
+        else:
+            codes, alive = self._codes[rows], alive[rows]
+
+        scores = self.quantizer.score(query_embedding, codes)
+        scores[~alive] = -np.inf
+
+        pool = max(top_k, self.quantizer.rerank_pool)
+        top = np.arange(len(scores))
+        if pool < len(scores):
+            top = np.argpartition(-scores, pool - 1)[:pool]
+
+        # Sorted rows read the stored embeddings sequentially
+        return np.sort(top if rows is None else rows[top])
+
+    def _to_score(self, score: float) -> float:
+        if self.distance_strategy == "l2":
+            return float(np.sqrt(max(-score, 0.0)))
+
+        return float(score)
+
+    def search_documents(
+        self,
+        query: str,
+        top_k: int = 4,
+        filters: Optional[MetadataFilters] = None,
+    ) -> List[DocumentWithScore]:
+        """
+        Performs a similarity search for the top-k most similar documents. The search is exact,
+        or approximate when the vector store has an `index` or a `quantizer`.
+
+        Scores are the cosine similarity or inner product (higher is closer), or the L2 distance
+        (lower is closer), depending on `distance_strategy`.
+
+        Args:
+            query (str): Query text.
+            top_k (int, optional): Number of top results to return. Defaults to `4`.
+            filters (MetadataFilters, optional): Metadata filters documents must match.
+
+        Returns:
+            List[DocumentWithScore]: List of the most similar documents.
+        """
+        query_embedding = self._prepare_query(
+            np.asarray(self._embed_model.get_text_embedding(query), dtype=np.float32)
+        )
+
+        with self._lock:
+            if not self._id_to_row or top_k <= 0:
+                return []
+
+            mask = self._get_filter_mask(filters) if filters is not None else None
+            rows = self._get_candidates(query_embedding, top_k, mask)
+            if rows is not None:
+                # Exact scores of the candidate rows, without deleted rows
+                scores = self._scores(query_embedding, rows)
+                live = scores > -np.inf
+                rows, scores = rows[live], scores[live]
+                k = min(top_k, len(rows))
+            else:
+                scores = self._scores(query_embedding)
+                rows = np.arange(len(scores))
+                k = min(top_k, len(self._id_to_row))
+
+            if not k:
+                return []
+
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            return [
+                DocumentWithScore(
+                    document=Document(
+                        id_=self._ids[row],
+                        text=self._get_text(row),
+                        metadata=self._get_metadata(row),
+                    ),
+                    score=self._to_score(scores[i]),
+                )
+                for row, i in zip(rows[top].tolist(), top)
+            ]
+
+    def get_all_documents(
+        self, include_fields: Optional[List[str]] = None
+    ) -> List[Document]:
+        """
+        Get all documents from vector store.
+
+        Args:
+            include_fields (List[str], optional): Fields to load, among `text`, `metadata` and `embedding`.
+                Defaults to all fields.
+        """
+        include = set(include_fields or ["text", "metadata", "embedding"])
+
+        with self._lock:
+            return [
+                Document(
+                    id_=self._ids[row],
+                    text=self._get_text(row) if "text" in include else "",
+                    metadata=self._get_metadata(row) if "metadata" in include else {},
+                    embedding=self._get_embedding(row)
+                    if "embedding" in include
+                    else None,
+                )
+                for row in self._id_to_row.values()
+            ]
+
+    def get_all_document_hashes(self) -> Tuple[List[str], List[str], List[str]]:
+        """Get all ref hashes from vector store."""
+        with self._lock:
+            rows = list(self._id_to_row.values())
+            metadatas = [self._get_metadata(row) for row in rows]
+
+            ids = [self._ids[row] for row in rows]
+
+        hashes = [metadata.get("hash") for metadata in metadatas]
+        ref_hashes = [metadata.get("ref_doc_hash") for metadata in metadatas]
+
+        return ids, hashes, ref_hashes
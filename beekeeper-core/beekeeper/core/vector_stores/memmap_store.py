@@ -0,0 +1,557 @@
+import json
+import os
+import threading
+import uuid
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+from beekeeper.core.document import Document
+from beekeeper.core.embeddings import BaseEmbedding
+from beekeeper.core.vector_stores.ann import BaseVectorIndex
+from beekeeper.core.vector_stores.local import BaseLocalVectorStore, DistanceStrategy
+from beekeeper.core.vector_stores.quantization import BaseQuantizer
+
+_FORMAT_VERSION = 1
+
+_MANIFEST_FILE = "manifest.json"
+_EMBEDDINGS_FILE = "embeddings.f32"
+_NORMS_FILE = "norms.f32"
+# Per row: text start, text end, metadata start, metadata end
+_OFFSETS_FILE = "offsets.i64"
+_TEXTS_FILE = "texts.bin"
+_METADATA_FILE = "metadata.jsonl"
+_IDS_FILE = "ids.txt"
+_TOMBSTONES_FILE = "tombstones.i64"
+_INDEX_FILE = "index.bin"
+_QUANTIZER_FILE = "quantizer.bin"
+_CODES_FILE = "codes.u8"
+
+
+class MemmapVectorStore(BaseLocalVectorStore):
+    """
+    Persistent vector store backed by memory-mapped files, with exact (brute-force) search.
+
+    The store is a directory holding a float32 embedding matrix opened with `np.memmap`,
+    and side files for IDs, texts and metadata. Opening a store only maps the matrix and
+    reads the IDs, so prebuilt stores load quickly and processes opening the same store
+    share the OS page cache.
+
+    Writes are append-only: replaced and deleted documents are tombstoned, and their
+    rows are reclaimed by `compact()`. The manifest is updated last, so a store interrupted
+    while writing is reopened at its last complete write.
+
+    With a `quantizer`, searches scan the quantization codes held in memory and only read the
+    embeddings of the re-ranked rows, so the matrix does not need to fit in memory.
+
+    Args:
+        embed_model (BaseEmbedding): Embedding model used to compute vectors.
+        path (str): Directory of the store, created if it does not exist.
+        distance_strategy (str, optional): Distance strategy for similarity search.
+            Currently supports `"cosine"`, `"ip"`, and `"l2"`. Defaults to `cosine`.
+            Existing stores keep the distance strategy they were created with.
+        read_only (bool, optional): Open the store in read-only mode. Defaults to `False`.
+        index (BaseVectorIndex, optional): Approximate nearest neighbour index, see
+            `beekeeper.core.vector_stores.ann`. It is loaded from the store when saved with
+            `save_index()`, otherwise built when the store is opened. Defaults to `None` (exact search).
+        quantizer (BaseQuantizer, optional): Embedding quantizer, see `beekeeper.core.vector_stores.quantization`.
+            It is saved and loaded with the index. Defaults to `None` (exact search).
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.vector_stores import MemmapVectorStore
+            from beekeeper.embeddings.huggingface import HuggingFaceEmbedding
+
+            embedding = HuggingFaceEmbedding()
+            vector_db = MemmapVectorStore(embed_model=embedding, path="./vector-store")
+    """
+
+    def __init__(
+        self,
+        embed_model: BaseEmbedding,
+        path: str,
+        distance_strategy: DistanceStrategy = "cosine",
+        read_only: bool = False,
+        index: Optional[BaseVectorIndex] = None,
+        quantizer: Optional[BaseQuantizer] = None,
+    ) -> None:
+        manifest_path = os.path.join(path, _MANIFEST_FILE)
+
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+
+            if manifest["format_version"] != _FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported store format version: {manifest['format_version']}."
+                )
+            distance_strategy = manifest["distance_strategy"]
+
+        elif read_only:
+            raise FileNotFoundError(f"No vector store found at '{path}'.")
+
+        else:
+            os.makedirs(path, exist_ok=True)
+            manifest = {
+                "format_version": _FORMAT_VERSION,
+                "distance_strategy": distance_strategy,
+                "generation": 0,
+                "dim": None,
+                "size": 0,
+                "texts_bytes": 0,
+                "metadata_bytes": 0,
+                "ids_bytes": 0,
+                "tombstones": 0,
+            }
+
+        super().__init__(
+            embed_model=embed_model,
+            distance_strategy=distance_strategy,
+            index=index,
+            quantizer=quantizer,
+        )
+
+        self.path = path
+        self.read_only = read_only
+
+        self._manifest = manifest
+        self._file_lock = threading.Lock()
+        self._texts_file = self._metadata_file = None
+        self._load()
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "MemmapVectorStore"
+
+    def _file(self, name: str, generation: Optional[int] = None) -> str:
+        """Path of a store file. Files are versioned by generation, incremented by `compact()`."""
+        if generation is None:
+            generation = self._manifest["generation"]
+
+        stem, ext = os.path.splitext(name)
+        return os.path.join(self.path, f"{stem}.{generation}{ext}")
+
+    def _write_manifest(self) -> None:
+        tmp_path = os.path.join(self.path, _MANIFEST_FILE + ".tmp")
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, os.path.join(self.path, _MANIFEST_FILE))
+
+    def _file_sizes(self) -> Dict[str, int]:
+        """Expected size, in bytes, of each file given the manifest."""
+        manifest = self._manifest
+        size, dim = manifest["size"], manifest["dim"] or 0
+
+        return {
+            _EMBEDDINGS_FILE: size * dim * 4,
+            _NORMS_FILE: size * 4,
+            _OFFSETS_FILE: size * 4 * 8,
+            _TEXTS_FILE: manifest["texts_bytes"],
+            _METADATA_FILE: manifest["metadata_bytes"],
+            _IDS_FILE: manifest["ids_bytes"],
+            _TOMBSTONES_FILE: manifest["tombstones"] * 8,
+        }
+
+    def _truncate_files(self) -> None:
+        """Drop partial writes, so appends start at the end of the last complete write."""
+        for name, size in self._file_sizes().items():
+            with open(self._file(name), "ab") as f:
+                f.truncate(size)
+
+    def _map(self, name: str, dtype: np.dtype, shape: Tuple[int, ...]) -> np.ndarray:
+        if not shape[0]:
+            return np.empty(shape, dtype=dtype)
+
+        return np.memmap(
+            self._file(name), dtype=dtype, mode="r", shape=shape, order="C"
+        )
+
+    def _load(self) -> None:
+        """Map the store files, ignoring data written after the last manifest update."""
+        if not self.read_only:
+            self._truncate_files()
+            self._write_manifest()
+
+        self._remap()
+
+        with self._lock:
+            ids_bytes = self._manifest["ids_bytes"]
+            if ids_bytes:
+                with open(self._file(_IDS_FILE), "rb") as f:
+                    self._ids = f.read(ids_bytes).decode("utf-8").split("\n")[:-1]
+            else:
+                self._ids = []
+
+            tombstones = self._map(
+                _TOMBSTONES_FILE, np.int64, (self._manifest["tombstones"],)
+            )
+            self._set_alive(np.ones(self._manifest["size"], dtype=bool))
+            self._alive[tombstones] = False
+
+            self._id_to_row = {}
+            for row in np.flatnonzero(self._alive).tolist():
+                self._id_to_row[self._ids[row]] = row
+
+            self._load_index()
+
+    def _load_index(self) -> None:
+        """Load the saved index and quantizer and catch up with later writes, or build them."""
+        if self.index is None and self.quantizer is None:
+            return
+
+        files = []
+        if self.index is not None:
+            files.append(_INDEX_FILE)
+        if self.quantizer is not None:
+            files.append(_QUANTIZER_FILE)
+
+        index_rows = self._manifest.get("index_rows")
+        if index_rows is None or not all(
+            os.path.exists(self._file(name)) for name in files
+        ):
+            self._rebuild_index()
+            return
+
+        if self.index is not None:
+            self.index.load(self._file(_INDEX_FILE))
+            self._index_remove(np.flatnonzero(~self._alive[:index_rows]).tolist())
+
+        if self.quantizer is not None:
+            self.quantizer.load(self._file(_QUANTIZER_FILE))
+            if self.quantizer.is_trained:
+                self._codes = np.load(self._file(_CODES_FILE))
+
+        rows = index_rows + np.flatnonzero(self._alive[index_rows:])
+        if len(rows):
+            self._index_add(rows, np.asarray(self._embeddings[rows]))
+
+    def save_index(self) -> None:
+        """
+        Save the index and quantizer in the store, so they are loaded instead of built when the
+        store is opened.
+        """
+        self._check_writable()
+
+        if self.index is None and self.quantizer is None:
+            raise ValueError("The vector store has no index or quantizer.")
+
+        with self._lock:
+            if self.index is not None:
+                self.index.save(self._file(_INDEX_FILE))
+
+            if self.quantizer is not None:
+                self.quantizer.save(self._file(_QUANTIZER_FILE))
+                if self._codes is not None:
+                    with open(self._file(_CODES_FILE), "wb") as f:
+                        np.save(f, self._codes[: self._manifest["size"]])
+
+            self._manifest["index_rows"] = self._manifest["size"]
+            self._write_manifest()
+
+    def _set_alive(self, alive: np.ndarray) -> None:
+        # `_alive` is a view of a buffer grown by doubling, so appends are amortized O(1)
+        self._alive_buffer = alive
+        self._alive = alive
+
+    def _grow_alive(self, num_rows: int) -> None:
+        """Append `num_rows` live rows to the alive mask."""
+        size = len(self._alive) + num_rows
+        if size > len(self._alive_buffer):
+            buffer = np.zeros(max(size, 2 * len(self._alive_buffer)), dtype=bool)
+            buffer[: len(self._alive)] = self._alive
+            self._alive_buffer = buffer
+
+        self._alive_buffer[len(self._alive) : size] = True
+        self._alive = self._alive_buffer[:size]
+
+    def _map_rows(self) -> None:
+        size, dim = self._manifest["size"], self._manifest["dim"] or 0
+
+        self._embeddings = self._map(_EMBEDDINGS_FILE, np.float32, (size, dim))
+        self._norms = self._map(_NORMS_FILE, np.float32, (size,))
+        self._offsets = self._map(_OFFSETS_FILE, np.int64, (size, 4))
+        self._mapped_size = size
+
+    def _ensure_mapped(self) -> None:
+        """Map rows appended since the last read. Appends don't remap, so writes stay cheap."""
+        if self._mapped_size != self._manifest["size"]:
+            self._map_rows()
+
+    def _remap(self) -> None:
+        """Map the row files and reopen the text and metadata files of the current generation."""
+        self._map_rows()
+
+        with self._file_lock:
+            for f in (self._texts_file, self._metadata_file):
+                if f is not None:
+                    f.close()
+
+            self._texts_file = open(self._file(_TEXTS_FILE), "rb")
+            self._metadata_file = open(self._file(_METADATA_FILE), "rb")
+
+    def _get_rows(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        self._ensure_mapped()
+        return self._embeddings, self._norms, self._alive
+
+    def _read(self, f: BinaryIO, start: int, end: int) -> bytes:
+        with self._file_lock:
+            f.seek(start)
+            return f.read(end - start)
+
+    def _get_text_bytes(self, row: int) -> bytes:
+        self._ensure_mapped()
+        start, end = self._offsets[row, 0:2]
+        return self._read(self._texts_file, start, end)
+
+    def _get_metadata_bytes(self, row: int) -> bytes:
+        self._ensure_mapped()
+        start, end = self._offsets[row, 2:4]
+        return self._read(self._metadata_file, start, end)
+
+    def _get_text(self, row: int) -> str:
+        return self._get_text_bytes(row).decode("utf-8")
+
+    def _get_metadata(self, row: int) -> Dict[str, Any]:
+        return json.loads(self._get_metadata_bytes(row))
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise PermissionError("The vector store is opened in read-only mode.")
+
+    def _append(self, name: str, data: bytes) -> None:
+        with open(self._file(name), "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _commit(self, data: Dict[str, bytes], manifest_updates: Dict[str, Any]) -> None:
+        """
+        Append to the store files and commit the write in the manifest. If any step fails, the
+        files are truncated back to the previous manifest, so later appends stay aligned.
+        """
+        manifest = dict(self._manifest)
+
+        try:
+            for name, file_data in data.items():
+                self._append(name, file_data)
+
+            self._manifest.update(manifest_updates)
+            self._write_manifest()
+        except BaseException:
+            self._manifest = manifest
+            self._truncate_files()
+            raise
+
+    def _get_live_rows(self, ids: List[str]) -> List[int]:
+        return [
+            self._id_to_row[id_] for id_ in dict.fromkeys(ids) if id_ in self._id_to_row
+        ]
+
+    def _tombstone(self, ids: List[str], rows: List[int]) -> None:
+        """Mark rows as deleted in memory, once their tombstones are written."""
+        for id_ in ids:
+            self._id_to_row.pop(id_, None)
+        self._alive[rows] = False
+        self._index_remove(rows)
+
+    def add_documents(self, documents: List[Document]) -> List[str]:
+        """
+        Append documents to the vector store. Documents with an existing ID are replaced.
+
+        Args:
+            documents (List[Document]): List of documents to add to the vector store.
+        """
+        self._check_writable()
+
+        if not documents:
+            return []
+
+        embeddings, norms = self._prepare_embeddings(self._get_embeddings(documents))
+        ids = [doc.id_ if doc.id_ else str(uuid.uuid4()) for doc in documents]
+
+        if any("\n" in id_ for id_ in ids):
+            raise ValueError("Document IDs must not contain newlines.")
+
+        with self._lock:
+            manifest = self._manifest
+            if manifest["dim"] is not None and manifest["dim"] != embeddings.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension mismatch: expected {manifest['dim']}, got {embeddings.shape[1]}."
+                )
+
+            # Replace documents already stored, and duplicates within the batch
+            last_index = {id_: i for i, id_ in enumerate(ids)}
+            keep = [i for i, id_ in enumerate(ids) if last_index[id_] == i]
+            tombstones = self._get_live_rows(ids)
+
+            texts, metadatas, offsets = [], [], []
+            texts_bytes, metadata_bytes = (
+                manifest["texts_bytes"],
+                manifest["metadata_bytes"],
+            )
+
+            for i in keep:
+                doc = documents[i]
+                text = doc.get_content().encode("utf-8")
+                metadata = (
+                    json.dumps({**doc.get_metadata(), "hash": doc.hash}) + "\n"
+                ).encode("utf-8")
+
+                offsets.append(
+                    [
+                        texts_bytes,
+                        texts_bytes + len(text),
+                        metadata_bytes,
+                        metadata_bytes + len(metadata),
+                    ]
+                )
+                texts.append(text)
+                metadatas.append(metadata)
+                texts_bytes += len(text)
+                metadata_bytes += len(metadata)
+
+            ids_data = "".join(ids[i] + "\n" for i in keep).encode("utf-8")
+
+            start = manifest["size"]
+            self._commit(
+                {
+                    _EMBEDDINGS_FILE: embeddings[keep].tobytes(),
+                    _NORMS_FILE: norms[keep].tobytes(),
+                    _OFFSETS_FILE: np.asarray(offsets, dtype=np.int64).tobytes(),
+                    _TEXTS_FILE: b"".join(texts),
+                    _METADATA_FILE: b"".join(metadatas),
+                    _IDS_FILE: ids_data,
+                    _TOMBSTONES_FILE: np.asarray(tombstones, dtype=np.int64).tobytes(),
+                },
+                {
+                    "dim": int(embeddings.shape[1]),
+                    "size": start + len(keep),
+                    "texts_bytes": texts_bytes,
+                    "metadata_bytes": metadata_bytes,
+                    "ids_bytes": manifest["ids_bytes"] + len(ids_data),
+                    "tombstones": manifest["tombstones"] + len(tombstones),
+                },
+            )
+
+            # Memory is only updated once the write is committed
+            self._tombstone(ids, tombstones)
+            self._grow_alive(len(keep))
+            for row, i in enumerate(keep, start):
+                self._ids.append(ids[i])
+                self._id_to_row[ids[i]] = row
+
+            self._index_add(np.arange(start, start + len(keep)), embeddings[keep])
+
+        return ids
+
+    def delete_documents(self, ids: List[str]) -> None:
+        """
+        Delete documents from the vector store. Rows are reclaimed by `compact()`.
+
+        Args:
+            ids (List[str]): List of `Document` IDs to delete.
+        """
+        self._check_writable()
+
+        with self._lock:
+            tombstones = self._get_live_rows(ids)
+            if not tombstones:
+                return
+
+            self._commit(
+                {_TOMBSTONES_FILE: np.asarray(tombstones, dtype=np.int64).tobytes()},
+                {"tombstones": self._manifest["tombstones"] + len(tombstones)},
+            )
+            self._tombstone(ids, tombstones)
+
+    def compact(self) -> None:
+        """
+        Rewrite the store without deleted rows.
+
+        The compacted files are written as a new generation, committed by the manifest update.
+        Processes that already opened the store keep reading the previous files until they
+        reopen it.
+        """
+        self._check_writable()
+
+        with self._lock:
+            rows = np.flatnonzero(self._alive)
+            if len(rows) == self._manifest["size"]:
+                return
+
+            texts = [self._get_text_bytes(row) for row in rows.tolist()]
+            metadatas = [self._get_metadata_bytes(row) for row in rows.tolist()]
+
+            text_lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(rows))
+            metadata_lengths = np.fromiter(
+                map(len, metadatas), dtype=np.int64, count=len(rows)
+            )
+            text_ends = np.cumsum(text_lengths)
+            metadata_ends = np.cumsum(metadata_lengths)
+            offsets = np.stack(
+                [
+                    text_ends - text_lengths,
+                    text_ends,
+                    metadata_ends - metadata_lengths,
+                    metadata_ends,
+                ],
+                axis=1,
+            )
+
+            ids = [self._ids[row] for row in rows.tolist()]
+            ids_data = "".join(id_ + "\n" for id_ in ids).encode("utf-8")
+
+            files = {
+                _EMBEDDINGS_FILE: np.ascontiguousarray(
+                    self._embeddings[rows]
+                ).tobytes(),
+                _NORMS_FILE: np.ascontiguousarray(self._norms[rows]).tobytes(),
+                _OFFSETS_FILE: offsets.astype(np.int64).tobytes(),
+                _TEXTS_FILE: b"".join(texts),
+                _METADATA_FILE: b"".join(metadatas),
+                _IDS_FILE: ids_data,
+                _TOMBSTONES_FILE: b"",
+            }
+
+            # Write the next generation, committed by the manifest update
+            generation = self._manifest["generation"]
+            for name, data in files.items():
+                with open(self._file(name, generation + 1), "wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            self._manifest.update(
+                generation=generation + 1,
+                size=len(rows),
+                texts_bytes=int(text_ends[-1]) if len(rows) else 0,
+                metadata_bytes=int(metadata_ends[-1]) if len(rows) else 0,
+                ids_bytes=len(ids_data),
+                tombstones=0,
+            )
+            # Rows are renumbered, a saved index is outdated
+            self._manifest.pop("index_rows", None)
+            self._write_manifest()
+
+            self._remap()
+            self._ids = ids
+            self._set_alive(np.ones(len(rows), dtype=bool))
+            self._id_to_row = {id_: row for row, id_ in enumerate(ids)}
+            self._rebuild_index()
+
+            for name in [
+                *files,
+                _INDEX_FILE,
+                _INDEX_FILE + ".json",
+                _QUANTIZER_FILE,
+                _CODES_FILE,
+            ]:
+                try:
+                    os.remove(self._file(name, generation))
+                except OSError:
+                    # Missing, or still opened elsewhere (Windows)
+                    pass
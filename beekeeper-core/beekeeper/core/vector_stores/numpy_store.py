@@ -0,0 +1,213 @@
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from beekeeper.core.document import Document
+from beekeeper.core.embeddings import BaseEmbedding
+from beekeeper.core.vector_stores.ann import BaseVectorIndex
+from beekeeper.core.vector_stores.local import BaseLocalVectorStore, DistanceStrategy
+from beekeeper.core.vector_stores.quantization import BaseQuantizer
+
+
+class NumpyVectorStore(BaseLocalVectorStore):
+    """
+    In-process vector store with exact (brute-force) search, backed by NumPy.
+
+    Embeddings are kept in a contiguous float32 matrix that grows by doubling. With the
+    `cosine` distance strategy, rows are normalized when added so a search is one
+    matrix-vector product followed by a partial sort. Deleted rows are tombstoned and
+    reclaimed once they exceed `compaction_threshold` of the stored rows. For large stores,
+    an ANN `index` restricts searches to candidate rows.
+
+    Args:
+        embed_model (BaseEmbedding): Embedding model used to compute vectors.
+        distance_strategy (str, optional): Distance strategy for similarity search.
+            Currently supports `"cosine"`, `"ip"`, and `"l2"`. Defaults to `cosine`.
+        initial_capacity (int, optional): Number of rows preallocated on first insert. Defaults to ``1024``.
+        compaction_threshold (float, optional): Fraction of deleted rows that triggers a compaction.
+            Defaults to ``0.25``.
+        index (BaseVectorIndex, optional): Approximate nearest neighbour index, see
+            `beekeeper.core.vector_stores.ann`. Defaults to `None` (exact search).
+        quantizer (BaseQuantizer, optional): Embedding quantizer, see `beekeeper.core.vector_stores.quantization`.
+            Searches scan the codes, but embeddings are kept in memory for re-ranking; use
+            `MemmapVectorStore` to keep them on disk. Defaults to `None` (exact search).
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.vector_stores import NumpyVectorStore
+            from beekeeper.embeddings.huggingface import HuggingFaceEmbedding
+
+            embedding = HuggingFaceEmbedding()
+            vector_db = NumpyVectorStore(embed_model=embedding)
+    """
+
+    def __init__(
+        self,
+        embed_model: BaseEmbedding,
+        distance_strategy: DistanceStrategy = "cosine",
+        initial_capacity: int = 1024,
+        compaction_threshold: float = 0.25,
+        index: Optional[BaseVectorIndex] = None,
+        quantizer: Optional[BaseQuantizer] = None,
+    ) -> None:
+        super().__init__(
+            embed_model=embed_model,
+            distance_strategy=distance_strategy,
+            index=index,
+            quantizer=quantizer,
+        )
+
+        self.initial_capacity = max(1, initial_capacity)
+        self.compaction_threshold = compaction_threshold
+
+        self._embeddings: Optional[np.ndarray] = None
+        self._norms = np.empty(0, dtype=np.float32)
+        self._alive = np.empty(0, dtype=bool)
+        self._size = 0
+        self._deleted = 0
+
+        self._texts: List[Optional[str]] = []
+        self._metadatas: List[Optional[Dict[str, Any]]] = []
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "NumpyVectorStore"
+
+    def _get_rows(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._embeddings is None:
+            return np.empty((0, 0), dtype=np.float32), self._norms, self._alive
+
+        return (
+            self._embeddings[: self._size],
+            self._norms[: self._size],
+            self._alive[: self._size],
+        )
+
+    def _get_text(self, row: int) -> str:
+        return self._texts[row]
+
+    def _get_metadata(self, row: int) -> Dict[str, Any]:
+        return self._metadatas[row]
+
+    def _reserve(self, num_rows: int, dim: int) -> None:
+        """Ensure capacity for `num_rows` more rows, doubling the matrix as needed."""
+        if self._embeddings is None:
+            capacity = max(self.initial_capacity, num_rows)
+            self._embeddings = np.empty((capacity, dim), dtype=np.float32)
+            self._norms = np.empty(capacity, dtype=np.float32)
+            self._alive = np.zeros(capacity, dtype=bool)
+            return
+
+        if self._embeddings.shape[1] != dim:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {self._embeddings.shape[1]}, got {dim}."
+            )
+
+        required = self._size + num_rows
+        capacity = self._embeddings.shape[0]
+        if required <= capacity:
+            return
+
+        while capacity < required:
+            capacity *= 2
+
+        embeddings = np.empty((capacity, dim), dtype=np.float32)
+        embeddings[: self._size] = self._embeddings[: self._size]
+        norms = np.empty(capacity, dtype=np.float32)
+        norms[: self._size] = self._norms[: self._size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self._size] = self._alive[: self._size]
+
+        self._embeddings, self._norms, self._alive = embeddings, norms, alive
+
+    def _delete_rows(self, ids: List[str]) -> None:
+        rows = []
+        for id_ in ids:
+            row = self._id_to_row.pop(id_, None)
+            if row is None:
+                continue
+
+            self._alive[row] = False
+            self._ids[row] = self._texts[row] = self._metadatas[row] = None
+            rows.append(row)
+
+        self._deleted += len(rows)
+        self._index_remove(rows)
+
+    def add_documents(self, documents: List[Document]) -> List[str]:
+        """
+        Add documents to the vector store. Documents with an existing ID are replaced.
+
+        Args:
+            documents (List[Document]): List of documents to add to the vector store.
+        """
+        if not documents:
+            return []
+
+        embeddings, norms = self._prepare_embeddings(self._get_embeddings(documents))
+
+        ids = [doc.id_ if doc.id_ else str(uuid.uuid4()) for doc in documents]
+
+        with self._lock:
+            # Replace documents already stored, and duplicates within the batch
+            self._delete_rows(ids)
+            last_index = {id_: i for i, id_ in enumerate(ids)}
+            keep = [i for i, id_ in enumerate(ids) if last_index[id_] == i]
+
+            self._reserve(len(keep), embeddings.shape[1])
+            start, end = self._size, self._size + len(keep)
+
+            self._embeddings[start:end] = embeddings[keep]
+            self._norms[start:end] = norms[keep]
+            self._alive[start:end] = True
+
+            for row, i in enumerate(keep, start):
+                doc = documents[i]
+                self._ids.append(ids[i])
+                self._texts.append(doc.get_content())
+                self._metadatas.append({**doc.get_metadata(), "hash": doc.hash})
+                self._id_to_row[ids[i]] = row
+
+            self._size = end
+            self._index_add(np.arange(start, end), embeddings[keep])
+
+        return ids
+
+    def delete_documents(self, ids: List[str]) -> None:
+        """
+        Delete documents from the vector store.
+
+        Args:
+            ids (List[str]): List of `Document` IDs to delete.
+        """
+        with self._lock:
+            self._delete_rows(ids)
+
+            if self._size and self._deleted / self._size > self.compaction_threshold:
+                self.compact()
+
+    def compact(self) -> None:
+        """Reclaim the rows of deleted documents."""
+        with self._lock:
+            if not self._deleted:
+                return
+
+            rows = np.flatnonzero(self._alive[: self._size])
+            size = len(rows)
+
+            self._embeddings[:size] = self._embeddings[rows]
+            self._norms[:size] = self._norms[rows]
+            self._alive[:size] = True
+            self._alive[size : self._size] = False
+
+            self._ids = [self._ids[row] for row in rows]
+            self._texts = [self._texts[row] for row in rows]
+            self._metadatas = [self._metadatas[row] for row in rows]
+            self._id_to_row = {id_: row for row, id_ in enumerate(self._ids)}
+
+            self._size = size
+            self._deleted = 0
+
+            # Rows are renumbered
+            self._rebuild_index()
@@ -0,0 +1,338 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
+from beekeeper.core.vector_stores.ann import IndexMetric
+
+
+class BaseQuantizer(ABC):
+    """
+    An interface for embedding quantizers used by local vector stores.
+
+    Quantizers compress each embedding into a short `uint8` code. A search scores the codes
+    against the float query (asymmetric distance), then the vector store re-scores the best
+    `rerank_pool` rows exactly against its stored embeddings. The store sets `metric` as for
+    ANN indexes: ``"ip"`` for the `cosine` and `ip` distance strategies, ``"l2"`` otherwise.
+
+    Args:
+        rerank_pool (int, optional): Number of rows re-scored exactly per search, at least `top_k`.
+            Defaults to ``100``.
+    """
+
+    metric: IndexMetric = "ip"
+
+    # Number of codes scored per batch, bounding temporary memory
+    _score_batch_size = 65536
+
+    def __init__(self, rerank_pool: int = 100) -> None:
+        self.rerank_pool = rerank_pool
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "BaseQuantizer"
+
+    @property
+    @abstractmethod
+    def is_trained(self) -> bool:
+        """Whether the quantizer can encode embeddings."""
+
+    @property
+    @abstractmethod
+    def train_size(self) -> int:
+        """Number of rows the vector store collects before training the quantizer."""
+
+    @abstractmethod
+    def train(self, embeddings: np.ndarray) -> None:
+        """Train the quantizer on a sample of embeddings."""
+
+    @abstractmethod
+    def encode(self, embeddings: np.ndarray) -> np.ndarray:
+        """Return the `uint8` codes of the embeddings, one row per embedding."""
+
+    @abstractmethod
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Return the approximate float32 embeddings of the codes."""
+
+    def score(self, query_embedding: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        """Return the approximate similarity of the query to each code, higher is closer."""
+        scores = np.empty(len(codes), dtype=np.float32)
+
+        for start in range(0, len(codes), self._score_batch_size):
+            decoded = self.decode(codes[start : start + self._score_batch_size])
+            if self.metric == "l2":
+                batch_scores = -((decoded - query_embedding) ** 2).sum(axis=1)
+            else:
+                batch_scores = decoded @ query_embedding
+            scores[start : start + len(decoded)] = batch_scores
+
+        return scores
+
+    @abstractmethod
+    def save(self, path: str) -> None:
+        """Save the trained parameters to `path`."""
+
+    @abstractmethod
+    def load(self, path: str) -> None:
+        """Load the trained parameters from `path`."""
+
+
+class ScalarQuantizer(BaseQuantizer):
+    """
+    8-bit scalar quantizer, 4x smaller than float32 embeddings.
+
+    Each dimension is mapped linearly to 256 levels between the minimum and maximum value
+    seen during training. Values outside this range are clipped.
+
+    Args:
+        train_size (int, optional): Number of rows required to train the quantizer. Defaults to ``1000``.
+        rerank_pool (int, optional): Number of rows re-scored exactly per search, at least `top_k`.
+            Defaults to ``100``.
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.vector_stores import MemmapVectorStore
+            from beekeeper.core.vector_stores.quantization import ScalarQuantizer
+
+            vector_db = MemmapVectorStore(
+                embed_model=embedding, path="./vectors", quantizer=ScalarQuantizer()
+            )
+    """
+
+    def __init__(self, train_size: int = 1000, rerank_pool: int = 100) -> None:
+        super().__init__(rerank_pool=rerank_pool)
+        self._train_size = train_size
+
+        self._min: Optional[np.ndarray] = None
+        self._scale: Optional[np.ndarray] = None
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "ScalarQuantizer"
+
+    @property
+    def is_trained(self) -> bool:
+        return self._min is not None
+
+    @property
+    def train_size(self) -> int:
+        return max(self._train_size, 1)
+
+    def train(self, embeddings: np.ndarray) -> None:
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if not len(embeddings):
+            return
+
+        self._min = embeddings.min(axis=0)
+        # Constant dimensions get a unit scale, every value encodes to 0
+        scale = (embeddings.max(axis=0) - self._min) / 255
+        self._scale = np.where(scale > 0, scale, 1).astype(np.float32)
+
+    def encode(self, embeddings: np.ndarray) -> np.ndarray:
+        levels = (np.asarray(embeddings, dtype=np.float32) - self._min) / self._scale
+        return np.clip(np.rint(levels), 0, 255).astype(np.uint8)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return codes * self._scale + self._min
+
+    def score(self, query_embedding: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        if self.metric == "l2":
+            return super().score(query_embedding, codes)
+
+        # q.x = q.min + (q * scale).code, without decoding the codes
+        scaled_query = query_embedding * self._scale
+        offset = float(query_embedding @ self._min)
+        scores = np.empty(len(codes), dtype=np.float32)
+
+        for start in range(0, len(codes), self._score_batch_size):
+            batch = codes[start : start + self._score_batch_size]
+            scores[start : start + len(batch)] = (
+                batch.astype(np.float32) @ scaled_query + offset
+            )
+
+        return scores
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                min=self._min if self.is_trained else np.empty(0, dtype=np.float32),
+                scale=self._scale if self.is_trained else np.empty(0, dtype=np.float32),
+            )
+
+    def load(self, path: str) -> None:
+        with np.load(path) as data:
+            self._min = data["min"] if data["min"].size else None
+            self._scale = data["scale"] if data["scale"].size else None
+
+
+class ProductQuantizer(BaseQuantizer):
+    """
+    Product quantizer (PQ) with trained codebooks, ``4 * subvector_dim`` times smaller than
+    float32 embeddings.
+
+    Embeddings are split into subvectors of `subvector_dim` dimensions, and each subvector is
+    replaced by the closest of 256 centroids learned with k-means, stored as one byte. A search
+    computes the query distance to every centroid once, then sums table lookups per code.
+
+    Args:
+        subvector_dim (int, optional): Number of dimensions per subvector, must divide the embedding
+            dimension. Lower values improve recall at the cost of memory. Defaults to ``8`` (32x smaller).
+        train_size (int, optional): Number of rows required to train the codebooks. Defaults to ``10000``.
+        n_iter (int, optional): Number of k-means iterations. Defaults to ``20``.
+        seed (int, optional): Random seed used for k-means. Defaults to ``0``.
+        rerank_pool (int, optional): Number of rows re-scored exactly per search, at least `top_k`.
+            Defaults to ``100``.
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.vector_stores import MemmapVectorStore
+            from beekeeper.core.vector_stores.quantization import ProductQuantizer
+
+            vector_db = MemmapVectorStore(
+                embed_model=embedding,
+                path="./vectors",
+                quantizer=ProductQuantizer(subvector_dim=4, rerank_pool=200),
+            )
+    """
+
+    # Number of centroids per subvector, so that a code fits in one byte
+    _n_centroids = 256
+    # Maximum number of embeddings sampled for k-means
+    _max_samples = 65536
+
+    def __init__(
+        self,
+        subvector_dim: int = 8,
+        train_size: int = 10000,
+        n_iter: int = 20,
+        seed: int = 0,
+        rerank_pool: int = 100,
+    ) -> None:
+        super().__init__(rerank_pool=rerank_pool)
+        self.subvector_dim = subvector_dim
+        self.n_iter = n_iter
+        self.seed = seed
+        self._train_size = train_size
+
+        # Shape (n_subvectors, 256, subvector_dim)
+        self._codebooks: Optional[np.ndarray] = None
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "ProductQuantizer"
+
+    @property
+    def is_trained(self) -> bool:
+        return self._codebooks is not None
+
+    @property
+    def train_size(self) -> int:
+        return max(self._train_size, self._n_centroids)
+
+    def _split(self, embeddings: np.ndarray) -> np.ndarray:
+        """Return the embeddings as shape (n_subvectors, rows, subvector_dim)."""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        dim = embeddings.shape[1]
+        if dim % self.subvector_dim:
+            raise ValueError(
+                f"Embedding dimension {dim} is not divisible by subvector_dim {self.subvector_dim}."
+            )
+
+        return embeddings.reshape(len(embeddings), -1, self.subvector_dim).transpose(
+            1, 0, 2
+        )
+
+    @staticmethod
+    def _nearest(subvectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Return the closest centroid of each subvector (L2 distance)."""
+        distances = (centroids**2).sum(axis=1) - 2 * (subvectors @ centroids.T)
+        return distances.argmin(axis=1)
+
+    def train(self, embeddings: np.ndarray) -> None:
+        if len(embeddings) < self._n_centroids:
+            return
+
+        rng = np.random.default_rng(self.seed)
+        num_samples = min(len(embeddings), self._max_samples)
+        samples = self._split(
+            embeddings[np.sort(rng.choice(len(embeddings), num_samples, replace=False))]
+        )
+
+        codebooks = []
+        for subvectors in samples:
+            subvectors = np.ascontiguousarray(subvectors)
+            centroids = subvectors[
+                rng.choice(num_samples, self._n_centroids, replace=False)
+            ]
+
+            for _ in range(self.n_iter):
+                assignments = self._nearest(subvectors, centroids)
+
+                counts = np.bincount(assignments, minlength=self._n_centroids)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, assignments, subvectors)
+
+                # Empty clusters keep their previous centroid
+                non_empty = counts > 0
+                centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+
+            codebooks.append(centroids)
+
+        self._codebooks = np.stack(codebooks)
+
+    def encode(self, embeddings: np.ndarray) -> np.ndarray:
+        subvectors = self._split(embeddings)
+        codes = np.empty((subvectors.shape[1], len(subvectors)), dtype=np.uint8)
+
+        for i, centroids in enumerate(self._codebooks):
+            codes[:, i] = self._nearest(subvectors[i], centroids)
+
+        return codes
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        n_subvectors = self._codebooks.shape[0]
+        decoded = self._codebooks[np.arange(n_subvectors), codes]
+
+        return decoded.reshape(len(codes), -1)
+
+    def score(self, query_embedding: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        query = self._split(query_embedding[None, :])[:, 0, :]
+
+        # Similarity of each query subvector to each centroid
+        if self.metric == "l2":
+            tables = -((self._codebooks - query[:, None, :]) ** 2).sum(axis=2)
+        else:
+            tables = np.einsum("mkd,md->mk", self._codebooks, query)
+
+        scores = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), self._score_batch_size):
+            batch = codes[start : start + self._score_batch_size]
+            batch_scores = np.zeros(len(batch), dtype=np.float32)
+            for i, table in enumerate(tables):
+                batch_scores += table[batch[:, i]]
+            scores[start : start + len(batch)] = batch_scores
+
+        return scores
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                codebooks=(
+                    self._codebooks
+                    if self.is_trained
+                    else np.empty((0, 0, 0), dtype=np.float32)
+                ),
+            )
+
+    def load(self, path: str) -> None:
+        with np.load(path) as data:
+            codebooks = data["codebooks"]
+            if codebooks.size and codebooks.shape[2] != self.subvector_dim:
+                raise ValueError(
+                    f"Quantizer subvector_dim mismatch: expected {self.subvector_dim}, got {codebooks.shape[2]}."
+                )
+
+            self._codebooks = codebooks if codebooks.size else None
@@ -0,0 +1,140 @@
+from enum import Enum
+from typing import Any, Dict, List, Set, Union
+
+from pydantic import BaseModel, Field, model_validator
+
+MetadataValue = Union[bool, int, float, str]
+
+
+class FilterOperator(str, Enum):
+    EQ = "=="
+    NE = "!="
+    GT = ">"
+    GTE = ">="
+    LT = "<"
+    LTE = "<="
+    IN = "in"
+    NIN = "nin"
+
+
+class FilterCondition(str, Enum):
+    AND = "and"
+    OR = "or"
+
+
+def compare_metadata_value(
+    operator: FilterOperator, stored: Any, value: Union[MetadataValue, List]
+) -> bool:
+    """
+    Compare a single stored metadata value with a filter value.
+
+    `NE` and `NIN` compare like `EQ` and `IN`, negation is left to the caller, which also
+    requires the key to be set. Values of different types never match a range operator.
+    """
+    operator = FilterOperator(operator)
+
+    if operator in (FilterOperator.EQ, FilterOperator.NE):
+        return stored == value
+
+    if operator in (FilterOperator.IN, FilterOperator.NIN):
+        return stored in value
+
+    # Booleans are ints in Python, but not comparable values here
+    if isinstance(stored, bool) != isinstance(value, bool):
+        return False
+
+    try:
+        if operator == FilterOperator.GT:
+            return stored > value
+        if operator == FilterOperator.GTE:
+            return stored >= value
+        if operator == FilterOperator.LT:
+            return stored < value
+        return stored <= value
+    except TypeError:
+        return False
+
+
+class MetadataFilter(BaseModel):
+    """
+    Condition on a metadata key.
+
+    `NE` and `NIN` only match documents where the key is set. When the stored value is a list,
+    the document matches if any of its elements matches, and `NE` and `NIN` match if none does.
+    """
+
+    key: str
+    value: Union[MetadataValue, List[MetadataValue]]
+    operator: FilterOperator = Field(default=FilterOperator.EQ)
+
+    @model_validator(mode="after")
+    def _check_value(self) -> "MetadataFilter":
+        is_list_operator = self.operator in (FilterOperator.IN, FilterOperator.NIN)
+        if is_list_operator != isinstance(self.value, list):
+            raise ValueError(
+                f"Operator '{self.operator.value}' requires a "
+                f"{'list' if is_list_operator else 'single'} value."
+            )
+
+        return self
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        """Whether a document metadata matches the filter."""
+        if self.key not in metadata:
+            return False
+
+        stored = metadata[self.key]
+        values = stored if isinstance(stored, list) else [stored]
+        matched = any(
+            compare_metadata_value(self.operator, v, self.value) for v in values
+        )
+
+        if self.operator in (FilterOperator.NE, FilterOperator.NIN):
+            return not matched
+
+        return matched
+
+
+class MetadataFilters(BaseModel):
+    """
+    Backend-neutral metadata filter expression, combining filters and nested expressions.
+
+    Example:
+        .. code-block:: python
+
+            from beekeeper.core.vector_stores import MetadataFilter, MetadataFilters
+
+            filters = MetadataFilters(
+                filters=[
+                    MetadataFilter(key="source", value="handbook.pdf"),
+                    MetadataFilters(
+                        filters=[
+                            MetadataFilter(key="year", value=2024, operator=">="),
+                            MetadataFilter(key="pinned", value=True),
+                        ],
+                        condition="or",
+                    ),
+                ]
+            )
+            vector_db.search_documents("What's Beekeeper?", filters=filters)
+    """
+
+    filters: List[Union[MetadataFilter, "MetadataFilters"]]
+    condition: FilterCondition = Field(default=FilterCondition.AND)
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        """Whether a document metadata matches the expression."""
+        results = (f.matches(metadata) for f in self.filters)
+
+        if self.condition == FilterCondition.OR:
+            return any(results)
+
+        return all(results)
+
+    def get_keys(self) -> Set[str]:
+        """Return the metadata keys used by the expression."""
+        keys = set()
+        for f in self.filters:
+            keys |= f.get_keys() if isinstance(f, MetadataFilters) else {f.key}
+
+        return keys
@@ -0,0 +1,43 @@
+"""
+Benchmark `extract_template_vars` on RAG prompts with multi-KB contexts.
+
+Times a matching input and a mismatching input (the prompt was truncated, so the
+template's trailing literal is missing) for growing context sizes.
+
+Usage:
+    python benchmarks/extract_template_vars.py
+"""
+
+import timeit
+
+from beekeeper.core.prompts.utils import extract_template_vars
+
+TEMPLATE = (
+    "Answer the question using the context below.\n\n"
+    "Context:\n{context}\n\nQuestion: {question}\nAnswer:"
+)
+
+
+def run(context_size: int, number: int = 200) -> dict:
+    sentence = "Bees collect nectar: the hive stores it as honey.\n"
+    context = sentence * (context_size // len(sentence) + 1)
+    prompt = TEMPLATE.format(context=context[:context_size], question="Why?")
+
+    return {
+        name: timeit.timeit(
+            lambda text=text: extract_template_vars(TEMPLATE, text), number=number
+        )
+        / number
+        for name, text in (("match", prompt), ("mismatch", prompt[:-1]))
+    }
+
+
+if __name__ == "__main__":
+    print(f"{'context (KB)':>12} {'match (us)':>11} {'mismatch (us)':>14}")
+
+    for context_size in (1_000, 4_000, 16_000, 64_000):
+        timings = run(context_size)
+        print(
+            f"{context_size // 1000:>12} {timings['match'] * 1e6:>11.1f} "
+            f"{timings['mismatch'] * 1e6:>14.1f}"
+        )
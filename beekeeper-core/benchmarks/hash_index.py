@@ -0,0 +1,58 @@
+"""
+Benchmark the de-duplication steps of an ingestion run against growing numbers of
+stored hashes, up to 1M.
+
+Each run builds a `HashIndex` from the stored hashes, checks an incoming batch where
+half of the documents are already stored, then collects the stale stored documents as
+`DocStrategy.DUPLICATE_AND_DELETE` does. Time per stored hash should stay flat.
+
+Usage:
+    python benchmarks/hash_index.py
+"""
+
+import time
+
+from beekeeper.core.flows.hash_index import HashIndex
+
+
+def run(num_stored: int) -> dict:
+    ids = [f"doc-{i}" for i in range(num_stored)]
+    hashes = [f"hash-{i}" for i in range(num_stored)]
+    # Half of the incoming documents are already stored, half are new
+    incoming = [f"hash-{i}" for i in range(num_stored // 2, num_stored * 3 // 2)]
+
+    start = time.perf_counter()
+    index = HashIndex(ids, hashes, use_ref_hash=False)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current_hashes = set()
+    new_documents = 0
+    for hash_ in incoming:
+        current_hashes.add(hash_)
+        if hash_ not in index:
+            new_documents += 1
+    check = time.perf_counter() - start
+
+    start = time.perf_counter()
+    stale = index.stale_ids(current_hashes)
+    index.remove(stale)
+    delete = time.perf_counter() - start
+
+    assert new_documents == len(stale) == num_stored // 2
+
+    return {"build": build, "check": check, "delete": delete}
+
+
+if __name__ == "__main__":
+    print(
+        f"{'stored':>10} {'build (s)':>10} {'check (s)':>10} {'delete (s)':>11} {'per hash (us)':>14}"
+    )
+
+    for num_stored in (10_000, 100_000, 1_000_000):
+        timings = run(num_stored)
+        total = sum(timings.values())
+        print(
+            f"{num_stored:>10} {timings['build']:>10.3f} {timings['check']:>10.3f} "
+            f"{timings['delete']:>11.3f} {total / num_stored * 1e6:>14.2f}"
+        )
@@ -0,0 +1,33 @@
+"""
+Benchmark `merge_splits` on growing numbers of splits.
+
+Character-fallback splits of long texts without separators produce one split per
+character, the worst case for merging. Time per split should stay flat as the number
+of splits grows.
+
+Usage:
+    python benchmarks/merge_splits.py
+"""
+
+import time
+
+from beekeeper.core.text_chunkers.utils import merge_splits
+
+
+def run(num_splits: int, chunk_size: int = 512, chunk_overlap: int = 256) -> float:
+    splits = [
+        {"text": "x", "is_sentence": False, "token_size": 1} for _ in range(num_splits)
+    ]
+
+    start = time.perf_counter()
+    merge_splits(splits, chunk_size, chunk_overlap)
+
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'splits':>10} {'total (s)':>10} {'per split (us)':>15}")
+
+    for num_splits in (10_000, 50_000, 200_000, 1_000_000):
+        elapsed = run(num_splits)
+        print(f"{num_splits:>10} {elapsed:>10.3f} {elapsed / num_splits * 1e6:>15.2f}")
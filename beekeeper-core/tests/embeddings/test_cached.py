@@ -0,0 +1,71 @@
+from typing import List
+
+from beekeeper.core.document import Document
+from beekeeper.core.embeddings import BaseEmbedding, CachedEmbedding
+from beekeeper.core.embeddings.base import Embedding
+
+
+class CountingEmbedding(BaseEmbedding):
+    model_name = "counting"
+
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    def get_text_embedding(self, query: str) -> Embedding:
+        return self.get_texts_embedding([query])[0]
+
+    def get_texts_embedding(self, texts: List[str]) -> List[Embedding]:
+        self.calls.append(texts)
+        # float64 values that are not exactly representable as float32
+        return [[len(text) / 3, 0.1, 1 / 7] for text in texts]
+
+    def get_documents_embedding(self, documents: List[Document]) -> List[Document]:
+        return documents
+
+
+def test_hit_and_miss_return_the_same_vector():
+    embedding = CachedEmbedding(CountingEmbedding())
+
+    miss = embedding.get_text_embedding("beekeeper")
+    hit = embedding.get_text_embedding("beekeeper")
+
+    assert (embedding.hits, embedding.misses) == (1, 1)
+    assert hit == miss
+
+
+def test_only_misses_are_sent_to_the_model():
+    model = CountingEmbedding()
+    embedding = CachedEmbedding(model)
+
+    embedding.get_texts_embedding(["a", "b"])
+    vectors = embedding.get_texts_embedding(["a", "c", "c"])
+
+    assert model.calls == [["a", "b"], ["c"]]
+    assert vectors[1] == vectors[2]
+
+
+def test_persistent_cache(tmp_path):
+    path = str(tmp_path / "embeddings.db")
+
+    first = CachedEmbedding(CountingEmbedding(), path=path)
+    vector = first.get_text_embedding("beekeeper")
+    first.close()
+
+    model = CountingEmbedding()
+    second = CachedEmbedding(model, path=path)
+
+    assert second.get_text_embedding("beekeeper") == vector
+    assert model.calls == []
+
+
+def test_max_entries_evicts_least_recently_used():
+    model = CountingEmbedding()
+    embedding = CachedEmbedding(model, max_entries=2)
+
+    embedding.get_texts_embedding(["a", "b"])
+    embedding.get_text_embedding("a")
+    embedding.get_text_embedding("c")
+
+    assert len(embedding) == 2
+    embedding.get_texts_embedding(["a", "c"])
+    assert model.calls[-1] == ["c"]
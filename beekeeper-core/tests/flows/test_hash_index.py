@@ -0,0 +1,50 @@
+from beekeeper.core.flows.hash_index import HashIndex
+
+
+class HashesVectorStore:
+    def get_all_document_hashes(self):
+        return ["a", "b", "c"], ["h1", "h2", "h3"], ["r1", None, "r1"]
+
+
+def test_keys_by_ref_hash_when_available():
+    index = HashIndex.from_vector_store(HashesVectorStore())
+
+    assert len(index) == 3
+    assert "r1" in index
+    assert "h2" in index
+    assert "h1" not in index
+
+
+def test_keys_by_own_hash():
+    index = HashIndex.from_vector_store(HashesVectorStore(), use_ref_hash=False)
+
+    assert all(hash_ in index for hash_ in ("h1", "h2", "h3"))
+    assert "r1" not in index
+
+
+def test_shared_hash_is_kept_until_last_document_is_removed():
+    index = HashIndex.from_vector_store(HashesVectorStore())
+
+    index.remove(["a"])
+    assert "r1" in index
+
+    index.remove(["c", "missing"])
+    assert "r1" not in index
+    assert len(index) == 1
+
+
+def test_add_replaces_existing_id():
+    index = HashIndex(["a"], ["h1"])
+
+    index.add("a", "h2")
+
+    assert len(index) == 1
+    assert "h1" not in index
+    assert "h2" in index
+
+
+def test_stale_ids():
+    index = HashIndex.from_vector_store(HashesVectorStore())
+
+    assert index.stale_ids({"r1"}) == ["b"]
+    assert sorted(index.stale_ids(set())) == ["a", "b", "c"]
@@ -0,0 +1,39 @@
+import threading
+
+from beekeeper.core.observers import ObserverDispatcher
+
+
+def _shutdown_returns(dispatcher: ObserverDispatcher, timeout: float) -> bool:
+    thread = threading.Thread(target=dispatcher.shutdown, args=(timeout,), daemon=True)
+    thread.start()
+    thread.join(timeout + 2)
+
+    return not thread.is_alive()
+
+
+def test_runs_callbacks():
+    dispatcher = ObserverDispatcher()
+    results = []
+
+    for i in range(10):
+        assert dispatcher.submit(lambda i=i: results.append(i))
+
+    assert dispatcher.shutdown(5)
+    assert sorted(results) == list(range(10))
+    assert dispatcher.processed == 10
+
+
+def test_shutdown_twice_with_small_queue():
+    dispatcher = ObserverDispatcher(max_queue_size=1, workers=2)
+    dispatcher.submit(lambda: None)
+
+    assert _shutdown_returns(dispatcher, 1)
+    assert _shutdown_returns(dispatcher, 1)
+
+
+def test_submit_after_shutdown_is_dropped():
+    dispatcher = ObserverDispatcher()
+    dispatcher.shutdown(1)
+
+    assert not dispatcher.submit(lambda: None)
+    assert dispatcher.dropped == 1
@@ -0,0 +1,104 @@
+import random
+import re
+
+import pytest
+from beekeeper.core.prompts.utils import extract_template_vars
+
+
+def legacy_extract_template_vars(template_str: str, input_text: str):
+    """`extract_template_vars` before literal search, kept as the reference output."""
+    parts = re.split(r"({.*?})", template_str)
+
+    regex_pattern = ""
+    template_vars = []
+
+    for part in parts:
+        if part.startswith("{") and part.endswith("}"):
+            template_var = part[1:-1].strip()
+            template_vars.append(template_var)
+            regex_pattern += r"(.*?)"
+        else:
+            escaped = re.escape(part)
+            escaped = re.sub(r"\\[ \t\r\n]+", r"\\s*", escaped)
+            regex_pattern += escaped
+
+    regex_pattern += r"\s*"
+
+    pattern = re.compile(regex_pattern, re.DOTALL)
+    match = pattern.fullmatch(input_text)
+
+    if not match:
+        return {}
+
+    groups = match.groups()
+    return dict(zip(template_vars, [g.strip() for g in groups]))
+
+
+@pytest.mark.parametrize(
+    ("template_str", "input_text"),
+    [
+        # Typical RAG prompt, with fuzzy whitespace
+        (
+            "Context:\n{context}\n\nQuestion: {question}\nAnswer:",
+            "Context:\nBees make honey.\nHives hold bees.\n\nQuestion:  What do bees make?\n  Answer:  ",
+        ),
+        # Repeated variable, the last value wins
+        ("{a} and {a}", "first and second"),
+        # Adjacent variables
+        ("{a}{b}", "value"),
+        ("<{a}{b}>", "<ab>"),
+        # Empty values
+        ("Q: {q} A: {a}", "Q:  A: "),
+        ("{a}", ""),
+        # Literal repeated inside values
+        ("{a}-{b}-{c}", "1-2-3-4"),
+        ("{a}:{b}!", "x:y:z!!"),
+        # No variables
+        ("plain text", "plain text"),
+        # Mismatches
+        ("Question: {q}\nAnswer:", "Question: what?"),
+        ("start {a} end", "prefix start value end"),
+        ("{a} end", "value end and more"),
+    ],
+)
+def test_matches_legacy(template_str, input_text):
+    assert extract_template_vars(template_str, input_text) == (
+        legacy_extract_template_vars(template_str, input_text)
+    )
+
+
+def test_random_templates_match_legacy():
+    rng = random.Random(0)
+    alphabet = ["a", "b", "-", ":", " ", "\n", "\t"]
+
+    def text(max_len: int) -> str:
+        return "".join(rng.choices(alphabet, k=rng.randint(0, max_len)))
+
+    for _ in range(5000):
+        num_vars = rng.randint(0, 3)
+        template_str = text(4)
+        values = []
+        for i in range(num_vars):
+            template_str += "{" + rng.choice(["x", "y", f"v{i}"]) + "}" + text(4)
+            values.append(text(6))
+
+        # Render the template, then sometimes perturb the input
+        input_text = re.sub(r"{.*?}", lambda _: values.pop(0), template_str)
+        if rng.random() < 0.3:
+            input_text = text(3) + input_text + text(3)
+
+        assert extract_template_vars(template_str, input_text) == (
+            legacy_extract_template_vars(template_str, input_text)
+        ), (template_str, input_text)
+
+
+def test_multi_kb_context():
+    context = "Bees collect nectar. " * 2000
+    template_str = "Context:\n{context}\n\nQuestion: {question}\nAnswer:"
+    input_text = f"Context:\n{context}\n\nQuestion: Why?\nAnswer:"
+
+    assert extract_template_vars(template_str, input_text) == {
+        "context": context.strip(),
+        "question": "Why?",
+    }
+    assert extract_template_vars(template_str, input_text[:-1]) == {}
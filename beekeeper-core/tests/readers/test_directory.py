@@ -0,0 +1,59 @@
+from typing import List
+
+import pytest
+from beekeeper.core.document import Document
+from beekeeper.core.flows import IngestionFlow
+from beekeeper.core.readers import BaseReader, DirectoryReader
+
+loaded_files = []
+
+
+class TextReader(BaseReader):
+    def load_data(self, input_file: str) -> List[Document]:
+        loaded_files.append(input_file)
+        with open(input_file, encoding="utf-8") as f:
+            return [Document(text=f.read())]
+
+
+@pytest.fixture
+def reader(tmp_path):
+    loaded_files.clear()
+    for i in range(5):
+        (tmp_path / f"{i}.txt").write_text(f"document {i}", encoding="utf-8")
+
+    return DirectoryReader(
+        input_dir=str(tmp_path),
+        required_exts=[".txt"],
+        file_loader={".txt": TextReader},
+    )
+
+
+def test_lazy_load_reads_one_file_at_a_time(reader):
+    documents = reader.lazy_load()
+
+    next(documents)
+    assert len(loaded_files) == 1
+
+    assert len(list(documents)) == 4
+    assert len(loaded_files) == 5
+
+
+def test_load_data_matches_lazy_load(reader, tmp_path):
+    texts = sorted(doc.text for doc in reader.load_data(str(tmp_path)))
+
+    assert texts == [f"document {i}" for i in range(5)]
+
+
+def test_invalid_directory():
+    with pytest.raises(ValueError):
+        DirectoryReader(input_dir="/does/not/exist").load_data()
+
+
+def test_run_stream_reads_lazily(reader):
+    flow = IngestionFlow(transformers=[], readers=[reader])
+    batches = flow.run_stream(batch_size=2)
+
+    assert next(batches).input_documents == 2
+    assert len(loaded_files) == 2
+
+    assert [stats.input_documents for stats in batches] == [2, 1]
@@ -0,0 +1,140 @@
+import random
+from typing import List, Tuple
+
+import pytest
+from beekeeper.core.text_chunkers import TokenTextChunker
+from beekeeper.core.text_chunkers import token as token_module
+from beekeeper.core.text_chunkers.utils import merge_splits
+
+
+def legacy_merge_splits(
+    splits: List[dict], chunk_size: int, chunk_overlap: int
+) -> List[str]:
+    """`merge_splits` before it was made linear, kept as the reference output."""
+    chunks: List[str] = []
+    cur_chunk: List[Tuple[str, int]] = []
+    cur_chunk_len = 0
+    last_chunk: List[Tuple[str, int]] = []
+    new_chunk = True
+
+    def close_chunk() -> None:
+        nonlocal chunks, cur_chunk, last_chunk, cur_chunk_len, new_chunk
+
+        chunks.append("".join([text for text, length in cur_chunk]))
+        last_chunk = cur_chunk
+        cur_chunk = []
+        cur_chunk_len = 0
+        new_chunk = True
+
+        if len(last_chunk) > 0:
+            last_index = len(last_chunk) - 1
+            while (
+                last_index >= 0
+                and cur_chunk_len + last_chunk[last_index][1] <= chunk_overlap
+            ):
+                text, length = last_chunk[last_index]
+                cur_chunk_len += length
+                cur_chunk.insert(0, (text, length))
+                last_index -= 1
+
+    while len(splits) > 0:
+        cur_split = splits[0]
+
+        if cur_split["token_size"] > chunk_size:
+            raise ValueError("Got a split size that exceeded chunk size")
+
+        if cur_chunk_len + cur_split["token_size"] > chunk_size and not new_chunk:
+            close_chunk()
+        else:
+            if (
+                cur_split["is_sentence"]
+                or cur_chunk_len + cur_split["token_size"] <= chunk_size
+                or new_chunk
+            ):
+                cur_chunk_len += cur_split["token_size"]
+                cur_chunk.append((cur_split["text"], cur_split["token_size"]))
+                splits.pop(0)
+                new_chunk = False
+            else:
+                close_chunk()
+
+    if not new_chunk:
+        chunk = "".join([text for text, length in cur_chunk])
+        chunks.append(chunk)
+
+    return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+
+def fake_token_count(text: str, encoding_name: str = "") -> int:
+    # Deterministic stand-in for `tiktoken`, about 4 bytes per token
+    return -(-len(text.encode("utf-8")) // 4)
+
+
+def fixed_corpus() -> List[str]:
+    """Seeded corpus mixing paragraphs, long sentences and runs without separators."""
+    rng = random.Random(0)
+    words = ["bee", "hive", "honey", "wax", "queen", "drone", "pollen", "nectar"]
+
+    def sentence(min_words: int, max_words: int) -> str:
+        return " ".join(rng.choices(words, k=rng.randint(min_words, max_words))) + "."
+
+    texts = []
+    for _ in range(30):
+        paragraphs = [
+            " ".join(sentence(3, 40) for _ in range(rng.randint(1, 8)))
+            for _ in range(rng.randint(1, 12))
+        ]
+        if rng.random() < 0.3:
+            # Minified-like content falls back to character splits
+            paragraphs.append("".join(rng.choices("abcdef0123456789", k=5000)))
+        texts.append("\n\n".join(paragraphs))
+
+    return texts
+
+
+@pytest.mark.parametrize(
+    ("chunk_size", "chunk_overlap"), [(32, 0), (64, 16), (128, 64), (512, 256)]
+)
+def test_fixed_corpus_matches_legacy(monkeypatch, chunk_size, chunk_overlap):
+    monkeypatch.setattr(token_module, "token_count", fake_token_count)
+    chunker = TokenTextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+    for text in fixed_corpus():
+        splits = chunker._split(text)
+
+        assert merge_splits(splits, chunk_size, chunk_overlap) == legacy_merge_splits(
+            list(splits), chunk_size, chunk_overlap
+        )
+
+
+def test_random_splits_match_legacy():
+    rng = random.Random(1)
+
+    for _ in range(500):
+        chunk_size = rng.randint(1, 40)
+        chunk_overlap = rng.randint(0, chunk_size)
+        splits = [
+            {
+                "text": rng.choice(["a", "b ", " ", "\n", "cd"]),
+                "is_sentence": rng.random() < 0.5,
+                "token_size": rng.randint(0, chunk_size),
+            }
+            for _ in range(rng.randint(0, 60))
+        ]
+
+        assert merge_splits(splits, chunk_size, chunk_overlap) == legacy_merge_splits(
+            list(splits), chunk_size, chunk_overlap
+        )
+
+
+def test_splits_are_not_consumed():
+    splits = [{"text": "a", "is_sentence": False, "token_size": 1}] * 3
+
+    merge_splits(splits, 2, 0)
+
+    assert len(splits) == 3
+
+
+def test_oversized_split_raises():
+    with pytest.raises(ValueError):
+        merge_splits([{"text": "a", "is_sentence": False, "token_size": 3}], 2, 0)
@@ -0,0 +1,133 @@
+from typing import Dict, List
+
+import numpy as np
+import pytest
+from beekeeper.core.document import Document
+from beekeeper.core.embeddings import BaseEmbedding, Embedding
+from beekeeper.core.vector_stores import NumpyVectorStore
+from beekeeper.core.vector_stores.quantization import (
+    BaseQuantizer,
+    ProductQuantizer,
+    ScalarQuantizer,
+)
+
+NUM_ROWS, DIM, NUM_QUERIES, TOP_K = 4000, 32, 50, 10
+
+QUANTIZERS = {
+    "scalar": lambda: ScalarQuantizer(train_size=NUM_ROWS, rerank_pool=50),
+    "product": lambda: ProductQuantizer(
+        subvector_dim=4, train_size=NUM_ROWS, n_iter=10, rerank_pool=50
+    ),
+}
+# Minimum mean recall@10 of the quantized candidates (pool of 20) and of the vector store
+# search (pool of 50, re-scored exactly), with a margin below the measured values
+MIN_CANDIDATES_RECALL = {"scalar": 0.9, "product": 0.55}
+MIN_SEARCH_RECALL = {"scalar": 0.95, "product": 0.85}
+# The metric a vector store sets for each distance strategy
+METRICS = {"cosine": "ip", "ip": "ip", "l2": "l2"}
+
+
+def clustered_data():
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(50, DIM))
+    rows = centers[rng.integers(0, len(centers), NUM_ROWS)]
+    rows += 0.5 * rng.normal(size=rows.shape)
+    queries = rows[rng.integers(0, NUM_ROWS, NUM_QUERIES)]
+    queries += 0.1 * rng.normal(size=queries.shape)
+
+    # Dimensions with different ranges and offsets, as in real embeddings
+    scales, offsets = np.logspace(-1, 1, DIM), rng.normal(size=DIM)
+    rows, queries = rows * scales + offsets, queries * scales + offsets
+
+    return rows.astype(np.float32), queries.astype(np.float32)
+
+
+class LookupEmbedding(BaseEmbedding):
+    def __init__(self, embeddings: Dict[str, Embedding]) -> None:
+        self.embeddings = embeddings
+
+    def get_text_embedding(self, query: str) -> Embedding:
+        return self.embeddings[query]
+
+    def get_texts_embedding(self, texts: List[str]) -> List[Embedding]:
+        return [self.embeddings[text] for text in texts]
+
+    def get_documents_embedding(self, documents: List[Document]) -> List[Document]:
+        return documents
+
+
+def exact_top_k(rows: np.ndarray, query: np.ndarray, metric: str) -> np.ndarray:
+    if metric == "l2":
+        scores = -((rows - query) ** 2).sum(axis=1)
+    else:
+        scores = rows @ query
+
+    return np.argsort(-scores)[:TOP_K]
+
+
+def recall(expected: List, found: List) -> float:
+    return len(set(expected) & set(found)) / len(expected)
+
+
+@pytest.mark.parametrize("distance_strategy", ["cosine", "ip", "l2"])
+@pytest.mark.parametrize("quantizer_name", list(QUANTIZERS))
+def test_candidates_recall(quantizer_name, distance_strategy):
+    rows, queries = clustered_data()
+    if distance_strategy == "cosine":
+        rows /= np.linalg.norm(rows, axis=1, keepdims=True)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+    quantizer: BaseQuantizer = QUANTIZERS[quantizer_name]()
+    quantizer.metric = METRICS[distance_strategy]
+    quantizer.train(rows)
+    codes = quantizer.encode(rows)
+
+    recalls = []
+    for query in queries:
+        # Candidates the vector store would re-score exactly, with a small pool
+        candidates = np.argsort(-quantizer.score(query, codes))[: 2 * TOP_K]
+        recalls.append(
+            recall(
+                exact_top_k(rows, query, quantizer.metric).tolist(), candidates.tolist()
+            )
+        )
+
+    assert np.mean(recalls) >= MIN_CANDIDATES_RECALL[quantizer_name]
+
+
+@pytest.mark.parametrize("distance_strategy", ["cosine", "ip", "l2"])
+@pytest.mark.parametrize("quantizer_name", list(QUANTIZERS))
+def test_vector_store_recall(quantizer_name, distance_strategy):
+    rows, queries = clustered_data()
+    embed_model = LookupEmbedding(
+        {f"query-{i}": query.tolist() for i, query in enumerate(queries)}
+    )
+    documents = [
+        Document(id_=str(i), text=str(i), embedding=row.tolist())
+        for i, row in enumerate(rows)
+    ]
+
+    exact = NumpyVectorStore(embed_model, distance_strategy=distance_strategy)
+    quantized = NumpyVectorStore(
+        embed_model,
+        distance_strategy=distance_strategy,
+        quantizer=QUANTIZERS[quantizer_name](),
+    )
+    for vector_store in (exact, quantized):
+        vector_store.add_documents(documents)
+
+    assert quantized.quantizer.is_trained
+
+    recalls = []
+    for query in embed_model.embeddings:
+        expected = exact.search_documents(query, top_k=TOP_K)
+        found = quantized.search_documents(query, top_k=TOP_K)
+        recalls.append(recall([r.id_ for r in expected], [r.id_ for r in found]))
+
+        # Returned scores are exact, not approximations
+        scores = {r.id_: r.score for r in expected}
+        for result in found:
+            if result.id_ in scores:
+                assert result.score == pytest.approx(scores[result.id_], abs=1e-4)
+
+    assert np.mean(recalls) >= MIN_SEARCH_RECALL[quantizer_name]
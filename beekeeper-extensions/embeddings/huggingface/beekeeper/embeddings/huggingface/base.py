@@ -1,5 +1,6 @@
-from typing import Any, List, Literal
+from typing import Any, Iterator, List, Literal, Tuple
 
+import numpy as np
 from beekeeper.core.document import Document
 from beekeeper.core.embeddings import BaseEmbedding, Embedding
 from pydantic.v1 import BaseModel, PrivateAttr
@@ -12,6 +13,8 @@ class HuggingFaceEmbedding(BaseModel, BaseEmbedding):
     Args:
         model_name (str): Hugging Face model to be used. Defaults to `sentence-transformers/all-MiniLM-L6-v2`.
         device (str, optional): Device to run the model on. Supports `cpu` and `cuda`. Defaults to `cpu`.
+        batch_size (int, optional): Number of texts encoded per batch. Defaults to `32`.
+        show_progress_bar (bool, optional): Whether to show a progress bar while encoding. Defaults to `False`.
 
     Example:
         .. code-block:: python
@@ -23,6 +26,8 @@ class HuggingFaceEmbedding(BaseModel, BaseEmbedding):
 
     model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
     device: Literal["cpu", "cuda"] = "cpu"
+    batch_size: int = 32
+    show_progress_bar: bool = False
 
     _client: Any = PrivateAttr()
 
@@ -55,7 +60,81 @@ class HuggingFaceEmbedding(BaseModel, BaseEmbedding):
         Args:
             texts (List[str]): A list of input strings for which to compute embeddings.
         """
-        return self._client.encode(texts).tolist()
+        return self.get_texts_embedding_array(texts).tolist()
+
+    def get_texts_embedding_array(self, texts: List[str]) -> np.ndarray:
+        """
+        Compute embeddings for a list of texts as a contiguous float32 matrix.
+
+        Args:
+            texts (List[str]): A list of input strings for which to compute embeddings.
+
+        Returns:
+            np.ndarray: Matrix of shape `(len(texts), dimensions)`, rows in input order.
+        """
+        matrix = None
+
+        for indices, embeddings in self._iter_batches(texts):
+            if matrix is None:
+                matrix = np.empty((len(texts), embeddings.shape[1]), dtype=np.float32)
+            matrix[indices] = embeddings
+
+        if matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+
+        return matrix
+
+    def iter_texts_embedding(
+        self, texts: List[str]
+    ) -> Iterator[Tuple[List[int], List[Embedding]]]:
+        """
+        Compute embeddings in length-sorted batches, yielding each batch as soon as it is encoded.
+
+        Texts are bucketed by length (longest first), so each batch is padded to similar lengths,
+        which minimizes wasted computation on padding tokens. Each yielded batch carries the
+        positions of its texts in the input list to restore the original order.
+
+        Args:
+            texts (List[str]): A list of input strings for which to compute embeddings.
+
+        Yields:
+            Tuple[List[int], List[Embedding]]: Input positions and embeddings of each batch.
+
+        Example:
+            .. code-block:: python
+
+                for indices, embeddings in embedding.iter_texts_embedding(texts):
+                    ...
+        """
+        for indices, embeddings in self._iter_batches(texts):
+            yield indices, embeddings.tolist()
+
+    def _iter_batches(self, texts: List[str]) -> Iterator[Tuple[List[int], np.ndarray]]:
+        # Character length is used as a cheap proxy for token length
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        progress_bar = None
+
+        if self.show_progress_bar:
+            from tqdm.auto import tqdm
+
+            progress_bar = tqdm(total=len(texts), desc="Embedding")
+
+        for start in range(0, len(order), self.batch_size):
+            indices = order[start : start + self.batch_size]
+            embeddings = self._client.encode(
+                [texts[i] for i in indices],
+                batch_size=self.batch_size,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            )
+
+            if progress_bar is not None:
+                progress_bar.update(len(indices))
+
+            yield indices, embeddings.astype(np.float32, copy=False)
+
+        if progress_bar is not None:
+            progress_bar.close()
 
     def get_documents_embedding(self, documents: List[Document]) -> List[Document]:
         """
@@ -65,8 +144,9 @@ class HuggingFaceEmbedding(BaseModel, BaseEmbedding):
             documents (List[Document]): List of documents to compute embeddings.
         """
         texts = [document.get_content() for document in documents]
-        embeddings = self.get_texts_embedding(texts)
+        embeddings = self.get_texts_embedding_array(texts)
 
+        # Each document holds a row view into the shared embeddings matrix
         for document, embedding in zip(documents, embeddings):
             document.embedding = embedding
 
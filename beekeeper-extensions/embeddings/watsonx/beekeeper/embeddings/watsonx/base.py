@@ -1,9 +1,32 @@
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
 from typing import Any, List, Optional
 
 from beekeeper.core.document import Document
 from beekeeper.core.embeddings import BaseEmbedding, Embedding
 from pydantic.v1 import BaseModel, PrivateAttr
 
+logger = getLogger(__name__)
+
+# HTTP status codes for rate limiting and transient service errors.
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _get_retry_after(e: Exception) -> Optional[float]:
+    """Get the `Retry-After` delay (seconds) of a retryable request error."""
+    response = getattr(e, "response", None)
+
+    if getattr(response, "status_code", None) not in _RETRYABLE_STATUS_CODES:
+        return None
+
+    try:
+        return float(response.headers.get("Retry-After", 0))
+    except (AttributeError, TypeError, ValueError):
+        return 0.0
+
 
 class WatsonxEmbedding(BaseModel, BaseEmbedding):
     """
@@ -21,6 +44,10 @@ class WatsonxEmbedding(BaseModel, BaseEmbedding):
         truncate_input_tokens (str): Maximum number of input tokens accepted. Defaults to `512`
         project_id (str, optional): watsonx project_id.
         space_id (str, optional): watsonx space_id.
+        batch_size (int, optional): Maximum number of texts sent per request. Defaults to `1000`.
+        max_concurrency (int, optional): Maximum number of concurrent requests. Defaults to `8`.
+        max_retries (int, optional): Maximum number of retries of a rate-limited or failed request. Defaults to `5`.
+        retry_backoff (float, optional): Base delay (seconds) of the exponential retry backoff. Defaults to `1.0`.
 
     **Example**
 
@@ -41,6 +68,10 @@ class WatsonxEmbedding(BaseModel, BaseEmbedding):
     truncate_input_tokens: int = 512
     project_id: Optional[str] = None
     space_id: Optional[str] = None
+    batch_size: int = 1000
+    max_concurrency: int = 8
+    max_retries: int = 5
+    retry_backoff: float = 1.0
 
     _client: Any = PrivateAttr()
 
@@ -98,7 +129,71 @@ class WatsonxEmbedding(BaseModel, BaseEmbedding):
         Args:
             texts (List[str]): A list of input strings for which to compute embeddings.
         """
-        return self._client.embed_documents(texts)
+        batches = [
+            texts[i : i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+
+        if len(batches) <= 1 or self.max_concurrency <= 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(batches))
+            ) as executor:
+                results = list(executor.map(self._embed_batch, batches))
+
+        return [
+            embedding for batch_embeddings in results for embedding in batch_embeddings
+        ]
+
+    async def aget_texts_embedding(self, texts: List[str]) -> List[Embedding]:
+        """
+        Asynchronously compute embeddings for a list of texts.
+
+        Batches are dispatched concurrently, bounded by `max_concurrency`.
+
+        Args:
+            texts (List[str]): A list of input strings for which to compute embeddings.
+        """
+        # Values below 1 run batches sequentially, as in `get_texts_embedding`
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def embed_batch(batch: List[str]) -> List[Embedding]:
+            async with semaphore:
+                return await asyncio.to_thread(self._embed_batch, batch)
+
+        results = await asyncio.gather(
+            *(
+                embed_batch(texts[i : i + self.batch_size])
+                for i in range(0, len(texts), self.batch_size)
+            )
+        )
+
+        return [
+            embedding for batch_embeddings in results for embedding in batch_embeddings
+        ]
+
+    def _embed_batch(self, texts: List[str]) -> List[Embedding]:
+        """Embed a single batch, retrying with exponential backoff on rate limits."""
+        attempt = 0
+
+        while True:
+            try:
+                return self._client.embed_documents(texts)
+            except Exception as e:
+                retry_after = _get_retry_after(e)
+                if retry_after is None or attempt == self.max_retries:
+                    raise
+
+                delay = max(
+                    retry_after,
+                    self.retry_backoff * (2**attempt) * (1 + random.random()),
+                )
+                logger.warning(
+                    f"Embedding request failed ({e}), retrying in {delay:.1f}s."
+                )
+                time.sleep(delay)
+                attempt += 1
 
     def get_documents_embedding(self, documents: List[Document]) -> List[Document]:
         """
@@ -0,0 +1,132 @@
+import asyncio
+import random
+import threading
+from typing import List, Optional
+
+import pytest
+
+foundation_models = pytest.importorskip("ibm_watsonx_ai.foundation_models")
+
+from beekeeper.embeddings.watsonx import WatsonxEmbedding  # noqa: E402
+from beekeeper.embeddings.watsonx import base as watsonx_base  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        self.status_code = status_code
+        self.headers = {} if retry_after is None else {"Retry-After": retry_after}
+
+
+class FakeRequestError(Exception):
+    def __init__(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        super().__init__(f"status {status_code}")
+        self.response = FakeResponse(status_code, retry_after)
+
+
+class FakeEmbeddings:
+    """
+    Stand-in for the watsonx.ai embeddings client. Each text is embedded as its length,
+    and the responses of the first calls can be scripted as request errors.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.errors: List[FakeRequestError] = []
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        with self._lock:
+            self.calls += 1
+            error = self.errors.pop(0) if self.errors else None
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            # Shuffle completion order across concurrent batches, `time.sleep` is mocked
+            threading.Event().wait(random.uniform(0.001, 0.01))
+            if error is not None:
+                raise error
+
+            return [[float(len(text))] for text in texts]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(watsonx_base.time, "sleep", delays.append)
+
+    return delays
+
+
+@pytest.fixture
+def embedding(monkeypatch):
+    monkeypatch.setattr(foundation_models, "Embeddings", FakeEmbeddings)
+
+    return WatsonxEmbedding(
+        api_key="api_key",
+        url="http://localhost",
+        project_id="project_id",
+        batch_size=2,
+        max_concurrency=3,
+        retry_backoff=0.0,
+    )
+
+
+TEXTS = ["a" * i for i in range(1, 21)]
+EXPECTED = [[float(i)] for i in range(1, 21)]
+
+
+def test_concurrent_batches_keep_order(embedding):
+    assert embedding.get_texts_embedding(TEXTS) == EXPECTED
+    assert embedding._client.calls == 10
+    assert embedding._client.max_in_flight <= 3
+
+
+def test_async_batches_keep_order(embedding):
+    assert asyncio.run(embedding.aget_texts_embedding(TEXTS)) == EXPECTED
+    assert embedding._client.max_in_flight <= 3
+
+
+def test_retries_rate_limit_with_retry_after(embedding, sleeps):
+    embedding._client.errors = [FakeRequestError(429, retry_after="2.5")]
+
+    assert embedding.get_text_embedding("abc") == [3.0]
+    assert embedding._client.calls == 2
+    assert sleeps == [2.5]
+
+
+def test_retries_service_errors(embedding, sleeps):
+    embedding.retry_backoff = 1.0
+    embedding._client.errors = [FakeRequestError(503), FakeRequestError(503)]
+
+    assert embedding.get_text_embedding("abc") == [3.0]
+    # Exponential backoff with jitter, without `Retry-After`
+    assert 1.0 <= sleeps[0] <= 2.0
+    assert 2.0 <= sleeps[1] <= 4.0
+
+
+def test_client_errors_are_not_retried(embedding, sleeps):
+    embedding._client.errors = [FakeRequestError(400)]
+
+    with pytest.raises(FakeRequestError):
+        embedding.get_text_embedding("abc")
+
+    assert embedding._client.calls == 1
+    assert sleeps == []
+
+
+def test_gives_up_after_max_retries(embedding, sleeps):
+    embedding.max_retries = 2
+    embedding._client.errors = [FakeRequestError(429)] * 3
+
+    with pytest.raises(FakeRequestError):
+        embedding.get_text_embedding("abc")
+
+    assert embedding._client.calls == 3
+    assert len(sleeps) == 2
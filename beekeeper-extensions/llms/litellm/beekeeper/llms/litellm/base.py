@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 from beekeeper.core.llms import BaseLLM, ChatMessage, ChatResponse, GenerateResponse
 from beekeeper.core.llms.decorators import llm_chat_observer
@@ -24,6 +24,7 @@ class LiteLLM(BaseLLM):
             to the LLM during completion. This allows customization of the request beyond
             the standard parameters.
         callback_manager: (ModelMonitor, optional): The callback manager is used for observability.
+        cache (BaseLLMCache, optional): Response cache used by completion requests.
     """
 
     model: str
@@ -48,6 +49,71 @@ class LiteLLM(BaseLLM):
             "api_key": self.api_key,  # always enforced from class
         }
 
+    def _to_generate_response(self, response: Any) -> GenerateResponse:
+        response = response.model_dump(exclude_none=True)
+
+        return GenerateResponse(
+            text=response["choices"][0]["text"],
+            raw=response,
+        )
+
+    def _to_chat_response(self, response: Any) -> ChatResponse:
+        response = response.model_dump(exclude_none=True)
+        message_dict = response["choices"][0]["message"]
+
+        return ChatResponse(
+            message=ChatMessage(
+                role=message_dict.get("role"), content=message_dict.get("content", None)
+            ),
+            raw=response,
+        )
+
+    def _get_stream_kwargs(self, **kwargs: Any) -> Dict[str, Any]:
+        all_kwargs = self._get_all_kwargs(**kwargs)
+        all_kwargs["stream"] = True
+
+        # Request usage in the last chunk where supported, some providers reject `stream_options`.
+        # Otherwise `stream_chunk_builder` estimates the usage.
+        if "stream_options" not in all_kwargs and self._supports_stream_options():
+            all_kwargs["stream_options"] = {"include_usage": True}
+
+        return all_kwargs
+
+    def _supports_stream_options(self) -> bool:
+        try:
+            supported_params = litellm.get_supported_openai_params(model=self.model)
+        except Exception:
+            # Unknown model or provider
+            return False
+
+        return "stream_options" in (supported_params or [])
+
+    def _to_chat_response_delta(
+        self, chunk: Any, content: str
+    ) -> Tuple[str, Optional[ChatResponse]]:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            return content, None
+
+        content += delta
+        return content, ChatResponse(
+            message=ChatMessage(role="assistant", content=content),
+            delta=delta,
+        )
+
+    def _to_final_chat_response(
+        self, chunks: List[Any], messages: List[dict]
+    ) -> Optional[ChatResponse]:
+        """Return the full response of a stream, or `None` if the stream was empty."""
+        full_response = litellm.stream_chunk_builder(chunks, messages=messages)
+        if full_response is None:
+            return None
+
+        response = self._to_chat_response(full_response)
+        response.delta = ""
+
+        return response
+
     def completion(self, prompt: str, **kwargs: Any) -> GenerateResponse:
         """
         Generates a chat completion for LLM. Using OpenAI's standard endpoint (/completions).
@@ -58,15 +124,21 @@ class LiteLLM(BaseLLM):
         """
         all_kwargs = self._get_all_kwargs(**kwargs)
 
-        response = litellm.text_completion(prompt=prompt, **all_kwargs).model_dump(
-            exclude_none=True
-        )
+        cache_key = self._get_cache_key(all_kwargs, prompt=prompt)
+        if (
+            cached := self._get_cached_response(cache_key, GenerateResponse)
+        ) is not None:
+            return cached
 
-        return GenerateResponse(
-            text=response["choices"][0]["text"],
-            raw=response,
+        response = self._to_generate_response(
+            litellm.text_completion(prompt=prompt, **all_kwargs)
         )
 
+        if cache_key:
+            self.cache.update(cache_key, response.model_dump())
+
+        return response
+
     def text_completion(self, prompt: str, **kwargs: Any) -> str:
         """
         Generates a chat completion for LLM. Using OpenAI's standard endpoint (/completions).
@@ -75,20 +147,115 @@ class LiteLLM(BaseLLM):
             prompt (str): The input prompt to generate a completion for.
             **kwargs (Any): Additional keyword arguments to customize the LLM completion request.
         """
+        return self.completion(prompt, **kwargs).text
+
+    @llm_chat_observer()
+    def chat_completion(
+        self, messages: List[ChatMessage], **kwargs: Any
+    ) -> ChatResponse:
+        """
+        Generates a chat completion for LLM. Using OpenAI's standard endpoint (/chat/completions).
+
+        Args:
+            messages (List[ChatMessage]): A list of chat messages as input for the LLM.
+            **kwargs (Any): Additional keyword arguments to customize the LLM completion request.
+        """
         all_kwargs = self._get_all_kwargs(**kwargs)
+        input_messages_dict = self.convert_chat_messages(messages)
 
-        response = litellm.text_completion(prompt=prompt, **all_kwargs).model_dump(
-            exclude_none=True
+        cache_key = self._get_cache_key(all_kwargs, messages=input_messages_dict)
+        if (cached := self._get_cached_response(cache_key, ChatResponse)) is not None:
+            return cached
+
+        response = self._to_chat_response(
+            litellm.completion(messages=input_messages_dict, **all_kwargs)
         )
 
-        return response["choices"][0]["text"]
+        if cache_key:
+            self.cache.update(cache_key, response.model_dump())
+
+        return response
 
     @llm_chat_observer()
-    def chat_completion(
+    def stream_chat_completion(
+        self, messages: List[ChatMessage], **kwargs: Any
+    ) -> Iterator[ChatResponse]:
+        """
+        Generates a streamed chat completion for LLM. Using OpenAI's standard endpoint (/chat/completions).
+
+        Yields a `ChatResponse` per received delta, with the content generated so far in `message`
+        and the new content in `delta`. Once a non-empty stream completes, a final `ChatResponse` with
+        an empty `delta` and the full response (including usage) in `raw` is yielded.
+
+        Args:
+            messages (List[ChatMessage]): A list of chat messages as input for the LLM.
+            **kwargs (Any): Additional keyword arguments to customize the LLM completion request.
+
+        Example:
+            .. code-block:: python
+
+                for response in llm.stream_chat_completion(messages):
+                    print(response.delta, end="")
+        """
+        all_kwargs = self._get_stream_kwargs(**kwargs)
+        input_messages_dict = self.convert_chat_messages(messages)
+
+        chunks = []
+        content = ""
+
+        for chunk in litellm.completion(messages=input_messages_dict, **all_kwargs):
+            chunks.append(chunk)
+            content, response = self._to_chat_response_delta(chunk, content)
+            if response is not None:
+                yield response
+
+        response = self._to_final_chat_response(chunks, input_messages_dict)
+        if response is not None:
+            yield response
+
+    async def acompletion(self, prompt: str, **kwargs: Any) -> GenerateResponse:
+        """
+        Asynchronously generates a completion for LLM. Using OpenAI's standard endpoint (/completions).
+
+        Args:
+            prompt (str): The input prompt to generate a completion for.
+            **kwargs (Any): Additional keyword arguments to customize the LLM completion request.
+        """
+        all_kwargs = self._get_all_kwargs(**kwargs)
+
+        cache_key = self._get_cache_key(all_kwargs, prompt=prompt)
+        if (
+            cached := self._get_cached_response(cache_key, GenerateResponse)
+        ) is not None:
+            return cached
+
+        response = self._to_generate_response(
+            await litellm.atext_completion(prompt=prompt, **all_kwargs)
+        )
+
+        if cache_key:
+            self.cache.update(cache_key, response.model_dump())
+
+        return response
+
+    async def atext_completion(self, prompt: str, **kwargs: Any) -> str:
+        """
+        Asynchronously generates a text completion for LLM. Using OpenAI's standard endpoint (/completions).
+
+        Args:
+            prompt (str): The input prompt to generate a completion for.
+            **kwargs (Any): Additional keyword arguments to customize the LLM completion request.
+        """
+        response = await self.acompletion(prompt, **kwargs)
+
+        return response.text
+
+    @llm_chat_observer()
+    async def achat_completion(
         self, messages: List[ChatMessage], **kwargs: Any
     ) -> ChatResponse:
         """
-        Generates a chat completion for LLM. Using OpenAI's standard endpoint (/chat/completions).
+        Asynchronously generates a chat completion for LLM. Using OpenAI's standard endpoint (/chat/completions).
 
         Args:
             messages (List[ChatMessage]): A list of chat messages as input for the LLM.
@@ -97,14 +264,50 @@ class LiteLLM(BaseLLM):
         all_kwargs = self._get_all_kwargs(**kwargs)
         input_messages_dict = self.convert_chat_messages(messages)
 
-        response = litellm.completion(
-            messages=input_messages_dict, **all_kwargs
-        ).model_dump(exclude_none=True)
-        message_dict = response["choices"][0]["message"]
+        cache_key = self._get_cache_key(all_kwargs, messages=input_messages_dict)
+        if (cached := self._get_cached_response(cache_key, ChatResponse)) is not None:
+            return cached
 
-        return ChatResponse(
-            message=ChatMessage(
-                role=message_dict.get("role"), content=message_dict.get("content", None)
-            ),
-            raw=response,
+        response = self._to_chat_response(
+            await litellm.acompletion(messages=input_messages_dict, **all_kwargs)
         )
+
+        if cache_key:
+            self.cache.update(cache_key, response.model_dump())
+
+        return response
+
+    @llm_chat_observer()
+    async def astream_chat_completion(
+        self, messages: List[ChatMessage], **kwargs: Any
+    ) -> AsyncIterator[ChatResponse]:
+        """
+        Asynchronously generates a streamed chat completion for LLM. Using OpenAI's standard endpoint (/chat/completions).
+
+        Args:
+            messages (List[ChatMessage]): A list of chat messages as input for the LLM.
+            **kwargs (Any): Additional keyword arguments to customize the LLM completion request.
+
+        Example:
+            .. code-block:: python
+
+                async for response in llm.astream_chat_completion(messages):
+                    print(response.delta, end="")
+        """
+        all_kwargs = self._get_stream_kwargs(**kwargs)
+        input_messages_dict = self.convert_chat_messages(messages)
+
+        chunks = []
+        content = ""
+
+        async for chunk in await litellm.acompletion(
+            messages=input_messages_dict, **all_kwargs
+        ):
+            chunks.append(chunk)
+            content, response = self._to_chat_response_delta(chunk, content)
+            if response is not None:
+                yield response
+
+        response = self._to_final_chat_response(chunks, input_messages_dict)
+        if response is not None:
+            yield response
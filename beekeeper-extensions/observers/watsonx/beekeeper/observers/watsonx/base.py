@@ -1,13 +1,17 @@
+import atexit
 import datetime
 import json
 import logging
 import os
+import threading
 import uuid
 import warnings
-from typing import Any, Dict, List, Literal, Optional, Union
+import weakref
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 import certifi
-from beekeeper.core.observers import ModelObserver
+from beekeeper.core.observers import ModelObserver, get_observer_dispatcher
 from beekeeper.core.observers.types import PayloadRecord
 from beekeeper.core.prompts.utils import extract_template_vars
 from pydantic.v1 import BaseModel
@@ -92,6 +96,118 @@ def _convert_payload_format(
     return payload_data
 
 
+class _PayloadBuffer:
+    """
+    Buffers payload records per subscription and stores them in batches, once `batch_size`
+    records are pending or `flush_interval` seconds after the first pending record.
+
+    Args:
+        store_fn (Callable): Function storing a batch of records for a subscription.
+        batch_size (int): Number of pending records that triggers a flush.
+        flush_interval (float, optional): Maximum time a record stays pending, in seconds.
+    """
+
+    def __init__(
+        self,
+        store_fn: Callable[[List[Dict], str], Any],
+        batch_size: int,
+        flush_interval: Optional[float],
+    ) -> None:
+        self.store_fn = store_fn
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._records: Dict[str, List[Dict]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+        _payload_buffers.add(self)
+
+    def add(self, record: Dict, subscription_id: str) -> None:
+        with self._lock:
+            records = self._records[subscription_id]
+            records.append(record)
+
+            if len(records) >= self.batch_size:
+                batch = self._records.pop(subscription_id)
+            else:
+                batch = None
+                if self._timer is None and self.flush_interval:
+                    self._timer = threading.Timer(self.flush_interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if batch:
+            self._store(batch, subscription_id)
+
+    def _store(self, records: List[Dict], subscription_id: str) -> None:
+        try:
+            self.store_fn(records, subscription_id)
+        except Exception as e:
+            logging.error(f"Error storing payload records: {e}")
+
+    def flush(self) -> None:
+        with self._lock:
+            batches, self._records = self._records, defaultdict(list)
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        for subscription_id, records in batches.items():
+            self._store(records, subscription_id)
+
+
+# Live payload buffers, flushed at exit
+_payload_buffers: "weakref.WeakSet[_PayloadBuffer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_payload_buffers() -> None:
+    if not _payload_buffers:
+        return
+
+    # Payloads may still be queued on the observer dispatcher at exit
+    get_observer_dispatcher().flush(timeout=5.0)
+    for buffer in list(_payload_buffers):
+        buffer.flush()
+
+
+def _get_subscription_details(
+    wos_client: Any,
+    subscription_id: str,
+    cache: Dict[str, Tuple[List[str], str]],
+) -> Tuple[List[str], str]:
+    """Return the feature fields and payload data set ID of a subscription, fetched once per subscription."""
+    from ibm_watson_openscale.supporting_classes.enums import (
+        DataSetTypes,
+        TargetTypes,
+    )
+
+    if subscription_id not in cache:
+        subscription_details = wos_client.subscriptions.get(
+            subscription_id,
+        ).result
+        subscription_details = json.loads(str(subscription_details))
+
+        feature_fields = subscription_details["entity"]["asset_properties"][
+            "feature_fields"
+        ]
+
+        payload_data_set_id = (
+            wos_client.data_sets.list(
+                type=DataSetTypes.PAYLOAD_LOGGING,
+                target_target_id=subscription_id,
+                target_target_type=TargetTypes.SUBSCRIPTION,
+            )
+            .result.data_sets[0]
+            .metadata.id
+        )
+
+        cache[subscription_id] = (feature_fields, payload_data_set_id)
+
+    return cache[subscription_id]
+
+
 # ===== Credentials Classes =====
 class CloudPakforDataCredentials(BaseModel):
     """
@@ -244,6 +360,9 @@ class WatsonxExternalPromptObserver(ModelObserver):
             Defaults to `us-south`.
         cpd_creds (CloudPakforDataCredentials, optional): The Cloud Pak for Data environment credentials.
         subscription_id (str, optional): The subscription ID associated with the records being logged.
+        batch_size (int, optional): Number of observed payloads stored per request. Defaults to ``50``.
+        flush_interval (float, optional): Maximum time an observed payload is buffered before being stored,
+            in seconds. Defaults to ``5.0``.
 
     Example:
         .. code-block:: python
@@ -280,6 +399,8 @@ class WatsonxExternalPromptObserver(ModelObserver):
         region: Literal["us-south", "eu-de", "au-syd"] = "us-south",
         cpd_creds: CloudPakforDataCredentials | Dict = None,
         subscription_id: str = None,
+        batch_size: int = 50,
+        flush_interval: Optional[float] = 5.0,
         **kwargs,
     ) -> None:
         import ibm_aigov_facts_client  # noqa: F401
@@ -295,6 +416,12 @@ class WatsonxExternalPromptObserver(ModelObserver):
         self.subscription_id = subscription_id
         self._api_key = api_key
         self._wos_client = None
+        self._subscription_details: Dict[str, Tuple[List[str], str]] = {}
+        self._payload_buffer = _PayloadBuffer(
+            self.store_payload_records,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+        )
 
         self._container_id = space_id if space_id else project_id
         self._container_type = "space" if space_id else "project"
@@ -667,10 +794,6 @@ class WatsonxExternalPromptObserver(ModelObserver):
         """
         from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
         from ibm_watson_openscale import APIClient as WosAPIClient
-        from ibm_watson_openscale.supporting_classes.enums import (
-            DataSetTypes,
-            TargetTypes,
-        )
 
         # Expected behavior: Prefer using fn `subscription_id`.
         # Fallback to `self.subscription_id` if `subscription_id` None or empty.
@@ -711,23 +834,8 @@ class WatsonxExternalPromptObserver(ModelObserver):
                 )
                 raise
 
-        subscription_details = self._wos_client.subscriptions.get(
-            _subscription_id,
-        ).result
-        subscription_details = json.loads(str(subscription_details))
-
-        feature_fields = subscription_details["entity"]["asset_properties"][
-            "feature_fields"
-        ]
-
-        payload_data_set_id = (
-            self._wos_client.data_sets.list(
-                type=DataSetTypes.PAYLOAD_LOGGING,
-                target_target_id=_subscription_id,
-                target_target_type=TargetTypes.SUBSCRIPTION,
-            )
-            .result.data_sets[0]
-            .metadata.id
+        feature_fields, payload_data_set_id = _get_subscription_details(
+            self._wos_client, _subscription_id, self._subscription_details
         )
 
         payload_data = _convert_payload_format(request_records, feature_fields)
@@ -740,16 +848,20 @@ class WatsonxExternalPromptObserver(ModelObserver):
 
         return [data["scoring_id"] + "-1" for data in payload_data]
 
+    def flush(self) -> None:
+        """Store all buffered payload records."""
+        self._payload_buffer.flush()
+
     def __call__(self, payload: PayloadRecord) -> None:
+        template_vars = {}
         if self.prompt_template:
             template_vars = extract_template_vars(
                 self.prompt_template.template, payload.input_text
             )
 
-        if not template_vars:
-            self.store_payload_records([payload.model_dump()])
-        else:
-            self.store_payload_records([{**payload.model_dump(), **template_vars}])
+        self._payload_buffer.add(
+            {**payload.model_dump(), **template_vars}, self.subscription_id
+        )
 
 
 class WatsonxPromptObserver(ModelObserver):
@@ -768,6 +880,9 @@ class WatsonxPromptObserver(ModelObserver):
             Defaults to `us-south`.
         cpd_creds (CloudPakforDataCredentials, optional): The Cloud Pak for Data environment credentials.
         subscription_id (str, optional): The subscription ID associated with the records being logged.
+        batch_size (int, optional): Number of observed payloads stored per request. Defaults to ``50``.
+        flush_interval (float, optional): Maximum time an observed payload is buffered before being stored,
+            in seconds. Defaults to ``5.0``.
 
     Example:
         .. code-block:: python
@@ -802,6 +917,8 @@ class WatsonxPromptObserver(ModelObserver):
         region: Literal["us-south", "eu-de", "au-syd"] = "us-south",
         cpd_creds: CloudPakforDataCredentials | Dict = None,
         subscription_id: str = None,
+        batch_size: int = 50,
+        flush_interval: Optional[float] = 5.0,
         **kwargs,
     ) -> None:
         import ibm_aigov_facts_client  # noqa: F401
@@ -817,6 +934,12 @@ class WatsonxPromptObserver(ModelObserver):
         self.subscription_id = subscription_id
         self._api_key = api_key
         self._wos_client = None
+        self._subscription_details: Dict[str, Tuple[List[str], str]] = {}
+        self._payload_buffer = _PayloadBuffer(
+            self.store_payload_records,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+        )
 
         self._container_id = space_id if space_id else project_id
         self._container_type = "space" if space_id else "project"
@@ -1155,10 +1278,6 @@ class WatsonxPromptObserver(ModelObserver):
         """
         from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
         from ibm_watson_openscale import APIClient as WosAPIClient
-        from ibm_watson_openscale.supporting_classes.enums import (
-            DataSetTypes,
-            TargetTypes,
-        )
 
         # Expected behavior: Prefer using fn `subscription_id`.
         # Fallback to `self.subscription_id` if `subscription_id` None or empty.
@@ -1200,23 +1319,8 @@ class WatsonxPromptObserver(ModelObserver):
                 )
                 raise
 
-        subscription_details = self._wos_client.subscriptions.get(
-            _subscription_id,
-        ).result
-        subscription_details = json.loads(str(subscription_details))
-
-        feature_fields = subscription_details["entity"]["asset_properties"][
-            "feature_fields"
-        ]
-
-        payload_data_set_id = (
-            self._wos_client.data_sets.list(
-                type=DataSetTypes.PAYLOAD_LOGGING,
-                target_target_id=_subscription_id,
-                target_target_type=TargetTypes.SUBSCRIPTION,
-            )
-            .result.data_sets[0]
-            .metadata.id
+        feature_fields, payload_data_set_id = _get_subscription_details(
+            self._wos_client, _subscription_id, self._subscription_details
         )
 
         payload_data = _convert_payload_format(request_records, feature_fields)
@@ -1229,16 +1333,20 @@ class WatsonxPromptObserver(ModelObserver):
 
         return [data["scoring_id"] + "-1" for data in payload_data]
 
+    def flush(self) -> None:
+        """Store all buffered payload records."""
+        self._payload_buffer.flush()
+
     def __call__(self, payload: PayloadRecord) -> None:
+        template_vars = {}
         if self.prompt_template:
             template_vars = extract_template_vars(
                 self.prompt_template.template, payload.input_text
             )
 
-        if not template_vars:
-            self.store_payload_records([payload.model_dump()])
-        else:
-            self.store_payload_records([{**payload.model_dump(), **template_vars}])
+        self._payload_buffer.add(
+            {**payload.model_dump(), **template_vars}, self.subscription_id
+        )
 
 
 # ===== Supporting Classes =====
@@ -1,13 +1,29 @@
 import uuid
 from logging import getLogger
-from typing import List, Literal
+from typing import List, Literal, Optional, Union
 
 from beekeeper.core.document import Document, DocumentWithScore
 from beekeeper.core.embeddings import BaseEmbedding
-from beekeeper.core.vector_stores import BaseVectorStore
+from beekeeper.core.vector_stores import (
+    BaseVectorStore,
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+)
 
 logger = getLogger(__name__)
 
+_CHROMA_OPERATORS = {
+    FilterOperator.EQ: "$eq",
+    FilterOperator.NE: "$ne",
+    FilterOperator.GT: "$gt",
+    FilterOperator.GTE: "$gte",
+    FilterOperator.LT: "$lt",
+    FilterOperator.LTE: "$lte",
+    FilterOperator.IN: "$in",
+    FilterOperator.NIN: "$nin",
+}
+
 
 class ChromaVectorStore(BaseVectorStore):
     """
@@ -70,7 +86,7 @@ class ChromaVectorStore(BaseVectorStore):
 
             embeddings.append(
                 doc.embedding
-                if doc.embedding
+                if doc.embedding is not None
                 else self._embed_model.get_text_embedding(doc.get_content()),
             )
             ids.append(doc.id_ if doc.id_ else str(uuid.uuid4()))
@@ -85,13 +101,21 @@ class ChromaVectorStore(BaseVectorStore):
 
         return ids
 
-    def search_documents(self, query: str, top_k: int = 4) -> List[DocumentWithScore]:
+    def search_documents(
+        self,
+        query: str,
+        top_k: int = 4,
+        filters: Optional[MetadataFilters] = None,
+    ) -> List[DocumentWithScore]:
         """
         Performs a similarity search for the top-k most similar documents.
 
         Args:
             query (str): Query text.
             top_k (int, optional): Number of top results to return. Defaults to `4`.
+            filters (MetadataFilters, optional): Metadata filters documents must match.
+                Chroma `where` clauses cannot test whether a key is set, so unlike other vector
+                stores, `NE` and `NIN` filters may also match documents without the key.
 
         Returns:
             List[DocumentWithScore]: List of the most similar documents.
@@ -101,6 +125,7 @@ class ChromaVectorStore(BaseVectorStore):
         results = self._collection.query(
             query_embeddings=query_embedding,
             n_results=top_k,
+            where=self._to_chroma_where(filters) if filters is not None else None,
         )
 
         return [
@@ -116,6 +141,23 @@ class ChromaVectorStore(BaseVectorStore):
             )
         ]
 
+    def _to_chroma_where(
+        self, filters: Union[MetadataFilter, MetadataFilters]
+    ) -> Optional[dict]:
+        """
+        Translates metadata filters into a Chroma `where` clause. `NE` and `NIN` map to `$ne`
+        and `$nin` without a key-presence guard, which Chroma has no operator for.
+        """
+        if isinstance(filters, MetadataFilters):
+            clauses = [self._to_chroma_where(f) for f in filters.filters]
+            clauses = [clause for clause in clauses if clause is not None]
+            # Chroma requires at least two clauses in `$and` and `$or`
+            if len(clauses) < 2:
+                return clauses[0] if clauses else None
+            return {f"${filters.condition.value}": clauses}
+
+        return {filters.key: {_CHROMA_OPERATORS[filters.operator]: filters.value}}
+
     def delete_documents(self, ids: List[str]) -> None:
         """
         Delete documents from the ChromaDB collection.
@@ -1,10 +1,16 @@
 import uuid
 from logging import getLogger
-from typing import List, Literal
+from typing import List, Literal, Optional, Union
 
 from beekeeper.core.document import Document, DocumentWithScore
 from beekeeper.core.embeddings import BaseEmbedding
-from beekeeper.core.vector_stores import BaseVectorStore
+from beekeeper.core.vector_stores import (
+    BaseVectorStore,
+    FilterCondition,
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+)
 
 logger = getLogger(__name__)
 
@@ -26,6 +32,10 @@ class ElasticsearchVectorStore(BaseVectorStore):
         text_field (str, optional): Name of the field containing text. Defaults to `text`.
         vector_field (str, optional): Name of the field containing vector embeddings. Defaults to `embedding`.
 
+    Note:
+        Async methods (e.g. `aadd_documents`, `asearch_documents`) use `AsyncElasticsearch`,
+        which requires `pip install "elasticsearch[async]"`.
+
     Example:
         .. code-block:: python
 
@@ -66,12 +76,14 @@ class ElasticsearchVectorStore(BaseVectorStore):
         self.vector_field = vector_field
         self.text_field = text_field
 
-        self._client = Elasticsearch(
-            hosts=[url],
-            basic_auth=(user, password),
-            verify_certs=ssl,
-            ssl_show_warn=False,
-        )
+        self._client_kwargs = {
+            "hosts": [url],
+            "basic_auth": (user, password),
+            "verify_certs": ssl,
+            "ssl_show_warn": False,
+        }
+        self._client = Elasticsearch(**self._client_kwargs)
+        self._async_client = None
 
         try:
             self._client.info()
@@ -79,6 +91,36 @@ class ElasticsearchVectorStore(BaseVectorStore):
             logger.error(f"Error connecting to Elasticsearch: {e}")
             raise
 
+    def _get_async_client(self):
+        """Get the `AsyncElasticsearch` client, creating it on first use."""
+        if self._async_client is None:
+            from elasticsearch import AsyncElasticsearch
+
+            self._async_client = AsyncElasticsearch(**self._client_kwargs)
+
+        return self._async_client
+
+    def _index_mappings(self, dims_length: int) -> dict:
+        return {
+            "dynamic_templates": [
+                {
+                    "dynamic_metadata": {
+                        "path_match": "metadata.*",
+                        "mapping": {"type": "keyword"},
+                    },
+                },
+            ],
+            "properties": {
+                self.text_field: {"type": "text"},
+                self.vector_field: {
+                    "type": "dense_vector",
+                    "dims": dims_length,
+                    "index": True,
+                    "similarity": self.distance_strategy,
+                },
+            },
+        }
+
     def _create_index_if_not_exists(self) -> None:
         """Creates the Elasticsearch index if it doesn't already exist."""
         if self._client.indices.exists(index=self.index_name):
@@ -88,29 +130,30 @@ class ElasticsearchVectorStore(BaseVectorStore):
             # Get embedding dims dynamically
             dims_length = len(self._embed_model.get_text_embedding("Elasticsearch"))
 
-            index_mappings = {
-                "dynamic_templates": [
-                    {
-                        "dynamic_metadata": {
-                            "path_match": "metadata.*",
-                            "mapping": {"type": "keyword"},
-                        },
-                    },
-                ],
-                "properties": {
-                    self.text_field: {"type": "text"},
-                    self.vector_field: {
-                        "type": "dense_vector",
-                        "dims": dims_length,
-                        "index": True,
-                        "similarity": self.distance_strategy,
-                    },
-                },
-            }
-
             print(f"Creating index {self.index_name}")
 
-            self._client.indices.create(index=self.index_name, mappings=index_mappings)
+            self._client.indices.create(
+                index=self.index_name, mappings=self._index_mappings(dims_length)
+            )
+
+    async def _acreate_index_if_not_exists(self) -> None:
+        """Asynchronously creates the Elasticsearch index if it doesn't already exist."""
+        client = self._get_async_client()
+
+        if await client.indices.exists(index=self.index_name):
+            logger.info(f"Index {self.index_name} already exists. Skipping creation.")
+
+        else:
+            # Get embedding dims dynamically
+            dims_length = len(
+                await self._embed_model.aget_text_embedding("Elasticsearch")
+            )
+
+            logger.info(f"Creating index {self.index_name}")
+
+            await client.indices.create(
+                index=self.index_name, mappings=self._index_mappings(dims_length)
+            )
 
     def _dynamic_metadata_mapping(self, metadata) -> dict:
         """Dynamic maps metadata object into keyword fields."""
@@ -119,6 +162,20 @@ class ElasticsearchVectorStore(BaseVectorStore):
             metadata_mapping[f"metadata.{key}"] = value
         return metadata_mapping
 
+    def _to_bulk_action(self, doc: Document, embedding: List[float]) -> dict:
+        _id = doc.id_ if doc.id_ else str(uuid.uuid4())
+        _metadata = {**doc.get_metadata(), "hash": doc.hash}
+        _metadata_mapping = self._dynamic_metadata_mapping(_metadata)
+
+        return {
+            "_index": self.index_name,
+            "_id": _id,
+            self.text_field: doc.get_content(),
+            self.vector_field: embedding,
+            "metadata": _metadata,
+            **_metadata_mapping,
+        }
+
     def add_documents(
         self,
         documents: List[Document],
@@ -135,23 +192,15 @@ class ElasticsearchVectorStore(BaseVectorStore):
         if create_index_if_not_exists:
             self._create_index_if_not_exists()
 
-        vector_store_data = []
-        for doc in documents:
-            _id = doc.id_ if doc.id_ else str(uuid.uuid4())
-            _metadata = {**doc.get_metadata(), "hash": doc.hash}
-            _metadata_mapping = self._dynamic_metadata_mapping(_metadata)
-            vector_store_data.append(
-                {
-                    "_index": self.index_name,
-                    "_id": _id,
-                    self.text_field: doc.get_content(),
-                    self.vector_field: doc.embedding
-                    if doc.embedding
-                    else self._embed_model.get_text_embedding(doc.get_content()),
-                    "metadata": _metadata,
-                    **_metadata_mapping,
-                },
+        vector_store_data = [
+            self._to_bulk_action(
+                doc,
+                doc.embedding
+                if doc.embedding is not None
+                else self._embed_model.get_text_embedding(doc.get_content()),
             )
+            for doc in documents
+        ]
 
         self._es_bulk(
             self._client,
@@ -163,35 +212,33 @@ class ElasticsearchVectorStore(BaseVectorStore):
 
         return [doc.id_ for doc in documents]
 
-    def search_documents(self, query: str, top_k: int = 4) -> List[DocumentWithScore]:
+    def search_documents(
+        self,
+        query: str,
+        top_k: int = 4,
+        filters: Optional[MetadataFilters] = None,
+    ) -> List[DocumentWithScore]:
         """
         Performs a similarity search for the top-k most similar documents.
 
         Args:
             query (str): Query text.
             top_k (int, optional): Number of top results to return. Defaults to `4`.
+            filters (MetadataFilters, optional): Metadata filters documents must match, applied
+                during the kNN search. Metadata fields are `keyword` fields, so range operators
+                compare values as strings.
 
         Returns:
             List[DocumentWithScore]: List of the most similar documents.
         """
         query_embedding = self._embed_model.get_text_embedding(query)
-        #  TO-DO: Add elasticsearch `filter` option
-        es_query = {
-            "knn": {
-                # "filter": filter,
-                "field": self.vector_field,
-                "query_vector": query_embedding,
-                "k": top_k,
-                "num_candidates": top_k * 10,
-            },
-        }
 
         from elasticsearch import NotFoundError
 
         try:
             data = self._client.search(
                 index=self.index_name,
-                **es_query,
+                **self._knn_query(query_embedding, top_k, filters),
                 size=top_k,
                 _source={"excludes": [self.vector_field]},
             )
@@ -201,6 +248,59 @@ class ElasticsearchVectorStore(BaseVectorStore):
             else:
                 raise
 
+        return self._to_documents_with_score(data)
+
+    def _knn_query(
+        self,
+        query_embedding: List[float],
+        top_k: int,
+        filters: Optional[MetadataFilters] = None,
+    ) -> dict:
+        knn = {
+            "field": self.vector_field,
+            "query_vector": query_embedding,
+            "k": top_k,
+            "num_candidates": top_k * 10,
+        }
+
+        if filters is not None:
+            knn["filter"] = self._to_es_filter(filters)
+
+        return {"knn": knn}
+
+    def _to_es_filter(self, filters: Union[MetadataFilter, MetadataFilters]) -> dict:
+        """Translates metadata filters into an Elasticsearch query."""
+        if isinstance(filters, MetadataFilters):
+            clauses = [self._to_es_filter(f) for f in filters.filters]
+            if filters.condition == FilterCondition.OR:
+                return {"bool": {"should": clauses, "minimum_should_match": 1}}
+            return {"bool": {"filter": clauses}}
+
+        field = f"metadata.{filters.key}"
+        operator = filters.operator
+
+        if operator == FilterOperator.EQ:
+            return {"term": {field: filters.value}}
+        if operator == FilterOperator.IN:
+            return {"terms": {field: filters.value}}
+        if operator in (FilterOperator.NE, FilterOperator.NIN):
+            query = "term" if operator == FilterOperator.NE else "terms"
+            return {
+                "bool": {
+                    "filter": [{"exists": {"field": field}}],
+                    "must_not": [{query: {field: filters.value}}],
+                },
+            }
+
+        range_operators = {
+            FilterOperator.GT: "gt",
+            FilterOperator.GTE: "gte",
+            FilterOperator.LT: "lt",
+            FilterOperator.LTE: "lte",
+        }
+        return {"range": {field: {range_operators[operator]: filters.value}}}
+
+    def _to_documents_with_score(self, data: dict) -> List[DocumentWithScore]:
         hits = data.get("hits", {}).get("hits", [])
 
         return [
@@ -215,6 +315,93 @@ class ElasticsearchVectorStore(BaseVectorStore):
             for hit in hits
         ]
 
+    async def aadd_documents(
+        self,
+        documents: List[Document],
+        create_index_if_not_exists: bool = True,
+    ) -> List[str]:
+        """
+        Asynchronously add documents to the Elasticsearch index.
+
+        Args:
+            documents (List[Document]): List of documents to add to the index.
+            create_index_if_not_exists (bool, optional): Whether to create the index
+                if it doesn't exist. Defaults to `True`.
+        """
+        from elasticsearch.helpers import async_bulk
+
+        if create_index_if_not_exists:
+            await self._acreate_index_if_not_exists()
+
+        # Compute missing embeddings in a single batch
+        missing_documents = [doc for doc in documents if doc.embedding is None]
+        missing_embeddings = (
+            await self._embed_model.aget_texts_embedding(
+                [doc.get_content() for doc in missing_documents]
+            )
+            if missing_documents
+            else []
+        )
+        embeddings = {
+            id(doc): embedding
+            for doc, embedding in zip(missing_documents, missing_embeddings)
+        }
+
+        vector_store_data = [
+            self._to_bulk_action(
+                doc,
+                doc.embedding if doc.embedding is not None else embeddings[id(doc)],
+            )
+            for doc in documents
+        ]
+
+        await async_bulk(
+            self._get_async_client(),
+            vector_store_data,
+            chunk_size=self.batch_size,
+            refresh=True,
+        )
+        logger.info(f"Added {len(vector_store_data)} documents to `{self.index_name}`")
+
+        return [doc.id_ for doc in documents]
+
+    async def asearch_documents(
+        self,
+        query: str,
+        top_k: int = 4,
+        filters: Optional[MetadataFilters] = None,
+    ) -> List[DocumentWithScore]:
+        """
+        Asynchronously performs a similarity search for the top-k most similar documents.
+
+        Args:
+            query (str): Query text.
+            top_k (int, optional): Number of top results to return. Defaults to `4`.
+            filters (MetadataFilters, optional): Metadata filters documents must match, applied
+                during the kNN search.
+
+        Returns:
+            List[DocumentWithScore]: List of the most similar documents.
+        """
+        query_embedding = await self._embed_model.aget_text_embedding(query)
+
+        from elasticsearch import NotFoundError
+
+        try:
+            data = await self._get_async_client().search(
+                index=self.index_name,
+                **self._knn_query(query_embedding, top_k, filters),
+                size=top_k,
+                _source={"excludes": [self.vector_field]},
+            )
+        except NotFoundError as e:
+            if e.status_code == 404 and e.error == "index_not_found_exception":
+                return []
+            else:
+                raise
+
+        return self._to_documents_with_score(data)
+
     def delete_documents(self, ids: List[str]) -> None:
         """
         Delete documents from the Elasticsearch index.
@@ -225,6 +412,18 @@ class ElasticsearchVectorStore(BaseVectorStore):
         for id in ids:
             self._client.delete(index=self.index_name, id=id)
 
+    async def adelete_documents(self, ids: List[str]) -> None:
+        """
+        Asynchronously delete documents from the Elasticsearch index.
+
+        Args:
+            ids (List[str]): List of documents IDs to delete.
+        """
+        client = self._get_async_client()
+
+        for id in ids:
+            await client.delete(index=self.index_name, id=id)
+
     def get_all_documents(self, include_fields: List[str] = []) -> List[Document]:
         """Get all documents from vector store."""
         es_query = {"query": {"match_all": {}}}